@@ -0,0 +1,108 @@
+"""Compare two benchmark result files and flag regressions.
+
+    nox -s benchmark_compare -- benchmarks/results/OLD.json NEW.json
+
+Benchmarks are matched by shape, target size and name, and compared by
+their best time. The exit code is 1 if any benchmark slowed down by more
+than the tolerance.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_TOLERANCE = 0.10
+
+Key = Tuple[str, int, str]
+
+
+def load_results(file_path: str) -> Dict[Key, Dict[str, Any]]:
+    """
+    Load a results file, keyed by shape, target size and benchmark name.
+
+    Args:
+        file_path (str): Path to a file written by run_benchmarks.
+
+    Returns:
+        Dict[Key, Dict[str, Any]]: The results by key.
+    """
+    with open(file_path, encoding="utf-8") as results_file:
+        document = json.load(results_file)
+    return {
+        (result["shape"], result["target_triangles"], result["benchmark"]): result
+        for result in document["results"]
+    }
+
+
+def compare_results(
+    baseline: Dict[Key, Dict[str, Any]],
+    candidate: Dict[Key, Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Dict[str, Any]]:
+    """
+    Compare the best times of the benchmarks found in both result sets.
+
+    Args:
+        baseline (Dict[Key, Dict[str, Any]]): The results to compare against.
+        candidate (Dict[Key, Dict[str, Any]]): The new results.
+        tolerance (float): The relative slowdown allowed before a benchmark
+            counts as a regression.
+
+    Returns:
+        List[Dict[str, Any]]: One row per shared benchmark with both times,
+            their ratio and whether it regressed.
+    """
+    rows = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before = baseline[key]["best_seconds"]
+        after = candidate[key]["best_seconds"]
+        ratio = after / before if before > 0 else float("inf")
+        rows.append(
+            {
+                "shape": key[0],
+                "target_triangles": key[1],
+                "benchmark": key[2],
+                "baseline_seconds": before,
+                "candidate_seconds": after,
+                "ratio": ratio,
+                "regressed": ratio > 1 + tolerance,
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Print a comparison table and exit with code 1 on regressions.
+
+    Args:
+        argv (Optional[List[str]]): The arguments, or None for sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="Results file to compare against.")
+    parser.add_argument("candidate", help="New results file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Relative slowdown allowed, e.g. 0.1 for 10%%.",
+    )
+    args = parser.parse_args(argv)
+
+    rows = compare_results(
+        load_results(args.baseline), load_results(args.candidate), args.tolerance
+    )
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['shape']:>9} {row['target_triangles']:>10} {row['benchmark']:<38}"
+            f" {row['baseline_seconds']:.4f} s -> {row['candidate_seconds']:.4f} s"
+            f" ({row['ratio']:.2f}x) {flag}"
+        )
+    if any(row["regressed"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,297 @@
+"""Time the thickening pipeline on synthetic meshes and save JSON results.
+
+Run through nox, optionally with arguments for this script:
+
+    nox -s benchmark -- --sizes 10000 100000 --repeat 5
+
+The default sizes stop at 1M triangles; pass --sizes with 10000000 to time
+10M triangle meshes too. The wall thickness, which builds a bounding volume
+hierarchy and casts a ray per vertex, is only measured up to 1M triangles.
+
+The start-up time of the CLI, answering --help in a fresh interpreter, is
+recorded once per run under the shape "cli" and size 0.
+
+Each benchmark is timed `repeat` times and the best and mean wall times are
+recorded, together with the commit and library versions, so results from
+different commits can be compared with benchmarks/compare.py.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.synthetic_meshes import PROFILES, generate_mesh
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
+from thicker.domain.cross_section_analysis import detect_narrow_cross_sections
+from thicker.domain.cross_section_thickening import CrossSectionThickener
+from thicker.domain.mesh import Mesh
+from thicker.domain.mesh_slicing import section_heights, slice_mesh
+from thicker.domain.parallel_transform import ParallelTransformer
+from thicker.domain.transformations import (
+    HemisphericalCylinderTransformation,
+    calculate_cylindrical_normal,
+    thicken_mesh,
+)
+from thicker.domain.vertex_normals import calculate_area_weighted_normals
+from thicker.domain.wall_thickness import measure_wall_thickness
+from thicker.use_cases.constants import BASE_HEIGHT_PERCENTAGE
+
+# Sizes up to 10M triangles are opt-in through --sizes
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_REPEAT = 3
+OFFSET = 0.5
+NARROW_THRESHOLD = 0.5
+# The number of planes the slicing benchmark cuts each mesh with
+NUM_PLANES = 100
+# The worker processes of the parallel transformation benchmark
+PARALLEL_WORKERS = os.cpu_count() or 1
+# The largest meshes, in triangles, that the slowest benchmarks are run on
+MAX_TRIANGLES = {"wall_thickness": 1_000_000}
+
+Benchmark = Callable[[], Any]
+# The pseudo-shape that mesh-independent benchmarks are recorded under
+STARTUP_SHAPE = "cli"
+
+
+def build_benchmarks(mesh: Mesh, work_dir: str) -> Dict[str, Benchmark]:
+    """
+    Prepare one callable per timed operation on a mesh.
+
+    Inputs that an operation needs, such as the STL file for the reader or
+    the narrow slices for the thickener, are made here, outside the timing.
+    Benchmarks are left out for meshes larger than their MAX_TRIANGLES.
+
+    Args:
+        mesh (Mesh): The synthetic mesh.
+        work_dir (str): A directory for the STL files.
+
+    Returns:
+        Dict[str, Benchmark]: The benchmarks, by name, in run order.
+    """
+    stl_path = os.path.join(work_dir, "input.stl")
+    output_path = os.path.join(work_dir, "output.stl")
+    STLMeshWriter.write(stl_path, mesh.vertex_array, mesh.face_array)
+    reader = STLMeshReader()
+
+    stats = mesh.stats(BASE_HEIGHT_PERCENTAGE)
+    transformation = HemisphericalCylinderTransformation(
+        stats.height - stats.radius, stats.radius
+    )
+    narrow_sections = detect_narrow_cross_sections(mesh, NARROW_THRESHOLD)
+    thickener = CrossSectionThickener(NARROW_THRESHOLD, OFFSET)
+    planes = section_heights(stats.min_corner[2], stats.max_corner[2], NUM_PLANES)
+
+    benchmarks = {
+        "reader": lambda: reader.read(stl_path),
+        "writer": lambda: STLMeshWriter.write(
+            output_path, mesh.vertex_array, mesh.face_array
+        ),
+        "thicken_mesh": lambda: thicken_mesh(
+            mesh, OFFSET, calculate_cylindrical_normal
+        ),
+        "thicken_mesh_area_weighted": lambda: thicken_mesh(
+            mesh, OFFSET, calculate_area_weighted_normals
+        ),
+        "hemispherical_cylinder_transformation": lambda: transformation.transform(
+            mesh, OFFSET
+        ),
+        "parallel_transformation": lambda: ParallelTransformer(
+            PARALLEL_WORKERS
+        ).transform(transformation, mesh, OFFSET),
+        "detect_narrow_cross_sections": lambda: detect_narrow_cross_sections(
+            mesh, NARROW_THRESHOLD
+        ),
+        "cross_section_thickener": lambda: thickener.thicken(mesh, narrow_sections),
+        "slice_mesh": lambda: slice_mesh(mesh, planes).areas,
+        "wall_thickness": lambda: measure_wall_thickness(mesh),
+    }
+    return {
+        name: benchmark
+        for name, benchmark in benchmarks.items()
+        if len(mesh.face_array) <= MAX_TRIANGLES.get(name, len(mesh.face_array))
+    }
+
+
+def build_startup_benchmarks() -> Dict[str, Benchmark]:
+    """
+    Prepare the benchmarks that need no mesh.
+
+    Returns:
+        Dict[str, Benchmark]: The benchmarks, by name, in run order.
+    """
+    return {
+        "cli_startup": lambda: subprocess.run(
+            [sys.executable, "-m", "thicker.cli.cli", "--help"],
+            capture_output=True,
+            check=True,
+        ),
+    }
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, float]:
+    """
+    Time a benchmark several times.
+
+    Args:
+        benchmark (Benchmark): The operation to time.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        Dict[str, float]: The best and mean wall time, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        benchmark()
+        timings.append(time.perf_counter() - start)
+    return {"best_seconds": min(timings), "mean_seconds": sum(timings) / repeat}
+
+
+def current_commit() -> Optional[str]:
+    """Return the git commit of the working tree, or None outside git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(shapes: List[str], sizes: List[int], repeat: int) -> Dict[str, Any]:
+    """
+    Run every benchmark on every shape and size.
+
+    Args:
+        shapes (List[str]): The synthetic shapes to generate.
+        sizes (List[int]): The target triangle counts.
+        repeat (int): The number of timed runs per benchmark.
+
+    Returns:
+        Dict[str, Any]: The JSON document, with "metadata" and "results".
+    """
+    results = []
+    for name, benchmark in build_startup_benchmarks().items():
+        timing = time_benchmark(benchmark, repeat)
+        print(f"{STARTUP_SHAPE:>9} {0:>10} {name:<38} {timing['best_seconds']:.4f} s")
+        results.append(
+            {
+                "shape": STARTUP_SHAPE,
+                "target_triangles": 0,
+                "triangles": 0,
+                "vertices": 0,
+                "benchmark": name,
+                "repeat": repeat,
+                **timing,
+            }
+        )
+    for shape in shapes:
+        for size in sizes:
+            mesh = Mesh(*generate_mesh(shape, size))
+            with tempfile.TemporaryDirectory() as work_dir:
+                benchmarks = build_benchmarks(mesh, work_dir)
+                for name, benchmark in benchmarks.items():
+                    timing = time_benchmark(benchmark, repeat)
+                    print(
+                        f"{shape:>9} {len(mesh.face_array):>10} {name:<38}"
+                        f" {timing['best_seconds']:.4f} s"
+                    )
+                    results.append(
+                        {
+                            "shape": shape,
+                            "target_triangles": size,
+                            "triangles": len(mesh.face_array),
+                            "vertices": len(mesh.vertex_array),
+                            "benchmark": name,
+                            "repeat": repeat,
+                            **timing,
+                        }
+                    )
+    metadata = {
+        "commit": current_commit(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+    return {"metadata": metadata, "results": results}
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments for the benchmark suite.
+
+    Args:
+        argv (Optional[List[str]]): The arguments, or None for sys.argv.
+
+    Returns:
+        Namespace: The shapes, sizes, repeat count and output path.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        choices=list(PROFILES),
+        default=list(PROFILES),
+        help="Synthetic shapes to benchmark.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Target triangle counts.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="Timed runs per benchmark; the best is compared.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="JSON results file. Defaults to benchmarks/results/<commit>.json.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> str:
+    """
+    Run the benchmark suite and save the results.
+
+    Args:
+        argv (Optional[List[str]]): The arguments, or None for sys.argv.
+
+    Returns:
+        str: The path of the JSON results file.
+    """
+    args = parse_arguments(argv)
+    document = run_benchmarks(args.shapes, args.sizes, args.repeat)
+    output_path = args.output
+    if output_path is None:
+        commit = document["metadata"]["commit"] or "uncommitted"
+        output_path = os.path.join("benchmarks", "results", f"{commit[:12]}.json")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as results_file:
+        json.dump(document, results_file, indent=2)
+        results_file.write("\n")
+    print(f"Results saved to: {output_path}")
+    return output_path
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,138 @@
+"""Generate synthetic meshes of any size for benchmarking.
+
+Every shape is a closed surface of revolution around the z-axis: a grid of
+rings and segments on a radius profile, capped with triangle fans. The grid
+is sized so the mesh has close to the requested number of triangles.
+"""
+
+import math
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from thicker.domain.mesh import FaceArray, VertexArray
+
+RadiusProfile = Callable[[np.ndarray], np.ndarray]
+
+HEIGHT = 10.0
+RADIUS = 2.0
+
+
+def cylinder_profile(z: np.ndarray) -> np.ndarray:
+    """A straight cylinder."""
+    return np.full_like(z, RADIUS)
+
+
+def dome_profile(z: np.ndarray) -> np.ndarray:
+    """A cylinder topped with a hemisphere, as in the thickening transform."""
+    cylinder_height = HEIGHT - RADIUS
+    above = np.clip(z - cylinder_height, 0.0, RADIUS)
+    return np.sqrt(RADIUS * RADIUS - above * above)
+
+
+def figurine_profile(z: np.ndarray) -> np.ndarray:
+    """A base, slender legs, a body, a narrow neck and a head."""
+    t = z / HEIGHT
+    base = 1.8 * np.exp(-((t / 0.06) ** 2))
+    body = 1.2 * np.exp(-(((t - 0.5) / 0.15) ** 2))
+    head = 0.9 * np.exp(-(((t - 0.85) / 0.07) ** 2))
+    return 0.25 + base + body + head
+
+
+PROFILES: Dict[str, RadiusProfile] = {
+    "cylinder": cylinder_profile,
+    "dome": dome_profile,
+    "figurine": figurine_profile,
+}
+
+
+def grid_size(num_triangles: int) -> Tuple[int, int]:
+    """
+    Choose the rings and segments that give about num_triangles triangles.
+
+    A grid of R rings and S segments has 2 * (R - 1) * S side triangles and
+    2 * S cap triangles, so 2 * R * S in total.
+
+    Args:
+        num_triangles (int): The target number of triangles.
+
+    Returns:
+        Tuple[int, int]: The number of rings and of segments.
+    """
+    segments = max(8, round(math.sqrt(num_triangles / 2)))
+    rings = max(2, round(num_triangles / (2 * segments)))
+    return rings, segments
+
+
+def surface_of_revolution(
+    profile: RadiusProfile, num_triangles: int
+) -> Tuple[VertexArray, FaceArray]:
+    """
+    Build a closed, indexed surface of revolution.
+
+    Args:
+        profile (RadiusProfile): The radius at each height, from 0 to HEIGHT.
+        num_triangles (int): The target number of triangles.
+
+    Returns:
+        Tuple[VertexArray, FaceArray]: The (N, 3) vertices and (M, 3) faces.
+    """
+    rings, segments = grid_size(num_triangles)
+    z = np.linspace(0.0, HEIGHT, rings)
+    angles = np.linspace(0.0, 2 * np.pi, segments, endpoint=False)
+    radii = profile(z)
+
+    ring_vertices = np.empty((rings, segments, 3))
+    ring_vertices[..., 0] = radii[:, None] * np.cos(angles)
+    ring_vertices[..., 1] = radii[:, None] * np.sin(angles)
+    ring_vertices[..., 2] = z[:, None]
+    bottom_center = rings * segments
+    top_center = bottom_center + 1
+    vertices = np.concatenate(
+        [ring_vertices.reshape(-1, 3), [[0.0, 0.0, 0.0], [0.0, 0.0, HEIGHT]]]
+    )
+
+    # Two triangles per quad between neighbouring rings
+    ring = np.arange(rings - 1)[:, None] * segments
+    segment = np.arange(segments)[None, :]
+    lower_left = (ring + segment).ravel()
+    lower_right = (ring + (segment + 1) % segments).ravel()
+    upper_left = lower_left + segments
+    upper_right = lower_right + segments
+    sides = np.concatenate(
+        [
+            np.column_stack([lower_left, lower_right, upper_left]),
+            np.column_stack([upper_left, lower_right, upper_right]),
+        ]
+    )
+
+    # Triangle fans close the bottom and top rings
+    first = np.arange(segments)
+    second = (first + 1) % segments
+    top = (rings - 1) * segments
+    caps = np.concatenate(
+        [
+            np.column_stack([np.full(segments, bottom_center), second, first]),
+            np.column_stack([np.full(segments, top_center), top + first, top + second]),
+        ]
+    )
+    return vertices, np.concatenate([sides, caps]).astype(np.intp)
+
+
+def generate_mesh(shape: str, num_triangles: int) -> Tuple[VertexArray, FaceArray]:
+    """
+    Generate one of the named synthetic shapes.
+
+    Args:
+        shape (str): "cylinder", "dome" or "figurine".
+        num_triangles (int): The target number of triangles.
+
+    Returns:
+        Tuple[VertexArray, FaceArray]: The (N, 3) vertices and (M, 3) faces.
+
+    Raises:
+        ValueError: If the shape is unknown.
+    """
+    if shape not in PROFILES:
+        raise ValueError(f"Unknown shape: {shape}")
+    return surface_of_revolution(PROFILES[shape], num_triangles)
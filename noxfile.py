@@ -87,6 +87,28 @@ def coverage_ci(session):
         session.log("Skipping coverage_ci XML, since we are not running in CI.")
 
 
+@nox.session(python=["3.11"])
+def benchmark(session):
+    """
+    Time the thickening pipeline on synthetic meshes of 10k to 1M triangles.
+
+    Arguments after -- are passed to benchmarks/run_benchmarks.py, e.g.
+    nox -s benchmark -- --sizes 10000 100000 --output results.json
+    """
+    session.install(*PYPROJECT["project"]["dependencies"])
+    session.run("python", "-m", "benchmarks.run_benchmarks", *session.posargs)
+
+
+@nox.session(python=["3.11"])
+def benchmark_compare(session):
+    """
+    Compare two benchmark result files, failing on regressions.
+
+    nox -s benchmark_compare -- baseline.json candidate.json
+    """
+    session.run("python", "-m", "benchmarks.compare", *session.posargs)
+
+
 @nox.session
 def lint(session):
     """Run Ruff to lint the codebase."""
@@ -0,0 +1,196 @@
+"""Test the compressed and standard stream adapters."""
+
+import gzip
+import io
+import lzma
+import os
+
+import numpy as np
+import pytest
+
+from thicker.adapters.compressed_streams import (
+    compression_suffix,
+    is_stream_path,
+    open_stream,
+    read_into,
+    replace_file,
+    strip_compression_suffix,
+)
+from thicker.adapters.stl_binary import STL_RECORD_DTYPE
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
+
+CYLINDER_STL = "tests/fixtures/test_cylinder.stl"
+
+
+class TrickleStream(io.RawIOBase):
+    """A stream that returns at most a few bytes per read, like a pipe."""
+
+    def __init__(self, data, step=7):
+        self.data = memoryview(data)
+        self.step = step
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = min(self.step, len(buffer), len(self.data))
+        buffer[:count] = self.data[:count]
+        self.data = self.data[count:]
+        return count
+
+
+@pytest.mark.parametrize(
+    ("file_path", "suffix", "stripped"),
+    [
+        ("mesh.stl.gz", ".gz", "mesh.stl"),
+        ("mesh.PLY.XZ", ".xz", "mesh.PLY"),
+        ("mesh.obj.bz2", ".bz2", "mesh.obj"),
+        ("mesh.stl", None, "mesh.stl"),
+    ],
+)
+def test_compression_suffix(file_path, suffix, stripped):
+    """Compression is recognised by the last extension."""
+    assert compression_suffix(file_path) == suffix
+    assert strip_compression_suffix(file_path) == stripped
+
+
+def test_is_stream_path():
+    """Compressed files and "-" are streams; plain files are not."""
+    assert is_stream_path("-")
+    assert is_stream_path("mesh.stl.xz")
+    assert not is_stream_path("mesh.stl")
+
+
+def test_open_stream_decompresses(tmp_path):
+    """Compressed files read back as their uncompressed bytes."""
+    xz_path = str(tmp_path / "data.xz")
+    with open_stream(xz_path, "wb") as stream:
+        stream.write(b"facet")
+
+    with open_stream(xz_path, "rb") as stream:
+        data = stream.read()
+
+    assert data == b"facet"
+    assert lzma.open(xz_path).read() == b"facet"
+
+
+def test_open_stream_stdin(monkeypatch):
+    """ "-" reads the binary stdin without closing it."""
+    stdin = io.TextIOWrapper(io.BytesIO(b"solid"))
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    with open_stream("-", "rb") as stream:
+        data = stream.read()
+
+    assert data == b"solid"
+    assert not stdin.closed
+
+
+def test_replace_file_gives_the_output_a_new_inode(tmp_path):
+    """A hard link to the old file keeps the old bytes."""
+    file_path = tmp_path / "mesh.stl"
+    file_path.write_bytes(b"old")
+    link_path = tmp_path / "link.stl"
+    os.link(file_path, link_path)
+    plain_path = tmp_path / "plain.stl"
+    plain_path.write_bytes(b"")
+
+    with replace_file(str(file_path)) as stream:
+        stream.write(b"new")
+
+    assert file_path.read_bytes() == b"new"
+    assert link_path.read_bytes() == b"old"
+    assert file_path.stat().st_mode == plain_path.stat().st_mode
+    assert sorted(os.listdir(tmp_path)) == ["link.stl", "mesh.stl", "plain.stl"]
+
+
+def test_failed_replace_keeps_the_old_file(tmp_path):
+    """A write that fails leaves the old file and no temporary file."""
+    file_path = tmp_path / "mesh.stl"
+    file_path.write_bytes(b"old")
+
+    with pytest.raises(OSError, match="disk full"):
+        with replace_file(str(file_path)) as stream:
+            stream.write(b"partial")
+            raise OSError("disk full")
+
+    assert file_path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["mesh.stl"]
+
+
+def test_replace_file_writes_devices_in_place():
+    """Devices such as /dev/null are written, not replaced."""
+    with replace_file(os.devnull) as stream:
+        stream.write(b"discarded")
+
+    assert os.path.exists(os.devnull) and not os.path.isfile(os.devnull)
+
+
+def test_read_into_collects_short_reads():
+    """Short reads are repeated until the buffer is full or the data ends."""
+    buffer = bytearray(20)
+
+    assert read_into(TrickleStream(b"x" * 30), memoryview(buffer)) == 20
+    assert read_into(TrickleStream(b"y" * 10), memoryview(buffer)) == 10
+    assert buffer == b"y" * 10 + b"x" * 10
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz", ".bz2"])
+def test_compressed_stl_round_trip(tmp_path, suffix):
+    """Compressed STL files hold the same triangles as plain ones."""
+    vertices, faces = STLMeshReader().read(CYLINDER_STL)
+    compressed_path = str(tmp_path / f"cylinder.stl{suffix}")
+
+    STLMeshWriter.write(compressed_path, vertices, faces)
+    read_vertices, read_faces = STLMeshReader().read(compressed_path)
+
+    assert np.array_equal(read_vertices[read_faces], vertices[faces])
+
+
+def test_compressed_ascii_stl(tmp_path):
+    """ASCII STL text is recognised inside a compressed file."""
+    gz_path = tmp_path / "triangle.stl.gz"
+    gz_path.write_bytes(
+        gzip.compress(
+            b"solid t\nfacet normal 0 0 1\nouter loop\nvertex 0 0 0\n"
+            b"vertex 1 0 0\nvertex 0 1 0\nendloop\nendfacet\nendsolid t\n"
+        )
+    )
+
+    vertices, faces = STLMeshReader().read(str(gz_path))
+
+    assert vertices[faces].tolist() == [[[0, 0, 0], [1, 0, 0], [0, 1, 0]]]
+
+
+def test_compressed_stl_chunks(tmp_path):
+    """Chunks of a compressed file match the chunks of the plain file."""
+    gz_path = str(tmp_path / "cylinder.stl.gz")
+    with open(CYLINDER_STL, "rb") as stl_file, gzip.open(gz_path, "wb") as gz_file:
+        gz_file.write(stl_file.read())
+
+    chunks = list(STLMeshReader.read_chunks(gz_path, 10))
+    expected = list(STLMeshReader.read_chunks(CYLINDER_STL, 10))
+
+    assert len(chunks) == len(expected)
+    assert all(np.array_equal(a, b) for a, b in zip(chunks, expected))
+
+
+def test_stl_stdin_to_stdout(monkeypatch, capfdbinary):
+    """A mesh piped through stdin is written to stdout."""
+    with open(CYLINDER_STL, "rb") as stl_file:
+        data = stl_file.read()
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(TrickleStream(data, 4096)))
+
+    vertices, faces = STLMeshReader().read("-")
+    STLMeshWriter.write("-", vertices, faces)
+
+    written = np.frombuffer(capfdbinary.readouterr().out, STL_RECORD_DTYPE, -1, 84)
+    expected = np.frombuffer(data, STL_RECORD_DTYPE, -1, 84)
+    assert np.array_equal(written["vectors"], expected["vectors"])
+
+
+def test_chunked_writer_rejects_streams(tmp_path):
+    """The facet count is patched at the end, so chunks need a plain file."""
+    with pytest.raises(ValueError, match="must be an uncompressed file"):
+        STLMeshWriter.write_chunks(str(tmp_path / "out.stl.gz"), [])
@@ -0,0 +1,184 @@
+"""Test the on-disk result cache."""
+
+import os
+
+import pytest
+
+from thicker.adapters.file_result_cache import FileResultCache
+from thicker.adapters.mesh_formats import MeshFormatWriter
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    """A small input file."""
+    input_path = tmp_path / "input.stl"
+    input_path.write_bytes(b"mesh bytes")
+    return str(input_path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """An empty cache."""
+    return FileResultCache(str(tmp_path / "cache"))
+
+
+def test_key_depends_on_content_and_parameters(cache, input_file, tmp_path):
+    """Keys change with the input bytes or parameters, not the file name."""
+    copy_path = tmp_path / "copy.stl"
+    copy_path.write_bytes(b"mesh bytes")
+    other_path = tmp_path / "other.stl"
+    other_path.write_bytes(b"other bytes")
+
+    key = cache.key(input_file, {"offset": 1.0})
+
+    assert cache.key(str(copy_path), {"offset": 1.0}) == key
+    assert cache.key(str(other_path), {"offset": 1.0}) != key
+    assert cache.key(input_file, {"offset": 2.0}) != key
+
+
+def test_miss_then_hit(cache, tmp_path):
+    """A stored output is copied to the next job's output path."""
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"thick mesh")
+    second_output = tmp_path / "second.stl"
+
+    assert not cache.fetch("abc", str(second_output))
+    cache.store("abc", str(output_path))
+
+    assert cache.fetch("abc", str(second_output))
+    assert second_output.read_bytes() == b"thick mesh"
+    assert not os.path.samefile(second_output, os.path.join(cache.directory, "abc.bin"))
+
+
+def test_hit_replaces_existing_output(cache, tmp_path):
+    """An existing output file is replaced by the cached one."""
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"thick mesh")
+    cache.store("abc", str(output_path))
+    output_path.write_bytes(b"stale")
+
+    assert cache.fetch("abc", str(output_path))
+    assert output_path.read_bytes() == b"thick mesh"
+
+
+def test_hard_link_hit(tmp_path):
+    """Hits can be hard-linked instead of copied."""
+    cache = FileResultCache(str(tmp_path / "cache"), hard_link=True)
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"thick mesh")
+    cache.store("abc", str(output_path))
+    linked_output = tmp_path / "linked.stl"
+
+    assert cache.fetch("abc", str(linked_output))
+    assert os.path.samefile(linked_output, os.path.join(cache.directory, "abc.bin"))
+
+
+@pytest.mark.parametrize(
+    "output_name", ["output.stl", "output.obj", "output.ply", "output.stl.gz"]
+)
+def test_writing_over_a_hard_linked_hit_keeps_the_entry(tmp_path, output_name):
+    """Writers replace a linked output rather than truncating the entry."""
+    cache = FileResultCache(str(tmp_path / "cache"), hard_link=True)
+    entry_source = tmp_path / "entry"
+    entry_source.write_bytes(b"thick mesh")
+    cache.store("abc", str(entry_source))
+    output_path = str(tmp_path / output_name)
+    assert cache.fetch("abc", output_path)
+
+    MeshFormatWriter.write(output_path, [(0, 0, 0), (1, 0, 0), (0, 1, 0)], [(0, 1, 2)])
+
+    with open(os.path.join(cache.directory, "abc.bin"), "rb") as entry:
+        assert entry.read() == b"thick mesh"
+
+
+def test_chunked_writes_over_a_hard_linked_hit_keep_the_entry(tmp_path):
+    """Chunked STL output also replaces a linked output."""
+    cache = FileResultCache(str(tmp_path / "cache"), hard_link=True)
+    entry_source = tmp_path / "entry"
+    entry_source.write_bytes(b"thick mesh")
+    cache.store("abc", str(entry_source))
+    output_path = str(tmp_path / "output.stl")
+    assert cache.fetch("abc", output_path)
+
+    STLMeshWriter.write_chunks(output_path, [])
+
+    with open(os.path.join(cache.directory, "abc.bin"), "rb") as entry:
+        assert entry.read() == b"thick mesh"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """The cache evicts the entries used longest ago once it is full."""
+    cache = FileResultCache(str(tmp_path / "cache"), max_bytes=25)
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"0123456789")
+    for age, key in enumerate(["old", "used", "new"]):
+        cache.store(key, str(output_path))
+        entry_path = os.path.join(cache.directory, f"{key}.bin")
+        os.utime(entry_path, (1000 + age, 1000 + age))
+    # "new" pushed the size to 30 bytes and evicted "old"
+    cache.fetch("used", str(tmp_path / "hit.stl"))
+
+    cache.store("newest", str(output_path))
+
+    remaining = sorted(os.listdir(cache.directory))
+    assert remaining == ["newest.bin", "used.bin"]
+
+
+def test_output_larger_than_cache_is_not_stored(tmp_path):
+    """An output that cannot fit in the cache is skipped."""
+    cache = FileResultCache(str(tmp_path / "cache"), max_bytes=5)
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"0123456789")
+
+    cache.store("abc", str(output_path))
+
+    assert os.listdir(cache.directory) == []
+
+
+def test_hard_link_falls_back_to_copy(tmp_path, mocker):
+    """Hits are copied where hard links are not possible."""
+    cache = FileResultCache(str(tmp_path / "cache"), hard_link=True)
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"thick mesh")
+    cache.store("abc", str(output_path))
+    mocker.patch("os.link", side_effect=OSError("cross-device link"))
+    copied_output = tmp_path / "copied.stl"
+
+    assert cache.fetch("abc", str(copied_output))
+    assert copied_output.read_bytes() == b"thick mesh"
+
+
+def test_entry_evicted_during_fetch(cache, tmp_path, mocker):
+    """An entry removed by another process between checks is a miss."""
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"thick mesh")
+    cache.store("abc", str(output_path))
+    mocker.patch("shutil.copyfile", side_effect=FileNotFoundError)
+
+    assert not cache.fetch("abc", str(tmp_path / "second.stl"))
+
+
+def test_failed_store_leaves_no_partial_entry(cache, tmp_path, mocker):
+    """A store that fails part way removes its temporary file."""
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"thick mesh")
+    mocker.patch("shutil.copyfile", side_effect=OSError("disk full"))
+
+    with pytest.raises(OSError, match="disk full"):
+        cache.store("abc", str(output_path))
+    assert os.listdir(cache.directory) == []
+
+
+def test_other_files_are_not_entries(cache, tmp_path):
+    """Files without the entry suffix are neither counted nor evicted."""
+    notes_path = os.path.join(cache.directory, "notes.txt")
+    with open(notes_path, "w") as notes:
+        notes.write("x" * 100)
+    cache.max_bytes = 10
+    output_path = tmp_path / "output.stl"
+    output_path.write_bytes(b"0123456789")
+
+    cache.store("abc", str(output_path))
+
+    assert sorted(os.listdir(cache.directory)) == ["abc.bin", "notes.txt"]
@@ -0,0 +1,68 @@
+"""Test the choice of mesh adapter by file extension."""
+
+import numpy as np
+import pytest
+
+from thicker.adapters.mesh_formats import (
+    MeshFormatReader,
+    MeshFormatWriter,
+    mesh_format,
+)
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+
+VERTICES = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+FACES = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+
+
+@pytest.mark.parametrize(
+    ("file_path", "expected"),
+    [
+        ("mesh.stl", "stl"),
+        ("dir.v2/MESH.OBJ", "obj"),
+        ("mesh.ply", "ply"),
+        ("mesh.mesh", "stl"),
+        ("mesh", "stl"),
+        ("mesh.ply.gz", "ply"),
+        ("-", "stl"),
+    ],
+)
+def test_mesh_format(file_path, expected):
+    """The extension picks the format, and STL is the default."""
+    assert mesh_format(file_path) == expected
+
+
+@pytest.mark.parametrize("extension", ["obj", "ply"])
+def test_indexed_formats_are_smaller_than_stl(tmp_path, extension):
+    """Indexed files keep shared vertices that STL repeats per facet."""
+    indexed_path = str(tmp_path / f"mesh.{extension}")
+    stl_path = str(tmp_path / "mesh.stl")
+
+    MeshFormatWriter.write(indexed_path, VERTICES, FACES)
+    MeshFormatWriter.write(stl_path, VERTICES, FACES)
+    vertices, faces = MeshFormatReader().read(indexed_path)
+    stl_vertices, stl_faces = STLMeshReader().read(stl_path)
+
+    assert len(vertices) == 4 and len(stl_vertices) == 12
+    assert np.array_equal(vertices[faces], stl_vertices[stl_faces])
+
+
+def test_mesh_format_reader_welds(tmp_path):
+    """The weld tolerance is passed to the reader of every format."""
+    stl_path = str(tmp_path / "mesh.stl")
+    MeshFormatWriter.write(stl_path, VERTICES, FACES)
+
+    vertices, _ = MeshFormatReader(weld_tolerance=0).read(stl_path)
+
+    assert len(vertices) == 4
+
+
+@pytest.mark.parametrize("file_name", ["mesh.obj.gz", "mesh.ply.xz"])
+def test_compressed_indexed_formats(tmp_path, file_name):
+    """OBJ and PLY files may be compressed as well."""
+    compressed_path = str(tmp_path / file_name)
+
+    MeshFormatWriter.write(compressed_path, VERTICES, FACES)
+    vertices, faces = MeshFormatReader().read(compressed_path)
+
+    assert np.array_equal(vertices, VERTICES)
+    assert np.array_equal(faces, FACES)
@@ -0,0 +1,39 @@
+"""Test the JSON metrics writer."""
+
+import json
+
+from thicker.adapters.metrics_json_writer import write_metrics_json
+from thicker.use_cases.instrumentation import StageMetrics
+
+
+def test_write_metrics_json(tmp_path):
+    """The run details and every stage are written as JSON."""
+    metrics_path = tmp_path / "metrics.json"
+    records = [
+        StageMetrics("read", 0.5, 0.25, 1024, 30, 10),
+        StageMetrics("write", 0.125, 0.125, None, None, None),
+    ]
+
+    write_metrics_json(str(metrics_path), records, {"input": "in.stl"})
+
+    document = json.loads(metrics_path.read_text())
+    assert document["run"]["input"] == "in.stl"
+    assert "recorded_at" in document["run"]
+    assert document["stages"] == [
+        {
+            "stage": "read",
+            "wall_seconds": 0.5,
+            "cpu_seconds": 0.25,
+            "peak_memory_bytes": 1024,
+            "vertices": 30,
+            "faces": 10,
+        },
+        {
+            "stage": "write",
+            "wall_seconds": 0.125,
+            "cpu_seconds": 0.125,
+            "peak_memory_bytes": None,
+            "vertices": None,
+            "faces": None,
+        },
+    ]
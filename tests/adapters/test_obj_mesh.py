@@ -0,0 +1,128 @@
+"""Test the OBJ reader and writer."""
+
+import numpy as np
+import pytest
+
+from thicker.adapters.obj_mesh import OBJMeshReader, OBJMeshWriter, parse_obj
+
+TETRAHEDRON_VERTICES = np.array(
+    [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float64
+)
+TETRAHEDRON_FACES = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+
+
+def test_obj_round_trip_keeps_indexing(tmp_path):
+    """Written vertices are shared, and read back exactly."""
+    obj_path = str(tmp_path / "tetrahedron.obj")
+    vertices = TETRAHEDRON_VERTICES + np.pi
+
+    OBJMeshWriter.write(obj_path, vertices, TETRAHEDRON_FACES)
+    read_vertices, read_faces = OBJMeshReader().read(obj_path)
+
+    assert np.array_equal(read_vertices, vertices)
+    assert np.array_equal(read_faces, TETRAHEDRON_FACES)
+
+
+def test_obj_round_trip_single_precision(tmp_path):
+    """Single precision coordinates are written with enough digits."""
+    obj_path = str(tmp_path / "tetrahedron.obj")
+    vertices = (TETRAHEDRON_VERTICES / 3).astype(np.float32)
+
+    OBJMeshWriter.write(obj_path, vertices, TETRAHEDRON_FACES)
+    read_vertices, _ = OBJMeshReader().read(obj_path)
+
+    assert np.array_equal(read_vertices.astype(np.float32), vertices)
+
+
+def test_parse_obj_ignores_texture_and_normal_indices():
+    """Only the vertex part of "v/vt/vn" corners is used."""
+    data = b"""# a triangle
+o triangle
+v 0 0 0
+v 1 0 0 1.0
+vt 0 0
+vn 0 0 1
+v 0 1 0
+f 1/1/1 2/1/1 3//1 # comment
+"""
+
+    vertices, faces = parse_obj(data)
+
+    assert vertices.tolist() == [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    assert faces.tolist() == [[0, 1, 2]]
+
+
+def test_parse_obj_splits_polygons_into_fans():
+    """A quad becomes two triangles sharing its first corner."""
+    data = b"v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nf 1 2 3 4\nf 1 2 3\n"
+
+    _, faces = parse_obj(data)
+
+    assert faces.tolist() == [[0, 1, 2], [0, 2, 3], [0, 1, 2]]
+
+
+def test_parse_obj_negative_indices():
+    """Negative indices count back from the last vertex."""
+    data = b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf -3 -2 -1\n"
+
+    _, faces = parse_obj(data)
+
+    assert faces.tolist() == [[0, 1, 2]]
+
+
+def test_parse_obj_negative_indices_per_object():
+    """Negative indices count back from the vertices defined so far."""
+    data = b"""o first
+v 0 0 0
+v 1 0 0
+v 0 1 0
+f -3 -2 -1
+o second
+v 0 0 1
+v 1 0 1
+v 1 1 1
+v 0 1 1
+f -4 -3 -2 -1
+f -3 -2 -1
+"""
+
+    _, faces = parse_obj(data)
+
+    assert faces.tolist() == [[0, 1, 2], [3, 4, 5], [3, 5, 6], [4, 5, 6]]
+
+
+def test_parse_obj_without_faces():
+    """A point cloud has no faces."""
+    vertices, faces = parse_obj(b"v 1 2 3\n")
+
+    assert vertices.tolist() == [[1, 2, 3]]
+    assert faces.shape == (0, 3)
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"v 0 0 zero\n", "Malformed number"),
+        (b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 4\n", "missing vertex"),
+        (b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 0 1 2\n", "index 0 is invalid"),
+        (b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3 0\n", "index 0 is invalid"),
+        (b"v 0 0 0\nv 1 0 0\nf -3 -2 -1\nv 0 1 0\n", "missing vertex"),
+    ],
+)
+def test_parse_obj_rejects_malformed_data(data, message):
+    """Bad coordinates, index 0 and dangling indices raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        parse_obj(data)
+
+
+def test_obj_reader_welds(tmp_path):
+    """A triangle soup is welded into shared vertices when asked."""
+    obj_path = tmp_path / "soup.obj"
+    obj_path.write_text(
+        "v 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 0\nv 0 1 0\nv -1 0 0\nf 1 2 3\nf 4 5 6\n"
+    )
+
+    vertices, faces = OBJMeshReader(weld_tolerance=0).read(str(obj_path))
+
+    assert len(vertices) == 4
+    assert faces.tolist() == [[0, 1, 2], [0, 2, 3]]
@@ -0,0 +1,275 @@
+"""Test the binary PLY reader and writer."""
+
+import numpy as np
+import pytest
+
+from thicker.adapters.ply_mesh import (
+    PLYMeshReader,
+    PLYMeshWriter,
+    parse_ply,
+    parse_ply_header,
+)
+
+TETRAHEDRON_VERTICES = np.array(
+    [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float64
+)
+TETRAHEDRON_FACES = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+
+
+def ply_bytes(header_lines, *arrays):
+    """Assemble a PLY file from header lines and binary records."""
+    header = "\n".join(["ply", *header_lines, "end_header\n"]).encode("ascii")
+    return header + b"".join(array.tobytes() for array in arrays)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_ply_round_trip_keeps_indexing(tmp_path, dtype):
+    """Vertices keep their precision and faces their shared indices."""
+    ply_path = str(tmp_path / "tetrahedron.ply")
+    vertices = (TETRAHEDRON_VERTICES / 3).astype(dtype)
+
+    PLYMeshWriter.write(ply_path, vertices, TETRAHEDRON_FACES)
+    read_vertices, read_faces = PLYMeshReader().read(ply_path)
+
+    assert read_vertices.dtype == dtype
+    assert np.array_equal(read_vertices, vertices)
+    assert np.array_equal(read_faces, TETRAHEDRON_FACES)
+
+
+def test_parse_ply_skips_extra_properties_and_elements():
+    """Normals, colours and unknown elements do not disturb the geometry."""
+    vertex = np.dtype(
+        [("x", ">f4"), ("nx", ">f4"), ("y", ">f4"), ("z", ">f4"), ("red", "u1")]
+    )
+    face = np.dtype([("flags", ">i2"), ("n", "u1"), ("v", ">u4", (3,))])
+    vertices = np.zeros(3, dtype=vertex)
+    vertices["x"], vertices["y"], vertices["z"] = [0, 1, 0], [0, 0, 1], [2, 2, 2]
+    faces = np.zeros(1, dtype=face)
+    faces["n"], faces["v"] = 3, [0, 1, 2]
+    edge = np.array([(0, 1)], dtype=[("a", ">i4"), ("b", ">i4")])
+    data = ply_bytes(
+        [
+            "format binary_big_endian 1.0",
+            "comment made by hand",
+            "element vertex 3",
+            "property float x",
+            "property float nx",
+            "property float y",
+            "property float z",
+            "property uchar red",
+            "element face 1",
+            "property short flags",
+            "property list uchar uint vertex_index",
+            "element edge 1",
+            "property int vertex1",
+            "property int vertex2",
+        ],
+        vertices,
+        faces,
+        edge,
+    )
+
+    read_vertices, read_faces = parse_ply(data)
+
+    assert read_vertices.tolist() == [[0, 0, 2], [1, 0, 2], [0, 1, 2]]
+    assert read_faces.tolist() == [[0, 1, 2]]
+
+
+def test_parse_ply_splits_polygons_into_fans():
+    """Mixed polygons are walked record by record and split into triangles."""
+    vertices = np.arange(15, dtype="<f8")
+    faces = np.array([7, 4, 0, 1, 2, 3, 7, 3, 0, 3, 4], dtype="<i4")
+    polylines = np.array([2, 0, 1], dtype="<i4")
+    data = ply_bytes(
+        [
+            "format binary_little_endian 1.0",
+            "element vertex 5",
+            "property double x",
+            "property double y",
+            "property double z",
+            "element face 2",
+            "property int flags",
+            "property list int int vertex_indices",
+            "element polyline 1",
+            "property list int int vertex_indices",
+        ],
+        vertices,
+        faces,
+        polylines,
+    )
+
+    read_vertices, read_faces = parse_ply(data)
+
+    assert read_vertices.shape == (5, 3)
+    assert read_faces.tolist() == [[0, 1, 2], [0, 2, 3], [0, 3, 4]]
+
+
+def test_parse_ply_reads_quads_in_bulk(mocker):
+    """Faces with the same number of corners are read without a loop."""
+    walk = mocker.patch("thicker.adapters.ply_mesh._read_list_element")
+    face = np.dtype([("n", "u1"), ("v", "<i4", (4,)), ("flags", "<i2")])
+    faces = np.zeros(2, dtype=face)
+    faces["n"], faces["v"] = 4, [[0, 1, 2, 3], [4, 5, 6, 7]]
+    data = ply_bytes(
+        [
+            "format binary_little_endian 1.0",
+            "element vertex 8",
+            "property float x",
+            "property float y",
+            "property float z",
+            "element face 2",
+            "property list uchar int vertex_indices",
+            "property short flags",
+        ],
+        np.zeros(24, dtype="<f4"),
+        faces,
+    )
+
+    _, read_faces = parse_ply(data)
+
+    walk.assert_not_called()
+    assert read_faces.dtype == np.intp
+    assert read_faces.tolist() == [[0, 1, 2], [0, 2, 3], [4, 5, 6], [4, 6, 7]]
+
+
+def test_parse_ply_reads_shorter_faces_after_a_quad():
+    """Faces after a quad may end before quads would."""
+    data = ply_bytes(
+        [
+            "format binary_little_endian 1.0",
+            "element vertex 5",
+            "property float x",
+            "property float y",
+            "property float z",
+            "element face 2",
+            "property list uchar int vertex_indices",
+        ],
+        np.zeros(15, dtype="<f4"),
+        np.array([4], dtype="u1"),
+        np.array([0, 1, 2, 3], dtype="<i4"),
+        np.array([3], dtype="u1"),
+        np.array([0, 3, 4], dtype="<i4"),
+    )
+
+    _, faces = parse_ply(data)
+
+    assert faces.tolist() == [[0, 1, 2], [0, 2, 3], [0, 3, 4]]
+
+
+def test_parse_ply_drops_degenerate_faces():
+    """Faces of fewer than three corners give no triangles."""
+    data = ply_bytes(
+        [
+            "format binary_little_endian 1.0",
+            "element vertex 2",
+            "property float x",
+            "property float y",
+            "property float z",
+            "element face 1",
+            "property list uchar int vertex_indices",
+        ],
+        np.zeros(6, dtype="<f4"),
+        np.array([2], dtype="u1"),
+        np.array([0, 1], dtype="<i4"),
+    )
+
+    _, faces = parse_ply(data)
+
+    assert faces.shape == (0, 3)
+
+
+@pytest.mark.parametrize(
+    "face_lines", [[], ["element face 0", "property list uchar int vertex_indices"]]
+)
+def test_parse_ply_without_faces(face_lines):
+    """A point cloud has no faces, or an empty face element."""
+    data = ply_bytes(
+        [
+            "format binary_little_endian 1.0",
+            "element vertex 1",
+            "property float x",
+            "property float y",
+            "property float z",
+            *face_lines,
+        ],
+        np.ones(3, dtype="<f4"),
+    )
+
+    vertices, faces = parse_ply(data)
+
+    assert vertices.tolist() == [[1, 1, 1]]
+    assert faces.shape == (0, 3)
+
+
+@pytest.mark.parametrize(
+    ("header", "message"),
+    [
+        (["format ascii 1.0"], "Only binary PLY"),
+        (["element vertex 1"], "no format line"),
+        (["format binary_little_endian 1.0", "property float x"], "Malformed"),
+        (["format binary_little_endian 1.0", "element vertex"], "Malformed"),
+        (["format binary_little_endian 1.0", "shape sphere"], "Unknown"),
+    ],
+)
+def test_parse_ply_header_rejects_bad_headers(header, message):
+    """Unsupported and malformed headers raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        parse_ply_header(ply_bytes(header))
+
+
+def test_parse_ply_header_rejects_other_files():
+    """A file without the PLY magic is not parsed."""
+    with pytest.raises(ValueError, match="Not a PLY file"):
+        parse_ply_header(b"solid cube\nendsolid\n")
+
+
+@pytest.mark.parametrize(
+    ("header", "arrays", "message"),
+    [
+        (
+            ["element vertex 2", "property float x"],
+            [np.zeros(1, dtype="<f4")],
+            "shorter than its header",
+        ),
+        (
+            ["element vertex 1", "property float x", "property float y"],
+            [np.zeros(2, dtype="<f4")],
+            "no vertex coordinates",
+        ),
+        (
+            [
+                "element vertex 3",
+                "property float x",
+                "property float y",
+                "property float z",
+                "element face 1",
+                "property list uchar int vertex_indices",
+            ],
+            [np.zeros(9, dtype="<f4"), np.array([3], "u1"), np.array([0, 1, 3], "<i4")],
+            "missing vertex",
+        ),
+        (
+            ["element face 1", "property int flags"],
+            [np.zeros(1, dtype="<i4")],
+            "exactly one vertex index list",
+        ),
+    ],
+)
+def test_parse_ply_rejects_bad_data(header, arrays, message):
+    """Truncated data, missing coordinates and dangling indices raise."""
+    data = ply_bytes(["format binary_little_endian 1.0", *header], *arrays)
+
+    with pytest.raises(ValueError, match=message):
+        parse_ply(data)
+
+
+def test_ply_reader_welds(tmp_path):
+    """A triangle soup is welded into shared vertices when asked."""
+    ply_path = str(tmp_path / "soup.ply")
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 0], [0, 1, 0]])
+    PLYMeshWriter.write(ply_path, vertices, [(0, 1, 2), (3, 4, 1)])
+
+    read_vertices, read_faces = PLYMeshReader(weld_tolerance=0).read(ply_path)
+
+    assert len(read_vertices) == 3
+    assert read_faces.tolist() == [[0, 1, 2], [0, 2, 1]]
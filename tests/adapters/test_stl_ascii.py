@@ -0,0 +1,137 @@
+"""Test the bulk ASCII STL parser."""
+
+import io
+
+import numpy as np
+import pytest
+from stl import mesh
+from stl.stl import Mode
+
+from thicker.adapters import stl_ascii
+from thicker.adapters.stl_ascii import (
+    is_ascii_stl,
+    looks_like_ascii_stl,
+    parse_ascii_vertices,
+    read_ascii_stl,
+    read_ascii_stl_stream,
+)
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+
+TRIANGLE_STL = b"""solid vertex names are not vertices
+  facet normal 0 0 1
+    outer loop
+      vertex 0 0 0
+      vertex 1.5 0 -2e-3
+      vertex 0 1 +3.25E2
+    endloop
+  endfacet
+endsolid vertex names are not vertices
+"""
+
+
+@pytest.fixture
+def ascii_stl(tmp_path):
+    """An ASCII STL file of random triangles, saved by numpy-stl."""
+    rng = np.random.default_rng(17)
+    stl_mesh = mesh.Mesh(np.zeros(200, dtype=mesh.Mesh.dtype))
+    stl_mesh.vectors[:] = rng.uniform(-50, 50, (200, 3, 3)).astype(np.float32)
+    stl_path = tmp_path / "random.stl"
+    stl_mesh.save(str(stl_path), mode=Mode.ASCII)
+    return str(stl_path)
+
+
+def test_read_ascii_stl_matches_numpy_stl(ascii_stl):
+    """The bulk parser reads the same float32 corners as numpy-stl."""
+    expected = mesh.Mesh.from_file(ascii_stl).vectors
+
+    vectors = read_ascii_stl(ascii_stl)
+
+    assert vectors.dtype == np.float32
+    assert np.array_equal(vectors, expected)
+
+
+def test_read_ascii_stl_in_blocks(ascii_stl, monkeypatch):
+    """Parsing in small blocks gives the same result as one block."""
+    expected = read_ascii_stl(ascii_stl)
+    monkeypatch.setattr(stl_ascii, "BLOCK_SIZE", 100)
+
+    assert np.array_equal(read_ascii_stl(ascii_stl), expected)
+
+
+def test_read_ascii_stl_stream_in_blocks(ascii_stl, monkeypatch):
+    """A stream parsed block by block matches the memory-mapped file."""
+    with open(ascii_stl, "rb") as stl_file:
+        stream = io.BytesIO(stl_file.read())
+    prefix = stream.read(10)
+    monkeypatch.setattr(stl_ascii, "BLOCK_SIZE", 100)
+
+    vectors = read_ascii_stl_stream(stream, prefix)
+
+    assert np.array_equal(vectors, read_ascii_stl(ascii_stl))
+
+
+def test_read_ascii_stl_stream_rejects_partial_triangles():
+    """A stream must hold whole triangles."""
+    with pytest.raises(ValueError, match="do not form triangles: stream"):
+        read_ascii_stl_stream(io.BytesIO(b"solid\nvertex 0 0 0\n"))
+
+
+def test_looks_like_ascii_stl():
+    """Binary headers that start with solid are told apart by NUL bytes."""
+    assert looks_like_ascii_stl(b"  solid cube\nfacet normal 0 0 1\n")
+    assert not looks_like_ascii_stl(b"solid binary header\0\0\0")
+    assert not looks_like_ascii_stl(b"binary header")
+
+
+def test_read_ascii_stl_line_endings(tmp_path):
+    """Windows line endings and exponents are handled, names are skipped."""
+    stl_path = tmp_path / "triangle.stl"
+    stl_path.write_bytes(TRIANGLE_STL.replace(b"\n", b"\r\n"))
+
+    vectors = read_ascii_stl(str(stl_path))
+
+    assert vectors.tolist() == [[[0, 0, 0], [1.5, 0, np.float32(-2e-3)], [0, 1, 325]]]
+
+
+def test_read_empty_ascii_stl(tmp_path):
+    """A solid without facets has no triangles."""
+    stl_path = tmp_path / "empty.stl"
+    stl_path.write_bytes(b"solid empty\nendsolid empty\n")
+
+    assert read_ascii_stl(str(stl_path)).shape == (0, 3, 3)
+
+
+def test_parse_malformed_coordinates():
+    """A vertex coordinate that is not a number is an error."""
+    with pytest.raises(ValueError, match="Malformed vertex coordinates"):
+        parse_ascii_vertices(b"vertex 1 2 x\n")
+
+
+def test_read_incomplete_triangle(tmp_path):
+    """Vertices that do not make whole triangles are an error."""
+    stl_path = tmp_path / "broken.stl"
+    stl_path.write_bytes(b"solid broken\nvertex 0 0 0\nvertex 1 0 0\nendsolid\n")
+
+    with pytest.raises(ValueError, match="do not form triangles"):
+        read_ascii_stl(str(stl_path))
+
+
+def test_binary_file_is_not_ascii(tmp_path):
+    """Files that do not start with solid are not parsed as ASCII."""
+    stl_path = tmp_path / "binary.stl"
+    stl_path.write_bytes(bytes(84))
+
+    assert not is_ascii_stl(str(stl_path))
+    with pytest.raises(ValueError, match="Not an ASCII STL file"):
+        read_ascii_stl(str(stl_path))
+
+
+def test_reader_uses_bulk_parser(ascii_stl, mocker):
+    """STLMeshReader parses ASCII files without numpy-stl."""
+    from_file = mocker.patch("thicker.adapters.stl_mesh_reader.mesh.Mesh.from_file")
+
+    vertices, faces = STLMeshReader().read(ascii_stl)
+
+    from_file.assert_not_called()
+    assert vertices.shape == (600, 3)
+    assert faces.shape == (200, 3)
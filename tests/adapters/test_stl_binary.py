@@ -0,0 +1,259 @@
+"""Test the memory-mapped binary STL access."""
+
+import io
+
+import numpy as np
+import pytest
+from stl import mesh
+from stl.stl import Mode
+
+from thicker.adapters.stl_binary import (
+    STL_RECORD_DTYPE,
+    binary_stl_facet_count,
+    facet_normals,
+    iter_binary_stl_chunks,
+    iter_binary_stl_stream_chunks,
+    read_binary_stl,
+    read_binary_stl_stream,
+    write_binary_stl,
+    write_binary_stl_chunks,
+)
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+
+CYLINDER_STL = "tests/fixtures/test_cylinder.stl"
+
+
+def _save_stl(path, vectors, mode):
+    """Save an STL file with numpy-stl in the given mode."""
+    stl_mesh = mesh.Mesh(np.zeros(len(vectors), dtype=mesh.Mesh.dtype))
+    stl_mesh.vectors[:] = vectors
+    stl_mesh.save(str(path), mode=mode)
+
+
+def test_record_dtype_is_packed():
+    """Each STL facet record is 50 bytes with no padding."""
+    assert STL_RECORD_DTYPE.itemsize == 50
+
+
+def test_read_binary_stl_matches_numpy_stl():
+    """Records read through the memory map match numpy-stl."""
+    expected = mesh.Mesh.from_file(CYLINDER_STL)
+
+    records = read_binary_stl(CYLINDER_STL)
+
+    assert len(records) == len(expected.vectors)
+    assert np.array_equal(records["vectors"], expected.vectors)
+    assert np.array_equal(records["normal"], expected.normals)
+
+
+def test_read_binary_stl_is_a_view():
+    """The records and their fields are views of the mapped file."""
+    records = read_binary_stl(CYLINDER_STL)
+
+    assert isinstance(records, np.memmap)
+    assert np.shares_memory(records["vectors"], records)
+    assert not records.flags.writeable
+
+
+def test_read_binary_stl_empty(tmp_path):
+    """A binary STL without facets yields an empty record array."""
+    stl_path = tmp_path / "empty.stl"
+    stl_path.write_bytes(bytes(80) + (0).to_bytes(4, "little"))
+
+    records = read_binary_stl(str(stl_path))
+
+    assert records.shape == (0,)
+    assert records.dtype == STL_RECORD_DTYPE
+
+
+def test_ascii_stl_is_not_binary(tmp_path):
+    """ASCII files are not mistaken for binary files."""
+    stl_path = tmp_path / "ascii.stl"
+    _save_stl(stl_path, np.eye(3, dtype=np.float32)[None], Mode.ASCII)
+
+    assert binary_stl_facet_count(str(stl_path)) is None
+    with pytest.raises(ValueError, match="Not a binary STL file"):
+        read_binary_stl(str(stl_path))
+
+
+def test_truncated_stl_is_not_binary(tmp_path):
+    """A file shorter than its facet count claims is rejected."""
+    stl_path = tmp_path / "short.stl"
+    stl_path.write_bytes(bytes(80) + (2).to_bytes(4, "little") + bytes(50))
+
+    assert binary_stl_facet_count(str(stl_path)) is None
+
+
+def test_header_only_stl_is_not_binary(tmp_path):
+    """A file too short to hold a facet count is rejected."""
+    stl_path = tmp_path / "header.stl"
+    stl_path.write_bytes(bytes(80))
+
+    assert binary_stl_facet_count(str(stl_path)) is None
+
+
+def test_reader_falls_back_for_ascii(tmp_path):
+    """STLMeshReader reads ASCII files as well as binary files."""
+    stl_path = tmp_path / "ascii.stl"
+    vectors = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]], dtype=np.float32)
+    _save_stl(stl_path, vectors, Mode.ASCII)
+
+    vertices, faces = STLMeshReader().read(str(stl_path))
+
+    assert np.array_equal(vertices, vectors.reshape(-1, 3))
+    assert faces.tolist() == [[0, 1, 2]]
+
+
+def test_reader_falls_back_for_nonstandard_files(tmp_path, mocker):
+    """Files that are neither well-formed binary nor ASCII go to numpy-stl."""
+    stl_path = tmp_path / "odd.stl"
+    stl_path.write_bytes(b"not an stl file")
+    from_file = mocker.patch(
+        "thicker.adapters.stl_mesh_reader.mesh.Mesh.from_file",
+        return_value=mocker.Mock(vectors=np.zeros((1, 3, 3), dtype=np.float32)),
+    )
+
+    vertices, faces = STLMeshReader().read(str(stl_path))
+
+    from_file.assert_called_once_with(str(stl_path))
+    assert vertices.shape == (3, 3)
+    assert faces.tolist() == [[0, 1, 2]]
+
+
+def test_reader_missing_file():
+    """A missing file raises FileNotFoundError for the CLI to report."""
+    with pytest.raises(FileNotFoundError):
+        STLMeshReader().read("non_existent_file.stl")
+
+
+def test_facet_normals():
+    """Normals follow the right-hand rule and are unit length."""
+    triangles = np.array(
+        [
+            [[0, 0, 0], [2, 0, 0], [0, 2, 0]],
+            [[0, 0, 0], [0, 0, 3], [0, 3, 0]],
+        ],
+        dtype=np.float64,
+    )
+
+    normals = facet_normals(triangles)
+
+    assert np.allclose(normals, [[0, 0, 1], [-1, 0, 0]])
+
+
+def test_facet_normals_degenerate():
+    """A zero-area triangle gets a zero normal instead of NaN."""
+    triangles = np.array([[[1, 1, 1], [2, 2, 2], [3, 3, 3]]], dtype=np.float64)
+
+    normals = facet_normals(triangles)
+
+    assert np.array_equal(normals, [[0, 0, 0]])
+
+
+def test_write_binary_stl_round_trip(tmp_path):
+    """Indexed faces are expanded into triangles that numpy-stl reads back."""
+    stl_path = tmp_path / "quad.stl"
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    faces = np.array([[0, 1, 2], [0, 2, 3]])
+
+    write_binary_stl(str(stl_path), vertices, faces)
+
+    written = mesh.Mesh.from_file(str(stl_path))
+    assert np.array_equal(written.vectors, vertices[faces])
+    assert np.allclose(written.normals, [[0, 0, 1], [0, 0, 1]])
+    assert stl_path.stat().st_size == 84 + 50 * len(faces)
+    assert not stl_path.read_bytes().startswith(b"solid")
+
+
+def test_write_binary_stl_empty(tmp_path):
+    """An empty mesh is written as a header and a zero facet count."""
+    stl_path = tmp_path / "empty.stl"
+
+    write_binary_stl(str(stl_path), np.empty((0, 3)), np.empty((0, 3), dtype=np.intp))
+
+    assert binary_stl_facet_count(str(stl_path)) == 0
+
+
+def test_iter_binary_stl_chunks():
+    """Chunks cover every record in order, the last one possibly short."""
+    records = read_binary_stl(CYLINDER_STL)
+
+    chunks = list(iter_binary_stl_chunks(CYLINDER_STL, chunk_size=7))
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [7] * (len(chunks) - 1)
+    assert 0 < len(chunks[-1]) <= 7
+    assert np.array_equal(np.concatenate(chunks), records)
+
+
+def test_iter_binary_stl_chunks_rejects_bad_input(tmp_path):
+    """ASCII files and empty chunks cannot be streamed."""
+    stl_path = tmp_path / "ascii.stl"
+    _save_stl(stl_path, np.eye(3, dtype=np.float32)[None], Mode.ASCII)
+
+    with pytest.raises(ValueError, match="Not a binary STL file"):
+        next(iter_binary_stl_chunks(str(stl_path), chunk_size=7))
+    with pytest.raises(ValueError, match="Chunk size must be at least one."):
+        next(iter_binary_stl_chunks(CYLINDER_STL, chunk_size=0))
+
+
+def test_write_binary_stl_chunks_matches_whole_write(tmp_path):
+    """Writing in chunks produces the same bytes as writing at once."""
+    triangles = read_binary_stl(CYLINDER_STL)["vectors"].astype(np.float64)
+    vertices = triangles.reshape(-1, 3)
+    faces = np.arange(len(vertices)).reshape(-1, 3)
+    whole_path = tmp_path / "whole.stl"
+    chunked_path = tmp_path / "chunked.stl"
+
+    write_binary_stl(str(whole_path), vertices, faces)
+    count = write_binary_stl_chunks(
+        str(chunked_path), (triangles[i : i + 5] for i in range(0, len(triangles), 5))
+    )
+
+    assert count == len(triangles)
+    assert chunked_path.read_bytes() == whole_path.read_bytes()
+
+
+def test_read_binary_stl_stream_matches_file():
+    """A stream with part of its data already read gives the same records."""
+    with open(CYLINDER_STL, "rb") as stl_file:
+        data = stl_file.read()
+    stream = io.BytesIO(data)
+    prefix = stream.read(200)
+
+    records = read_binary_stl_stream(stream, prefix)
+
+    assert np.array_equal(records, read_binary_stl(CYLINDER_STL))
+
+
+@pytest.mark.parametrize(
+    ("size", "message"),
+    [(50, "ends inside its header"), (-1, "shorter"), (None, "longer")],
+)
+def test_read_binary_stl_stream_rejects_bad_lengths(size, message):
+    """The stream length must match the facet count in its header."""
+    with open(CYLINDER_STL, "rb") as stl_file:
+        data = stl_file.read()
+    data = data[:size] if size else data + b"extra"
+
+    with pytest.raises(ValueError, match=message):
+        read_binary_stl_stream(io.BytesIO(data))
+
+
+def test_read_binary_stl_stream_rejects_long_prefix():
+    """Bytes read ahead past the last record are extra data."""
+    header = bytes(80) + np.uint32(0).tobytes()
+
+    with pytest.raises(ValueError, match="longer"):
+        read_binary_stl_stream(io.BytesIO(), header + b"extra")
+
+
+def test_iter_binary_stl_stream_chunks():
+    """Stream chunks match the chunks read from the file."""
+    with open(CYLINDER_STL, "rb") as stl_file:
+        stream = io.BytesIO(stl_file.read())
+
+    chunks = list(iter_binary_stl_stream_chunks(stream, chunk_size=7))
+
+    assert np.array_equal(np.concatenate(chunks), read_binary_stl(CYLINDER_STL))
+    with pytest.raises(ValueError, match="Chunk size must be at least one."):
+        next(iter_binary_stl_stream_chunks(stream, chunk_size=0))
@@ -1,11 +1,9 @@
 """Test the file processor."""
 
-from typing import List, Tuple
-
 import numpy as np
-import pytest
+from stl import mesh
 
-from thicker.adapters.stl_mesh_reader import STLMeshReader, _convert_to_float
+from thicker.adapters.stl_mesh_reader import STLMeshReader
 
 
 def test_stl_mesh_reader_reads_valid_file(tmp_path):
@@ -19,47 +17,34 @@ def test_stl_mesh_reader_reads_valid_file(tmp_path):
     vertices, faces = reader.read(stl_filepath)
 
     # Assert: Verify expected output
-    assert isinstance(vertices, list)
-    assert all(isinstance(v, tuple) and len(v) == 3 for v in vertices)
-    assert isinstance(faces, list)
-    assert all(isinstance(f, tuple) and len(f) == 3 for f in faces)
-
+    assert isinstance(vertices, np.ndarray)
+    assert vertices.ndim == 2 and vertices.shape[1] == 3
+    assert np.issubdtype(vertices.dtype, np.floating)
+    assert isinstance(faces, np.ndarray)
+    assert faces.shape == (len(vertices) // 3, 3)
+    assert np.issubdtype(faces.dtype, np.integer)
 
-def test_convert_to_float_with_python_floats():
-    """Test conversion when input contains Python floats."""
-    vertices = [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]
-    result = _convert_to_float(vertices)
-    assert (
-        result == vertices
-    ), "Expected input to remain unchanged when already Python floats."
 
+def test_stl_mesh_reader_keeps_single_precision():
+    """Test the vertices keep the single precision coordinates of the file."""
+    stl_filepath = "tests/fixtures/test_cylinder.stl"
 
-def test_convert_to_float_with_numpy_floats():
-    """Test conversion when input contains NumPy float types."""
-    vertices = [(np.float32(1.0), np.float64(2.0), np.float32(3.0))]
-    expected = [(1.0, 2.0, 3.0)]
-    result = _convert_to_float(vertices)
-    assert result == expected, "Expected NumPy floats to be converted to Python floats."
-
+    vertices, _ = STLMeshReader().read(stl_filepath)
 
-def test_convert_to_float_with_mixed_types():
-    """Test conversion when input contains a mix of integers,
-    Python floats, and NumPy floats."""
-    vertices = [(1, 2.0, np.float32(3.0))]
-    expected = [(1.0, 2.0, 3.0)]
-    result = _convert_to_float(vertices)
-    assert result == expected, "Expected all values to be converted to Python floats."
+    assert vertices.dtype == np.float32
+    assert np.array_equal(
+        vertices, mesh.Mesh.from_file(stl_filepath).vectors.reshape(-1, 3)
+    )
 
 
-def test_convert_to_float_with_empty_input():
-    """Test conversion when input list is empty."""
-    vertices: List[Tuple] = []
-    result = _convert_to_float(vertices)
-    assert result == [], "Expected an empty list when input is empty."
+def test_stl_mesh_reader_welds_vertices():
+    """Test STLMeshReader can weld the triangle soup into an indexed mesh."""
+    stl_filepath = "tests/fixtures/test_cube.stl"
 
+    soup_vertices, soup_faces = STLMeshReader().read(stl_filepath)
+    vertices, faces = STLMeshReader(weld_tolerance=0).read(stl_filepath)
 
-def test_convert_to_float_with_invalid_input():
-    """Test conversion when input contains non-numeric types."""
-    vertices = [(1, "a", 3.0)]  # Contains a string
-    with pytest.raises(ValueError):
-        _convert_to_float(vertices)
+    assert len(vertices) == len(np.unique(soup_vertices, axis=0))
+    assert len(vertices) < len(soup_vertices)
+    assert len(faces) == len(soup_faces)
+    assert np.array_equal(vertices[faces], soup_vertices[soup_faces])
@@ -1,5 +1,7 @@
 """Test the file processor."""
 
+import numpy as np
+
 from thicker.adapters.stl_mesh_writer import STLMeshWriter
 
 
@@ -23,3 +25,17 @@ def test_stl_mesh_writer_writes_valid_file(tmp_path):
 
     written_mesh = mesh.Mesh.from_file(str(stl_filepath))
     assert len(written_mesh.vectors) == len(faces)
+
+
+def test_stl_mesh_writer_writes_arrays(tmp_path):
+    """Test STLMeshWriter writes array buffers that read back unchanged."""
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=float)
+    faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    stl_filepath = tmp_path / "tetrahedron.stl"
+
+    STLMeshWriter.write(str(stl_filepath), vertices, faces)
+
+    from stl import mesh
+
+    written_mesh = mesh.Mesh.from_file(str(stl_filepath))
+    assert np.array_equal(written_mesh.vectors, vertices[faces])
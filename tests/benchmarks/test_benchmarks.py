@@ -0,0 +1,109 @@
+"""Test the benchmark suite and its synthetic meshes."""
+
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks import compare, run_benchmarks
+from benchmarks.synthetic_meshes import PROFILES, generate_mesh
+from thicker.domain.cross_section_analysis import detect_narrow_cross_sections
+from thicker.domain.mesh import Mesh
+
+
+@pytest.mark.parametrize("shape", list(PROFILES))
+def test_synthetic_mesh_is_closed(shape):
+    """Every edge of a synthetic mesh is shared by exactly two triangles."""
+    vertices, faces = generate_mesh(shape, 2000)
+
+    edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    _, edge_counts = np.unique(edges, axis=0, return_counts=True)
+
+    assert abs(len(faces) - 2000) < 100
+    assert vertices.shape == (faces.max() + 1, 3)
+    assert set(edge_counts.tolist()) == {2}
+
+
+def test_figurine_has_narrow_sections():
+    """The figurine profile exercises the cross-section thickener."""
+    mesh = Mesh(*generate_mesh("figurine", 20000))
+
+    assert detect_narrow_cross_sections(mesh, run_benchmarks.NARROW_THRESHOLD)
+
+
+def test_unknown_shape():
+    """Only the named profiles can be generated."""
+    with pytest.raises(ValueError, match="Unknown shape: torus"):
+        generate_mesh("torus", 1000)
+
+
+def test_run_benchmarks_writes_json(tmp_path):
+    """Every benchmark runs and is saved with the run's metadata."""
+    output_path = tmp_path / "results.json"
+
+    run_benchmarks.main(
+        ["--shapes", "dome", "--sizes", "500", "--repeat", "2"]
+        + ["--output", str(output_path)]
+    )
+
+    document = json.loads(output_path.read_text())
+    assert set(document["metadata"]) >= {"commit", "recorded_at", "numpy"}
+    assert [result["benchmark"] for result in document["results"]] == [
+        "cli_startup",
+        "reader",
+        "writer",
+        "thicken_mesh",
+        "thicken_mesh_area_weighted",
+        "hemispherical_cylinder_transformation",
+        "parallel_transformation",
+        "detect_narrow_cross_sections",
+        "cross_section_thickener",
+        "slice_mesh",
+        "wall_thickness",
+    ]
+    assert all(result["repeat"] == 2 for result in document["results"])
+    assert document["results"][0]["shape"] == "cli"
+
+
+def test_slow_benchmarks_skip_large_meshes(tmp_path, monkeypatch):
+    """Benchmarks are left out for meshes above their triangle limit."""
+    monkeypatch.setitem(run_benchmarks.MAX_TRIANGLES, "wall_thickness", 100)
+    mesh = Mesh(*generate_mesh("dome", 500))
+
+    benchmarks = run_benchmarks.build_benchmarks(mesh, str(tmp_path))
+
+    assert "wall_thickness" not in benchmarks
+    assert "slice_mesh" in benchmarks
+
+
+def test_compare_flags_regressions(tmp_path):
+    """A benchmark slower than the tolerance allows fails the comparison."""
+
+    def save(name, seconds):
+        path = tmp_path / name
+        results = [
+            {
+                "shape": "dome",
+                "target_triangles": 500,
+                "benchmark": benchmark,
+                "best_seconds": best,
+            }
+            for benchmark, best in seconds.items()
+        ]
+        path.write_text(json.dumps({"metadata": {}, "results": results}))
+        return str(path)
+
+    baseline = save("old.json", {"reader": 1.0, "writer": 1.0})
+    candidate = save("new.json", {"reader": 1.05, "writer": 1.5})
+
+    rows = compare.compare_results(
+        compare.load_results(baseline), compare.load_results(candidate)
+    )
+    assert [(row["benchmark"], row["regressed"]) for row in rows] == [
+        ("reader", False),
+        ("writer", True),
+    ]
+    with pytest.raises(SystemExit) as exec_info_:
+        compare.main([baseline, candidate])
+    assert exec_info_.value.code == 1
+    compare.main([baseline, candidate, "--tolerance", "0.6"])
@@ -1,9 +1,16 @@
 """Test the CLI."""
 
+import io
+import json
 import sys
+import tracemalloc
 
+import numpy as np
 import pytest
 
+from thicker.adapters.ply_mesh import PLYMeshReader
+from thicker.adapters.stl_binary import STL_RECORD_DTYPE, read_binary_stl
+from thicker.adapters.stl_mesh_reader import STLMeshReader
 from thicker.cli.cli import main, parse_arguments
 
 
@@ -27,6 +34,45 @@ def test_parse_arguments_valid():
     assert args.offset == pytest.approx(2.0, 0.0001)
 
 
+def test_parse_arguments_weld_tolerance():
+    """
+    Test that the optional weld tolerance is parsed and defaults to None.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "2.0",
+    ]
+    sys.argv = test_args
+    assert parse_arguments().weld_tolerance is None
+    sys.argv = test_args + ["--weld-tolerance", "0.001"]
+    assert parse_arguments().weld_tolerance == pytest.approx(0.001)
+
+
+def test_main_negative_weld_tolerance():
+    """
+    Test that a negative weld tolerance raises ValueError in the main function.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "1.0",
+        "--weld-tolerance",
+        "-1",
+    ]
+    sys.argv = test_args
+    with pytest.raises(ValueError, match="Weld tolerance must be non-negative."):
+        main()
+
+
 def test_parse_arguments_missing_input():
     """
     Test that missing input file raises a SystemExit.
@@ -98,14 +144,14 @@ def test_main_valid_arguments(mocker):
     mock_reader = mocker.Mock(name="MockMeshReader")
     mock_writer = mocker.Mock(name="MockMeshWriter")
     _mock_reader_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshReader", return_value=mock_reader
+        "thicker.cli.commands.MeshFormatReader", return_value=mock_reader
     )
     _mock_writer_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshWriter", return_value=mock_writer
+        "thicker.cli.commands.MeshFormatWriter", return_value=mock_writer
     )
 
     # Mock the process_thickening use case
-    mock_process = mocker.patch("thicker.cli.cli.process_thickening")
+    mock_process = mocker.patch("thicker.cli.commands.process_thickening")
 
     main()
 
@@ -154,15 +200,15 @@ def test_main_input_file_not_found(mocker):
     mock_reader = mocker.Mock(name="MockMeshReader")
     mock_writer = mocker.Mock(name="MockMeshWriter")
     _mock_reader_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshReader", return_value=mock_reader
+        "thicker.cli.commands.MeshFormatReader", return_value=mock_reader
     )
     _mock_writer_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshWriter", return_value=mock_writer
+        "thicker.cli.commands.MeshFormatWriter", return_value=mock_writer
     )
 
     # Mock the process_thickening function to raise FileNotFoundError
     mock_process = mocker.patch(
-        "thicker.cli.cli.process_thickening",
+        "thicker.cli.commands.process_thickening",
         side_effect=FileNotFoundError,
     )
 
@@ -202,15 +248,15 @@ def test_main_unexpected_exception(mocker):
     mock_reader = mocker.Mock(name="MockMeshReader")
     mock_writer = mocker.Mock(name="MockMeshWriter")
     _mock_reader_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshReader", return_value=mock_reader
+        "thicker.cli.commands.MeshFormatReader", return_value=mock_reader
     )
     _mock_writer_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshWriter", return_value=mock_writer
+        "thicker.cli.commands.MeshFormatWriter", return_value=mock_writer
     )
 
     # Mock the process_thickening function to raise FileNotFoundError
     mock_process = mocker.patch(
-        "thicker.cli.cli.process_thickening",
+        "thicker.cli.commands.process_thickening",
         side_effect=Exception,
     )
 
@@ -229,3 +275,330 @@ def test_main_unexpected_exception(mocker):
         output_path="output.stl",
         offset=2.0,
     )
+
+
+def test_main_stream(mocker):
+    """
+    Test that --stream calls the streaming use case with the chunk size.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "2.0",
+        "--stream",
+        "--chunk-size",
+        "1000",
+    ]
+    sys.argv = test_args
+    mock_reader = mocker.Mock(name="MockMeshReader")
+    mock_writer = mocker.Mock(name="MockMeshWriter")
+    mocker.patch("thicker.cli.commands.STLMeshReader", return_value=mock_reader)
+    mocker.patch("thicker.cli.commands.STLMeshWriter", return_value=mock_writer)
+    mock_process = mocker.patch("thicker.cli.commands.process_thickening")
+    mock_stream = mocker.patch("thicker.cli.commands.process_thickening_streaming")
+
+    main()
+
+    mock_process.assert_not_called()
+    mock_stream.assert_called_once_with(
+        mock_reader,
+        mock_writer,
+        input_path="input.stl",
+        output_path="output.stl",
+        offset=2.0,
+        chunk_size=1000,
+    )
+
+
+def test_main_zero_chunk_size():
+    """
+    Test that a chunk size below one raises ValueError in the main function.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "2.0",
+        "--stream",
+        "--chunk-size",
+        "0",
+    ]
+    sys.argv = test_args
+    with pytest.raises(ValueError, match="Chunk size must be at least one."):
+        main()
+
+
+def test_main_jobs_transform_a_single_mesh_in_parallel(mocker):
+    """
+    Test that --jobs without --batch sets the workers of the use case.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "2.0",
+        "--jobs",
+        "4",
+    ]
+    sys.argv = test_args
+    mock_reader = mocker.Mock(name="MockMeshReader")
+    mock_writer = mocker.Mock(name="MockMeshWriter")
+    mocker.patch("thicker.cli.commands.MeshFormatReader", return_value=mock_reader)
+    mocker.patch("thicker.cli.commands.MeshFormatWriter", return_value=mock_writer)
+    mock_process = mocker.patch("thicker.cli.commands.process_thickening")
+
+    main()
+
+    mock_process.assert_called_once_with(
+        mock_reader,
+        mock_writer,
+        input_path="input.stl",
+        output_path="output.stl",
+        offset=2.0,
+        workers=4,
+    )
+
+
+def test_main_stream_rejects_welding():
+    """
+    Test that streaming cannot be combined with vertex welding.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "2.0",
+        "--stream",
+        "--weld-tolerance",
+        "0.01",
+    ]
+    sys.argv = test_args
+    with pytest.raises(ValueError, match="Streaming supports a single input"):
+        main()
+
+
+def test_main_stream_rejects_indexed_formats():
+    """
+    Test that streaming is limited to STL input and output.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.ply",
+        "--offset",
+        "2.0",
+        "--stream",
+    ]
+    sys.argv = test_args
+    with pytest.raises(ValueError, match="Streaming reads and writes STL files only."):
+        main()
+
+
+def test_main_converts_between_formats(tmp_path):
+    """
+    Test that the input and output formats follow the file extensions.
+    """
+    obj_path = tmp_path / "cylinder.obj"
+    sys.argv = [
+        "script_name",
+        "--input",
+        "tests/fixtures/test_cylinder.stl",
+        "--output",
+        str(obj_path),
+        "--offset",
+        "0.5",
+        "--weld-tolerance",
+        "0",
+    ]
+    main()
+    sys.argv = [
+        "script_name",
+        "--input",
+        str(obj_path),
+        "--output",
+        str(tmp_path / "cylinder.ply"),
+        "--offset",
+        "0.5",
+    ]
+
+    main()
+
+    vertices, faces = PLYMeshReader().read(str(tmp_path / "cylinder.ply"))
+    stl_vertices, stl_faces = STLMeshReader().read("tests/fixtures/test_cylinder.stl")
+    assert len(faces) == len(stl_faces)
+    assert len(vertices) < len(stl_vertices)
+    assert obj_path.read_text().startswith("# written by thicker-stl")
+
+
+def test_main_pipes_stdin_to_stdout(monkeypatch, capfdbinary):
+    """
+    Test that "-" reads stdin and writes stdout, with messages on stderr.
+    """
+    with open("tests/fixtures/test_cylinder.stl", "rb") as stl_file:
+        stdin = io.TextIOWrapper(io.BytesIO(stl_file.read()))
+    monkeypatch.setattr("sys.stdin", stdin)
+    sys.argv = ["script_name", "--input", "-", "--output", "-", "--offset", "0.5"]
+
+    main()
+
+    captured = capfdbinary.readouterr()
+    records = np.frombuffer(captured.out, STL_RECORD_DTYPE, -1, 84)
+    assert len(records) == len(read_binary_stl("tests/fixtures/test_cylinder.stl"))
+    assert b"Mesh height" in captured.err
+
+
+@pytest.mark.parametrize(
+    ("files", "options", "message"),
+    [
+        (["-", "out.stl"], ["--stream"], "Streaming needs an input file"),
+        (["in.stl", "out.stl.gz"], ["--stream"], "uncompressed output file"),
+        (["-", "out.stl"], ["--cache", "cache"], "The cache needs input and output"),
+        (["in.stl", "-"], ["--cache", "cache"], "not stdin or stdout"),
+    ],
+)
+def test_main_rejects_standard_streams(files, options, message):
+    """
+    Test that stdin, stdout and compressed files are refused where a mode
+    needs to reread or seek in a file.
+    """
+    sys.argv = [
+        "script_name",
+        "--input",
+        files[0],
+        "--output",
+        files[1],
+        "--offset",
+        "2.0",
+        *options,
+    ]
+    with pytest.raises(ValueError, match=message):
+        main()
+
+
+def test_main_metrics_json(tmp_path):
+    """
+    Test that --metrics-json writes a record for every stage of the run.
+    """
+    metrics_path = tmp_path / "metrics.json"
+    test_args = [
+        "script_name",
+        "--input",
+        "tests/fixtures/test_cylinder.stl",
+        "--output",
+        str(tmp_path / "output.stl"),
+        "--offset",
+        "0.5",
+        "--metrics-json",
+        str(metrics_path),
+    ]
+    sys.argv = test_args
+
+    main()
+
+    document = json.loads(metrics_path.read_text())
+    assert document["run"]["offset"] == 0.5
+    assert document["run"]["completed"] is True
+    assert [stage["stage"] for stage in document["stages"]] == [
+        "read",
+        "stats",
+        "transform",
+        "write",
+    ]
+    assert all(stage["peak_memory_bytes"] > 0 for stage in document["stages"])
+
+
+def test_main_metrics_json_after_failure(tmp_path, mocker):
+    """
+    Test that a failing run stops tracing and keeps its finished stages.
+    """
+    metrics_path = tmp_path / "metrics.json"
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "0.5",
+        "--metrics-json",
+        str(metrics_path),
+    ]
+    sys.argv = test_args
+
+    def fail_after_reading(*args, metrics, **kwargs):
+        with metrics.stage("read"):
+            pass
+        raise ValueError("Cannot thicken.")
+
+    mocker.patch(
+        "thicker.cli.commands.process_thickening", side_effect=fail_after_reading
+    )
+
+    with pytest.raises(SystemExit):
+        main()
+
+    assert not tracemalloc.is_tracing()
+    document = json.loads(metrics_path.read_text())
+    assert document["run"]["completed"] is False
+    assert [stage["stage"] for stage in document["stages"]] == ["read"]
+
+
+def test_main_cache(tmp_path, capsys):
+    """
+    Test that a second run with the same input is served from the cache.
+    """
+    cache_dir = tmp_path / "cache"
+    test_args = [
+        "script_name",
+        "--input",
+        "tests/fixtures/test_cylinder.stl",
+        "--offset",
+        "0.5",
+        "--cache",
+        str(cache_dir),
+    ]
+    sys.argv = test_args + ["--output", str(tmp_path / "first.stl")]
+    main()
+    sys.argv = test_args + ["--output", str(tmp_path / "second.stl")]
+
+    main()
+
+    assert "Using cached result" in capsys.readouterr().out
+    first = (tmp_path / "first.stl").read_bytes()
+    assert (tmp_path / "second.stl").read_bytes() == first
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_main_negative_cache_size():
+    """
+    Test that a negative cache size raises ValueError in the main function.
+    """
+    test_args = [
+        "script_name",
+        "--input",
+        "input.stl",
+        "--output",
+        "output.stl",
+        "--offset",
+        "2.0",
+        "--cache-max-size",
+        "-1",
+    ]
+    sys.argv = test_args
+    with pytest.raises(ValueError, match="Cache size must be non-negative."):
+        main()
@@ -0,0 +1,227 @@
+"""Test the CLI batch mode."""
+
+import shutil
+import sys
+
+import pytest
+
+from thicker.cli.batch import collect_batch_inputs, plan_batch_jobs, read_manifest
+from thicker.cli.cli import main
+from thicker.use_cases.batch_thickening import ThickeningJob
+
+
+@pytest.fixture
+def stl_dir(tmp_path):
+    """A directory with two STL files and one other file."""
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    shutil.copy("tests/fixtures/test_cylinder.stl", input_dir / "b.stl")
+    shutil.copy("tests/fixtures/test_cube.stl", input_dir / "a.STL")
+    (input_dir / "notes.txt").write_text("not a mesh")
+    return input_dir
+
+
+def test_collect_directory_of_mixed_formats(stl_dir):
+    """A directory yields OBJ, PLY and compressed files alongside STL files."""
+    (stl_dir / "c.obj").write_text("v 0 0 0\n")
+    (stl_dir / "d.ply").write_bytes(b"ply\n")
+    (stl_dir / "e.stl.gz").write_bytes(b"")
+
+    inputs = collect_batch_inputs(str(stl_dir))
+
+    assert [path.rsplit("/", 1)[1] for path in inputs] == [
+        "a.STL",
+        "b.stl",
+        "c.obj",
+        "d.ply",
+        "e.stl.gz",
+    ]
+
+
+def test_collect_directory(stl_dir):
+    """A directory yields its STL files in sorted order."""
+    assert collect_batch_inputs(str(stl_dir)) == [
+        str(stl_dir / "a.STL"),
+        str(stl_dir / "b.stl"),
+    ]
+
+
+def test_collect_glob(stl_dir):
+    """A glob pattern yields the matching files."""
+    assert collect_batch_inputs(str(stl_dir / "*.stl")) == [str(stl_dir / "b.stl")]
+
+
+def test_collect_manifest(stl_dir):
+    """A manifest lists inputs relative to its own directory."""
+    manifest = stl_dir / "manifest.txt"
+    manifest.write_text("# nightly figurines\nb.stl\n\n/abs/path/c.stl\n")
+
+    assert read_manifest(str(manifest)) == [str(stl_dir / "b.stl"), "/abs/path/c.stl"]
+    assert collect_batch_inputs(str(manifest)) == read_manifest(str(manifest))
+
+
+def test_collect_nothing(tmp_path):
+    """A source without inputs is an error."""
+    with pytest.raises(FileNotFoundError, match="No input files found for batch"):
+        collect_batch_inputs(str(tmp_path / "*.stl"))
+
+
+def test_collect_missing_source(tmp_path):
+    """A source that is not a directory, glob or file is an error."""
+    with pytest.raises(FileNotFoundError, match="No input files found for batch"):
+        collect_batch_inputs(str(tmp_path / "missing"))
+
+
+def test_plan_batch_jobs():
+    """Each input is written to the output directory under its own name."""
+    jobs = plan_batch_jobs(["in/a.stl", "other/b.stl"], "out")
+
+    assert jobs == [
+        ThickeningJob("in/a.stl", "out/a.stl"),
+        ThickeningJob("other/b.stl", "out/b.stl"),
+    ]
+
+
+def test_plan_batch_jobs_duplicate_names():
+    """Two inputs with the same name would overwrite each other."""
+    with pytest.raises(ValueError, match="share output names: a.stl"):
+        plan_batch_jobs(["in/a.stl", "other/a.stl"], "out")
+
+
+def test_main_batch(stl_dir, tmp_path, capsys):
+    """The CLI thickens every file of a batch and reports a summary."""
+    output_dir = tmp_path / "outputs"
+    sys.argv = [
+        "script_name",
+        "--batch",
+        str(stl_dir),
+        "--output",
+        str(output_dir),
+        "--offset",
+        "0.1",
+    ]
+
+    main()
+
+    assert (output_dir / "a.STL").exists()
+    assert (output_dir / "b.stl").exists()
+    assert "2 succeeded, 0 failed" in capsys.readouterr().out
+
+
+def test_main_batch_with_failure(stl_dir, tmp_path, capsys):
+    """One bad mesh is reported and makes the exit code non-zero."""
+    (stl_dir / "c.stl").write_bytes(b"not an stl file")
+    output_dir = tmp_path / "outputs"
+    sys.argv = [
+        "script_name",
+        "--batch",
+        str(stl_dir),
+        "--output",
+        str(output_dir),
+        "--offset",
+        "0.1",
+        "--jobs",
+        "2",
+    ]
+
+    with pytest.raises(SystemExit) as exec_info_:
+        main()
+
+    assert exec_info_.value.code == 1
+    captured = capsys.readouterr()
+    assert "2 succeeded, 1 failed" in captured.out
+    assert f"FAILED {stl_dir / 'c.stl'}" in captured.err
+    assert (output_dir / "b.stl").exists()
+
+
+def test_main_batch_no_inputs(tmp_path):
+    """A batch without inputs exits with code 2."""
+    sys.argv = [
+        "script_name",
+        "--batch",
+        str(tmp_path / "missing" / "*.stl"),
+        "--output",
+        str(tmp_path),
+        "--offset",
+        "0.1",
+    ]
+
+    with pytest.raises(SystemExit) as exec_info_:
+        main()
+
+    assert exec_info_.value.code == 2
+
+
+def test_main_rejects_input_and_batch():
+    """A single input and a batch cannot be combined."""
+    sys.argv = [
+        "script_name",
+        "--input",
+        "a.stl",
+        "--batch",
+        "meshes",
+        "--output",
+        "out",
+        "--offset",
+        "0.1",
+    ]
+
+    with pytest.raises(SystemExit):
+        main()
+
+
+def test_main_batch_rejects_metrics_json():
+    """Metrics are only recorded for a single input."""
+    sys.argv = [
+        "script_name",
+        "--batch",
+        "meshes",
+        "--output",
+        "out",
+        "--offset",
+        "0.1",
+        "--metrics-json",
+        "metrics.json",
+    ]
+
+    with pytest.raises(ValueError, match="Metrics are recorded for a single input"):
+        main()
+
+
+def test_main_rejects_zero_jobs():
+    """At least one worker process is needed."""
+    sys.argv = [
+        "script_name",
+        "--batch",
+        "meshes",
+        "--output",
+        "out",
+        "--offset",
+        "0.1",
+        "--jobs",
+        "0",
+    ]
+
+    with pytest.raises(ValueError, match="Number of jobs must be at least one."):
+        main()
+
+
+def test_main_batch_cache(stl_dir, tmp_path, capsys):
+    """A repeated batch takes every output from the cache."""
+    sys.argv = [
+        "script_name",
+        "--batch",
+        str(stl_dir),
+        "--output",
+        str(tmp_path / "outputs"),
+        "--offset",
+        "0.1",
+        "--cache",
+        str(tmp_path / "cache"),
+    ]
+    main()
+    capsys.readouterr()
+
+    main()
+
+    assert capsys.readouterr().out.count("(cached)") == 2
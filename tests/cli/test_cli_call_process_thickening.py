@@ -27,12 +27,12 @@ def test_cli_calls_process_thickening(mocker):
     mock_reader = mocker.Mock(name="MockMeshReader")
     mock_writer = mocker.Mock(name="MockMeshWriter")
     _mock_reader_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshReader", return_value=mock_reader
+        "thicker.cli.commands.MeshFormatReader", return_value=mock_reader
     )
     _mock_writer_cls = mocker.patch(
-        "thicker.cli.cli.STLMeshWriter", return_value=mock_writer
+        "thicker.cli.commands.MeshFormatWriter", return_value=mock_writer
     )
-    with patch("thicker.cli.cli.process_thickening", mock_process_thickening):
+    with patch("thicker.cli.commands.process_thickening", mock_process_thickening):
         with patch.object(sys, "argv", test_args):
             # Act: Call the CLI main function
             main()
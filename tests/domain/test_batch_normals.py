@@ -0,0 +1,139 @@
+"""Test the batched normal calculators."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from thicker.domain.mesh import Mesh
+from thicker.domain.transformations import (
+    as_batch_normal_calculator,
+    batched,
+    calculate_cylindrical_normal,
+    calculate_cylindrical_normals,
+    calculate_spherical_normal,
+    calculate_spherical_normals,
+    thicken_mesh,
+)
+
+
+@pytest.fixture
+def vertices():
+    """Vertices on and off the axes, including the origin."""
+    return np.array(
+        [
+            (0.0, 0.0, 0.0),
+            (0.0, 0.0, 2.0),
+            (3.0, 4.0, 0.0),
+            (3.0, 4.0, 5.0),
+            (-1.0, 2.0, -3.0),
+        ]
+    )
+
+
+def test_spherical_normals_match_per_vertex(vertices):
+    """Batched spherical normals match the per-vertex calculator."""
+    expected = [calculate_spherical_normal(tuple(v)) for v in vertices]
+
+    normals = calculate_spherical_normals(vertices)
+
+    assert normals.shape == vertices.shape
+    assert np.allclose(normals, expected)
+
+
+def test_cylindrical_normals_match_per_vertex(vertices):
+    """Batched cylindrical normals match the per-vertex calculator."""
+    expected = [calculate_cylindrical_normal(tuple(v)) for v in vertices]
+
+    normals = calculate_cylindrical_normals(vertices)
+
+    assert np.allclose(normals, expected)
+    assert np.array_equal(normals[1], [0.0, 0.0, 0.0])
+
+
+def test_cylindrical_normals_do_not_modify_input(vertices):
+    """The z-coordinates of the input are left alone."""
+    original = vertices.copy()
+
+    calculate_cylindrical_normals(vertices)
+
+    assert np.array_equal(vertices, original)
+
+
+def test_adapter_swaps_builtin_calculators():
+    """The built-in per-vertex calculators map to their batched forms."""
+    assert (
+        as_batch_normal_calculator(calculate_spherical_normal)
+        is calculate_spherical_normals
+    )
+    assert (
+        as_batch_normal_calculator(calculate_cylindrical_normal)
+        is calculate_cylindrical_normals
+    )
+
+
+def test_adapter_keeps_batched_calculators():
+    """Batched calculators are used as they are."""
+    assert (
+        as_batch_normal_calculator(calculate_spherical_normals)
+        is calculate_spherical_normals
+    )
+
+
+def test_adapter_wraps_per_vertex_callable(vertices):
+    """A custom per-vertex callable is called once per vertex."""
+    calls = []
+
+    def upward_normal(vertex):
+        calls.append(vertex)
+        return (0, 0, 1)
+
+    normals = as_batch_normal_calculator(upward_normal)(vertices)
+
+    assert len(calls) == len(vertices)
+    assert all(isinstance(vertex, tuple) for vertex in calls)
+    assert np.array_equal(normals, np.tile([0.0, 0.0, 1.0], (len(vertices), 1)))
+
+
+@dataclass
+class FixedNormal:
+    """An unhashable per-vertex calculator, as a mutable dataclass is."""
+
+    normal: tuple
+
+    def __call__(self, vertex):
+        return self.normal
+
+
+def test_adapter_wraps_unhashable_callable(vertices):
+    """Per-vertex callables need not be hashable."""
+    normals = as_batch_normal_calculator(FixedNormal((0, 1, 0)))(vertices)
+
+    assert np.array_equal(normals, np.tile([0.0, 1.0, 0.0], (len(vertices), 1)))
+
+
+def test_thicken_mesh_with_custom_batched_calculator():
+    """A batched calculator receives the whole vertex buffer once."""
+    calls = []
+
+    @batched
+    def upward_normals(vertices):
+        calls.append(vertices.shape)
+        return np.tile([0.0, 0.0, 1.0], (len(vertices), 1))
+
+    mesh = Mesh(vertices=[(0, 0, 0), (1, 0, 0), (0, 1, 0)], faces=[(0, 1, 2)])
+
+    thickened_mesh = thicken_mesh(mesh, 0.5, upward_normals)
+
+    assert calls == [(3, 3)]
+    assert thickened_mesh.vertices == [(0, 0, 0.5), (1, 0, 0.5), (0, 1, 0.5)]
+    assert thickened_mesh.faces == mesh.faces
+
+
+def test_thicken_mesh_empty():
+    """Thickening an empty mesh yields an empty mesh."""
+    thickened_mesh = thicken_mesh(
+        Mesh(vertices=[], faces=[]), 0.5, calculate_spherical_normal
+    )
+
+    assert thickened_mesh.vertex_array.shape == (0, 3)
@@ -1,6 +1,13 @@
 """Test cross-section analysis domain code."""
 
-from thicker.domain.cross_section_analysis import detect_narrow_cross_sections
+import numpy as np
+import pytest
+
+from thicker.domain.cross_section_analysis import (
+    detect_narrow_cross_sections,
+    detect_thin_wall_sections,
+)
+from thicker.domain.cross_section_thickening import CrossSectionThickener
 from thicker.domain.mesh import Mesh
 from thicker.domain.slice import Slice
 
@@ -30,8 +37,10 @@ def test_no_narrow_cross_sections_in_uniform_cylinder():
         (3, 7, 6),  # Side faces
         (3, 0, 7),
         (0, 4, 7),  # Side faces
-        (0, 1, 2, 3),  # Bottom cap
-        (4, 5, 6, 7),  # Top cap
+        (0, 1, 2),
+        (0, 2, 3),  # Bottom cap
+        (4, 5, 6),
+        (4, 6, 7),  # Top cap
     ]
 
     # Create the mesh
@@ -94,3 +103,110 @@ def test_detect_narrow_waist():
     assert (
         narrow_sections[0] == expected_slices[0]
     ), f"Expected narrow section at z=0.5, got {narrow_sections[0]}"
+
+
+def _reference_narrow_cross_sections(vertices, threshold, num_slices):
+    """The original one-scan-per-slice detection, for comparison."""
+    z_values = [z for _, _, z in vertices]
+    min_z = min(z_values)
+    slice_height = (max(z_values) - min_z) / num_slices
+    narrow_sections = []
+    for i in range(num_slices):
+        slice_z_min = min_z + i * slice_height
+        slice_z_max = slice_z_min + slice_height
+        slice_vertices = [
+            (x, y, z) for x, y, z in vertices if slice_z_min <= z < slice_z_max
+        ]
+        if not slice_vertices:
+            continue
+        max_radius = max((x**2 + y**2) ** 0.5 for x, y, _ in slice_vertices)
+        if max_radius < threshold:
+            narrow_sections.append(Slice(slice_vertices, slice_z_min))
+    return narrow_sections
+
+
+@pytest.mark.parametrize("num_slices", [1, 7, 100, 333])
+def test_binned_detection_matches_slice_scan(num_slices):
+    """
+    Test that single-pass binning finds the same slices as scanning the
+    vertices once per slice.
+    """
+    rng = np.random.default_rng(7)
+    heights = np.round(rng.uniform(0, 10, 2000), 2)
+    radii = 0.2 + np.abs(np.sin(heights))
+    angles = rng.uniform(0, 2 * np.pi, 2000)
+    vertices = np.column_stack(
+        [radii * np.cos(angles), radii * np.sin(angles), heights]
+    ).tolist()
+    mesh = Mesh(vertices=vertices, faces=[])
+
+    narrow_sections = detect_narrow_cross_sections(
+        mesh, threshold=0.6, num_slices=num_slices
+    )
+
+    expected = _reference_narrow_cross_sections(
+        [tuple(v) for v in vertices], 0.6, num_slices
+    )
+    assert narrow_sections == expected
+
+
+def test_flat_mesh_has_no_narrow_cross_sections():
+    """Test that a mesh with no height has no slices to analyze."""
+    mesh = Mesh(vertices=[(0.1, 0, 1), (0, 0.1, 1), (0, 0, 1)], faces=[(0, 1, 2)])
+
+    assert detect_narrow_cross_sections(mesh, threshold=0.5) == []
+
+
+def test_invalid_num_slices():
+    """Test that the number of slices must be positive."""
+    mesh = Mesh(vertices=[(0, 0, 0), (0, 0, 1), (0, 1, 1)], faces=[(0, 1, 2)])
+
+    with pytest.raises(ValueError, match="Number of slices must be at least one."):
+        detect_narrow_cross_sections(mesh, num_slices=0)
+
+
+def test_thin_wall_sections_group_thin_vertices_by_height():
+    """Vertices thinner than the minimum are gathered into their slices."""
+    vertices = [(1, 0, 0), (0, 1, 0), (1, 0, 5), (0, 1, 5), (1, 0, 10), (0, 1, 10)]
+    mesh = Mesh(vertices=vertices, faces=[(0, 1, 2), (2, 3, 4), (4, 5, 3)])
+    thickness = np.array([0.2, 3.0, np.inf, 0.1, 0.3, np.nan])
+
+    sections = detect_thin_wall_sections(mesh, thickness, 0.5, num_slices=2)
+
+    assert [s.indices.tolist() for s in sections] == [[0], [3, 4]]
+    assert [s.z_height for s in sections] == [0.0, 5.0]
+    assert sections[1].source is mesh.vertex_array
+
+
+def test_thin_wall_sections_drive_the_thickener():
+    """The thin-wall slices thicken only their own vertices."""
+    vertices = [(1, 0, 0), (-1, 0, 0), (2, 0, 1), (-2, 0, 1)]
+    mesh = Mesh(vertices=vertices, faces=[(0, 1, 2), (1, 3, 2)])
+    thickness = np.array([0.2, 0.2, 4.0, 4.0])
+
+    sections = detect_thin_wall_sections(mesh, thickness, 0.5, num_slices=4)
+    thickened = CrossSectionThickener(0.5, 0.25).thicken(mesh, sections)
+
+    assert thickened.vertices == [
+        (1.25, 0.0, 0.0),
+        (-1.25, 0.0, 0.0),
+        (2.0, 0.0, 1.0),
+        (-2.0, 0.0, 1.0),
+    ]
+
+
+def test_thin_wall_sections_of_a_flat_mesh():
+    """A flat mesh puts every thin vertex into one slice."""
+    mesh = Mesh(vertices=[(0.1, 0, 1), (0, 0.1, 1), (0, 0, 1)], faces=[(0, 1, 2)])
+
+    sections = detect_thin_wall_sections(mesh, np.array([0.1, 0.1, 1.0]), 0.5)
+
+    assert [s.indices.tolist() for s in sections] == [[0, 1]]
+
+
+def test_thin_wall_sections_need_a_slice():
+    """Test that the number of slices must be positive."""
+    mesh = Mesh(vertices=[(0, 0, 0), (0, 0, 1), (0, 1, 1)], faces=[(0, 1, 2)])
+
+    with pytest.raises(ValueError, match="Number of slices must be at least one."):
+        detect_thin_wall_sections(mesh, np.zeros(3), 0.5, num_slices=0)
@@ -2,7 +2,14 @@
 
 import math
 
-from thicker.domain.cross_section_thickening import thicken_cross_section
+import numpy as np
+
+from thicker.domain.cross_section_analysis import detect_narrow_cross_sections
+from thicker.domain.cross_section_thickening import (
+    CrossSectionThickener,
+    map_vertices_to_slices,
+    thicken_cross_section,
+)
 from thicker.domain.mesh import Mesh
 from thicker.domain.slice import Slice
 
@@ -108,3 +115,115 @@ def test_thicken_offset_cross_section():
     assert math.isclose(thickened_mesh.vertices[5][0], vertices[5][0], rel_tol=1e-5)
     assert math.isclose(thickened_mesh.vertices[5][1], vertices[5][1], rel_tol=1e-5)
     assert math.isclose(thickened_mesh.vertices[5][2], vertices[5][2], rel_tol=1e-5)
+
+
+def test_thicken_vertex_on_centroid():
+    """Test that a coordinate on the centroid is left in place."""
+    thickener = CrossSectionThickener(threshold=1.0, offset=0.3)
+
+    assert thickener.thicken_vertex((0.5, 0.2, 1.0), (0.5, 0.2)) == (0.5, 0.2, 1.0)
+    assert thickener.thicken_vertex((0.5, 0.0, 1.0), (0.0, 0.0)) == (0.8, 0.0, 1.0)
+
+
+def test_thicken_matches_per_vertex_thickening():
+    """
+    Test that the indexed thickening matches thicken_vertex applied to each
+    vertex of a detected narrow section.
+    """
+    rng = np.random.default_rng(8)
+    heights = rng.integers(0, 10, 500) / 10
+    vertices = np.column_stack([rng.uniform(-1, 1, (500, 2)), heights])
+    vertices[::7, :2] = 0.0  # Some vertices sit on the centroid axis
+    mesh = Mesh(vertices=vertices, faces=[])
+    narrow_slices = detect_narrow_cross_sections(mesh, threshold=2.0, num_slices=4)
+    thickener = CrossSectionThickener(threshold=1.0, offset=0.3)
+
+    thickened_mesh = thickener.thicken(mesh, narrow_slices)
+
+    expected = list(mesh.vertices)
+    for narrow_slice in narrow_slices:
+        centroid = narrow_slice.centroid()
+        for i, vertex in enumerate(mesh.vertices):
+            if vertex in narrow_slice.vertices:
+                expected[i] = thickener.thicken_vertex(vertex, centroid)
+    assert thickened_mesh.vertices == expected
+
+
+def test_vertex_in_two_slices_uses_first():
+    """Test that a vertex shared by two slices follows the first slice."""
+    vertices = [(1.0, 0.0, 0.5), (3.0, 0.0, 0.5), (-1.0, 0.0, 0.5)]
+    mesh = Mesh(vertices=vertices, faces=[])
+    first = Slice(vertices=[vertices[0], vertices[1]], z_height=0.5)
+    second = Slice(vertices=[vertices[0], vertices[2]], z_height=0.5)
+
+    thickened_mesh = thicken_cross_section(mesh, [first, second], 0.5)
+
+    # The first slice centroid is (2, 0), so vertex 0 moves in -x
+    assert thickened_mesh.vertices[0] == (0.5, 0.0, 0.5)
+    assert thickened_mesh.vertices[2] == (-1.5, 0.0, 0.5)
+
+
+def test_duplicate_vertices_are_thickened_alike():
+    """Test that every copy of a vertex in an unwelded mesh is thickened."""
+    vertices = [(1.0, 0.0, 0.5), (-1.0, 0.0, 0.5), (1.0, 0.0, 0.5)]
+    mesh = Mesh(vertices=vertices, faces=[])
+    narrow_slice = Slice(vertices=[vertices[0], vertices[1]], z_height=0.5)
+
+    thickened_mesh = thicken_cross_section(mesh, [narrow_slice], 0.25)
+
+    assert thickened_mesh.vertices[0] == thickened_mesh.vertices[2] == (1.25, 0, 0.5)
+
+
+def test_no_narrow_sections_leaves_mesh_unchanged():
+    """Test that a mesh without narrow sections is returned unchanged."""
+    mesh = Mesh(vertices=[(1.0, 0.0, 0.0), (0.0, 1.0, 1.0)], faces=[])
+
+    thickened_mesh = thicken_cross_section(mesh, [], 0.25)
+
+    assert thickened_mesh == mesh
+
+
+def test_detected_slices_map_by_index():
+    """Test that detected slices are mapped through the mesh's own buffer."""
+    vertices = [
+        (1.0, 0.0, 0.0),
+        (0.4, 0.0, 0.5),
+        (-0.4, 0.0, 0.5),
+        (1.0, 0.0, 1.0),
+        (-1.0, 0.0, 1.0),
+    ]
+    mesh = Mesh(vertices=vertices, faces=[])
+
+    narrow_slices = detect_narrow_cross_sections(mesh, threshold=0.5)
+
+    assert all(s.source is mesh.vertex_array for s in narrow_slices)
+    assert map_vertices_to_slices(mesh, narrow_slices).tolist() == [-1, 0, 0, -1, -1]
+
+
+def test_thicken_with_offset_array():
+    """Test that every vertex moves by its own entry of an offset array."""
+    vertices = [(1.0, 0.0, 0.5), (-1.0, 0.0, 0.5), (2.0, 0.0, 3.0)]
+    mesh = Mesh(vertices=vertices, faces=[])
+    narrow_slice = Slice(vertices=[vertices[0], vertices[1]], z_height=0.5)
+
+    thickened_mesh = thicken_cross_section(
+        mesh, [narrow_slice], np.array([0.25, 0.5, 9.0])
+    )
+
+    assert thickened_mesh.vertices == [
+        (1.25, 0.0, 0.5),
+        (-1.5, 0.0, 0.5),
+        (2.0, 0.0, 3.0),
+    ]
+
+
+def test_thicken_with_offset_field():
+    """Test that an offset field is evaluated over the mesh vertices."""
+    vertices = [(1.0, 0.0, 0.5), (-1.0, 0.0, 0.5)]
+    mesh = Mesh(vertices=vertices, faces=[])
+    narrow_slice = Slice(vertices=vertices, z_height=0.5)
+    thickener = CrossSectionThickener(1.0, lambda v: np.where(v[:, 0] > 0, 0.5, 0))
+
+    thickened_mesh = thickener.thicken(mesh, [narrow_slice])
+
+    assert thickened_mesh.vertices == [(1.5, 0.0, 0.5), (-1.0, 0.0, 0.5)]
@@ -108,3 +108,80 @@ def test_transform_hemispherical_vertex_slope(transformation):
     assert np.allclose(
         transformed_mesh.vertices[0], expected_vertex
     ), f"Expected {expected_vertex}, got {transformed_mesh.vertices[0]}"
+
+
+@pytest.fixture
+def random_vertices():
+    """Random vertices plus the zero-norm and boundary cases."""
+    rng = np.random.default_rng(608)
+    vertices = rng.uniform(-20, 20, size=(1000, 3))
+    special = np.array(
+        [
+            (0, 0, 5),  # On the axis in the cylinder: zero norm
+            (0, 0, 10),  # Hemisphere center on the boundary: zero norm
+            (3, 4, 10),  # On the boundary: cylindrical
+            (0, 0, 10.5),  # On the axis above the boundary
+        ],
+        dtype=float,
+    )
+    return np.vstack([vertices, special])
+
+
+def test_calculate_normals_compatible(transformation, random_vertices):
+    """The vectorized normals are within two ulp of the per-vertex normals:
+    the lengths may differ by one, and the division rounds again."""
+    expected = [transformation.calculate_normal(v) for v in random_vertices.tolist()]
+
+    normals = transformation.calculate_normals(random_vertices)
+
+    np.testing.assert_array_max_ulp(normals, np.array(expected, dtype=float), 2)
+    assert np.array_equal(normals[-4], [0, 0, 0])
+    assert np.array_equal(normals[-3], [0, 0, 0])
+
+
+@pytest.mark.parametrize("offset", [2, -0.7])
+def test_transform_compatible(transformation, random_vertices, offset):
+    """The vectorized transform is within one ulp of moving each vertex
+    along its per-vertex normal."""
+    expected = [
+        [c + offset * n for c, n in zip(v, transformation.calculate_normal(v))]
+        for v in random_vertices.tolist()
+    ]
+
+    transformed_mesh = transformation.transform(
+        Mesh(vertices=random_vertices, faces=[]), offset
+    )
+
+    np.testing.assert_array_max_ulp(transformed_mesh.vertex_array, expected, 1)
+
+
+def test_transform_single_precision_input(transformation):
+    """Float32 vertices are transformed in double precision."""
+    vertices = np.array([(3, 4, 5), (3, 4, 12)], dtype=np.float32)
+
+    transformed_mesh = transformation.transform(Mesh(vertices=vertices, faces=[]), 2)
+
+    assert transformed_mesh.vertex_array.dtype == np.float64
+    assert np.allclose(transformed_mesh.vertex_array[0], (3 + 6 / 5, 4 + 8 / 5, 5))
+
+
+def test_transform_with_offset_array(transformation, simple_mesh):
+    """Each vertex moves along its normal by its own offset."""
+    transformed = transformation.transform(simple_mesh, np.array([5.0, 1.0, 0.0]))
+
+    assert np.allclose(transformed.vertex_array, [(6, 8, 5), (0, 0, 13), (3, 4, 12)])
+
+
+def test_transform_vertices_with_offset_field(transformation, random_vertices):
+    """An offset field gives the same result as its values as an array."""
+
+    def field(vertices):
+        return 0.1 * vertices[:, 2]
+
+    expected = transformation.transform_vertices(
+        random_vertices, field(random_vertices)
+    )
+
+    assert np.array_equal(
+        transformation.transform_vertices(random_vertices, field), expected
+    )
@@ -1,6 +1,9 @@
 """Test the Mesh class."""
 
-from thicker.domain.mesh import Mesh
+import numpy as np
+import pytest
+
+from thicker.domain.mesh import Mesh, calculate_chunked_stats, calculate_stats
 
 
 def test_create_mesh():
@@ -49,3 +52,87 @@ def test_bad_class_eq():
     a_string = "moof"
 
     assert mesh != a_string
+
+
+def test_mesh_array_buffers():
+    """Test that a Mesh holds (N, 3) float vertices and (M, 3) int faces."""
+    vertices = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)]
+    faces = [(0, 1, 2), (1, 3, 2)]
+
+    mesh = Mesh(vertices=vertices, faces=faces)
+
+    assert mesh.vertex_array.shape == (4, 3)
+    assert np.issubdtype(mesh.vertex_array.dtype, np.floating)
+    assert mesh.face_array.shape == (2, 3)
+    assert np.issubdtype(mesh.face_array.dtype, np.integer)
+
+
+def test_mesh_from_arrays_does_not_copy():
+    """Test that float vertex and int face arrays are used without copying."""
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+    faces = np.array([[0, 1, 2]], dtype=np.int32)
+
+    mesh = Mesh(vertices=vertices, faces=faces)
+
+    assert np.shares_memory(mesh.vertex_array, vertices)
+    assert np.shares_memory(mesh.face_array, faces)
+
+
+def test_mesh_tuple_view():
+    """Test that the compatibility view yields tuples of Python numbers."""
+    mesh = Mesh(
+        vertices=np.array([[0.5, 1.5, 2.5], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+        faces=np.array([[0, 1, 2]]),
+    )
+
+    assert mesh.vertices == [(0.5, 1.5, 2.5), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+    assert all(type(coord) is float for coord in mesh.vertices[0])
+    assert mesh.faces == [(0, 1, 2)]
+    assert all(type(index) is int for index in mesh.faces[0])
+
+
+def test_mesh_view_setters():
+    """Test that assigning tuples to the views replaces the array buffers."""
+    mesh = Mesh(vertices=[], faces=[])
+
+    mesh.vertices = [(0, 0, 1), (1, 0, 1), (0, 1, 1)]
+    mesh.faces = [(0, 1, 2)]
+
+    assert mesh.vertex_array.shape == (3, 3)
+    assert mesh.face_array.tolist() == [[0, 1, 2]]
+
+
+def test_empty_mesh():
+    """Test that an empty Mesh has zero-length (N, 3) buffers."""
+    mesh = Mesh(vertices=[], faces=[])
+
+    assert mesh.vertex_array.shape == (0, 3)
+    assert mesh.face_array.shape == (0, 3)
+    assert not mesh.vertices
+
+
+def test_mesh_keeps_vertex_array_identity():
+    """Test that an (N, 3) float array becomes the vertex buffer itself."""
+    vertices = np.zeros((4, 3))
+
+    mesh = Mesh(vertices=vertices, faces=[])
+
+    assert mesh.vertex_array is vertices
+
+
+def test_chunked_stats_match_whole_stats():
+    """Stats gathered over chunks equal stats of the whole buffer."""
+    rng = np.random.default_rng(3)
+    vertices = rng.uniform(-2.0, 5.0, size=(1000, 3)).astype(np.float32)
+
+    stats = calculate_chunked_stats(
+        lambda: (vertices[i : i + 64] for i in range(0, len(vertices), 64)), 0.19
+    )
+
+    assert stats == calculate_stats(vertices, 0.19)
+
+
+def test_chunked_stats_empty():
+    """A stream without vertices has no dimensions."""
+    with pytest.raises(ValueError, match="Mesh contains no vertices."):
+        calculate_chunked_stats(lambda: iter([np.empty((0, 3))]), 0.19)
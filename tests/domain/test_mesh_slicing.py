@@ -0,0 +1,215 @@
+"""Test the planar cross-sections of meshes."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.mesh import Mesh
+from thicker.domain.mesh_slicing import MeshSections, section_heights, slice_mesh
+
+# A unit cube with outward-facing triangles
+CUBE_VERTICES = np.array(
+    [
+        (0, 0, 0),
+        (1, 0, 0),
+        (1, 1, 0),
+        (0, 1, 0),
+        (0, 0, 1),
+        (1, 0, 1),
+        (1, 1, 1),
+        (0, 1, 1),
+    ],
+    dtype=np.float64,
+)
+CUBE_FACES = np.array(
+    [
+        (0, 2, 1),
+        (0, 3, 2),  # Bottom
+        (4, 5, 6),
+        (4, 6, 7),  # Top
+        (0, 1, 5),
+        (0, 5, 4),  # Front
+        (1, 2, 6),
+        (1, 6, 5),  # Right
+        (2, 3, 7),
+        (2, 7, 6),  # Back
+        (3, 0, 4),
+        (3, 4, 7),  # Left
+    ]
+)
+
+
+def box(lower, upper, inward=False):
+    """The vertices and faces of an axis-aligned box."""
+    vertices = np.asarray(lower) + CUBE_VERTICES * (
+        np.asarray(upper) - np.asarray(lower)
+    )
+    faces = CUBE_FACES[:, ::-1] if inward else CUBE_FACES
+    return vertices, faces
+
+
+def shoelace(polygon):
+    """The signed area of a polygon's x-y outline."""
+    x, y = polygon[:, 0], polygon[:, 1]
+    return 0.5 * float(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y))
+
+
+def test_box_section_statistics():
+    """A box cut through its middle gives its rectangular footprint."""
+    vertices, faces = box((0, 0, 0), (2, 3, 1))
+
+    sections = MeshSections(vertices, faces, [0.5])
+
+    assert len(sections) == 1
+    np.testing.assert_allclose(sections.areas, [6.0])
+    np.testing.assert_allclose(sections.perimeters, [10.0])
+    np.testing.assert_allclose(sections.centroids, [[1.0, 1.5]])
+    assert sections.centroid(0) == pytest.approx((1.0, 1.5))
+
+
+def test_box_section_polygon():
+    """The section polygon is closed, counterclockwise and at the plane."""
+    vertices, faces = box((0, 0, 0), (2, 3, 1))
+
+    (polygon,) = MeshSections(vertices, faces, [0.5]).polygons(0)
+
+    assert polygon.shape == (8, 3)  # Two points on each side of the box
+    assert shoelace(polygon) == pytest.approx(6.0)
+    np.testing.assert_array_equal(polygon[:, 2], 0.5)
+    assert {tuple(point) for point in polygon[:, :2].tolist()} >= {
+        (0.0, 0.0),
+        (2.0, 0.0),
+        (2.0, 3.0),
+        (0.0, 3.0),
+    }
+
+
+def test_triangle_soup_section_polygon():
+    """Unshared corners, as read from an STL file, stitch like shared ones."""
+    vertices, faces = box((0, 0, 0), (2, 3, 1))
+    soup_vertices = vertices[faces].reshape(-1, 3)
+    soup_faces = np.arange(len(soup_vertices)).reshape(-1, 3)
+
+    (polygon,) = MeshSections(soup_vertices, soup_faces, [0.5]).polygons(0)
+    (indexed,) = MeshSections(vertices, faces, [0.5]).polygons(0)
+
+    np.testing.assert_array_equal(polygon, indexed)
+
+
+def test_planes_missing_the_mesh_are_empty():
+    """Planes below, at the bottom of and above a mesh enclose nothing."""
+    vertices, faces = box((0, 0, 0), (1, 1, 1))
+
+    sections = MeshSections(vertices, faces, [-1.0, 0.0, 2.0])
+
+    np.testing.assert_array_equal(sections.areas, [0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(sections.perimeters, [0.0, 0.0, 0.0])
+    assert np.isnan(sections.centroids).all()
+    assert sections.centroid(1) is None
+    assert sections.polygons(2) == []
+
+
+def test_planes_keep_their_order():
+    """Statistics are indexed like the planes, even when they are unsorted."""
+    vertices, faces = box((0, 0, 0), (1, 1, 1))
+    tall_vertices, tall_faces = box((5, 5, 0), (7, 7, 2))
+    vertices = np.vstack([vertices, tall_vertices])
+    faces = np.vstack([faces, tall_faces + 8])
+
+    sections = MeshSections(vertices, faces, [1.5, 0.5, 1.5])
+
+    np.testing.assert_allclose(sections.areas, [4.0, 5.0, 4.0])
+    assert sections.centroid(0) == pytest.approx((6.0, 6.0))
+    assert len(sections.polygons(1)) == 2
+
+
+def test_long_triangles_are_cut_between_their_vertices():
+    """A tall prism is cut at every plane, though no vertex lies near them."""
+    vertices = [
+        (0, 0, 0),
+        (3, 0, 0),
+        (0, 2, 0),
+        (0, 0, 10),
+        (3, 0, 10),
+        (0, 2, 10),
+    ]
+    faces = [
+        (0, 2, 1),
+        (3, 4, 5),
+        (0, 1, 4),
+        (0, 4, 3),
+        (1, 2, 5),
+        (1, 5, 4),
+        (2, 0, 3),
+        (2, 3, 5),
+    ]
+
+    sections = MeshSections(vertices, faces, section_heights(0, 10, 9))
+
+    np.testing.assert_allclose(sections.areas, 3.0)
+    np.testing.assert_allclose(sections.perimeters, 5 + np.sqrt(13))
+    np.testing.assert_allclose(sections.centroids, [[1.0, 2 / 3]] * 9)
+
+
+def test_vertices_on_the_plane():
+    """A plane through vertices cuts the triangles touching it from below."""
+    vertices = [
+        (1, 0, 0),
+        (0, 1, 0),
+        (-1, 0, 0),
+        (0, -1, 0),
+        (0, 0, 1),
+        (0, 0, -1),
+    ]
+    faces = [(i, (i + 1) % 4, 4) for i in range(4)]
+    faces += [((i + 1) % 4, i, 5) for i in range(4)]
+
+    sections = MeshSections(vertices, faces, [0.0])
+
+    np.testing.assert_allclose(sections.areas, [2.0])
+    np.testing.assert_allclose(sections.perimeters, [4 * np.sqrt(2)])
+    (polygon,) = sections.polygons(0)
+    assert len(polygon) == 4
+    assert shoelace(polygon) == pytest.approx(2.0)
+
+
+def test_holes_are_subtracted():
+    """An inward-facing inner shell cuts a clockwise hole in the section."""
+    outer_vertices, outer_faces = box((0, 0, 0), (4, 4, 1))
+    inner_vertices, inner_faces = box((1, 1, 0), (3, 3, 1), inward=True)
+    vertices = np.vstack([outer_vertices, inner_vertices])
+    faces = np.vstack([outer_faces, inner_faces + 8])
+
+    sections = MeshSections(vertices, faces, [0.5])
+
+    np.testing.assert_allclose(sections.areas, [12.0])
+    np.testing.assert_allclose(sections.perimeters, [24.0])
+    assert sections.centroid(0) == pytest.approx((2.0, 2.0))
+    areas = sorted(shoelace(polygon) for polygon in sections.polygons(0))
+    assert areas == pytest.approx([-4.0, 16.0])
+
+
+def test_open_chains_are_not_polygons():
+    """A section through a hole in the mesh leaves no closed polygon."""
+    vertices, faces = box((0, 0, 0), (1, 1, 1))
+    faces = np.delete(faces, [6, 7], axis=0)  # Remove the right side
+
+    sections = MeshSections(vertices, faces, [0.5])
+
+    assert sections.polygons(0) == []
+    np.testing.assert_allclose(sections.perimeters, [3.0])
+
+
+def test_slice_mesh():
+    """A mesh is sliced through its vertex and face buffers."""
+    vertices, faces = box((0, 0, 0), (2, 2, 2))
+
+    sections = slice_mesh(Mesh(vertices, faces), section_heights(0, 2, 4))
+
+    np.testing.assert_allclose(sections.z_values, [0.25, 0.75, 1.25, 1.75])
+    np.testing.assert_allclose(sections.areas, 4.0)
+
+
+def test_section_heights_needs_a_slice():
+    """Zero slices is an error."""
+    with pytest.raises(ValueError, match="at least one"):
+        section_heights(0.0, 1.0, 0)
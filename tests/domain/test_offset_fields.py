@@ -0,0 +1,75 @@
+"""Test offsets that vary from vertex to vertex."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.offset_fields import (
+    falloff_weights,
+    offset_column,
+    resolve_offsets,
+    thin_wall_offsets,
+)
+
+VERTICES = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 1.0), (2.0, 0.0, 2.0)])
+
+
+def test_single_offsets_pass_through():
+    """One distance is returned as it is, even from a field."""
+    assert resolve_offsets(0.5, VERTICES) == 0.5
+    assert resolve_offsets(lambda vertices: 0.25, VERTICES) == 0.25
+    assert offset_column(0.5, VERTICES) == 0.5
+
+
+def test_offset_arrays_and_fields():
+    """Arrays and fields give one double precision offset per vertex."""
+    offsets = resolve_offsets([1, 2, 3], VERTICES)
+    field_offsets = resolve_offsets(lambda vertices: vertices[:, 2] * 2, VERTICES)
+
+    assert offsets.dtype == np.float64
+    assert offsets.tolist() == [1.0, 2.0, 3.0]
+    assert field_offsets.tolist() == [0.0, 2.0, 4.0]
+    assert offset_column([1, 2, 3], VERTICES).shape == (3, 1)
+
+
+@pytest.mark.parametrize("offsets", [[1.0, 2.0], np.ones((3, 1))])
+def test_offsets_must_match_the_vertices(offsets):
+    """Anything but one offset per vertex is an error."""
+    with pytest.raises(ValueError, match="there are 3 vertices"):
+        resolve_offsets(offsets, VERTICES)
+
+
+def test_falloff_weights():
+    """Weights ease from 1 to 0 along a smoothstep curve."""
+    weights = falloff_weights([0.5, 1.0, 1.5, 2.0, 3.0, np.nan], 1.0, 2.0)
+
+    assert weights.tolist() == [1.0, 1.0, 0.5, 0.0, 0.0, 0.0]
+
+
+def test_falloff_must_have_width():
+    """An empty or reversed falloff range is an error."""
+    with pytest.raises(ValueError, match="end above"):
+        falloff_weights([1.0], 2.0, 2.0)
+
+
+def test_thin_wall_offsets_hard_cut():
+    """Without falloff only walls below the minimum are offset."""
+    thickness = [0.2, 1.0, 1.5, np.inf, np.nan]
+
+    offsets = thin_wall_offsets(thickness, 1.0, 0.4)
+
+    assert offsets.tolist() == [0.4, 0.0, 0.0, 0.0, 0.0]
+
+
+def test_thin_wall_offsets_ease_out():
+    """With falloff the offset blends into walls just above the minimum."""
+    thickness = [0.2, 1.0, 1.25, 1.5, np.inf, np.nan]
+
+    offsets = thin_wall_offsets(thickness, 1.0, 0.4, falloff=0.5)
+
+    assert offsets.tolist() == [0.4, 0.4, 0.2, 0.0, 0.0, 0.0]
+
+
+def test_thin_wall_offsets_need_non_negative_falloff():
+    """A negative falloff is an error."""
+    with pytest.raises(ValueError, match="non-negative"):
+        thin_wall_offsets([1.0], 1.0, 0.4, falloff=-0.1)
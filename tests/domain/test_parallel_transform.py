@@ -0,0 +1,127 @@
+"""Test transforming vertices over worker processes through shared memory."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.mesh import Mesh
+from thicker.domain.parallel_transform import ParallelTransformer
+from thicker.domain.transformations import (
+    HemisphericalCylinderTransformation,
+    calculate_cylindrical_normal,
+    calculate_spherical_normals,
+    thicken_mesh,
+    topological,
+)
+from thicker.domain.vertex_normals import calculate_vertex_normals
+
+TRANSFORMATION = HemisphericalCylinderTransformation(1.0, 1.0)
+
+
+def random_mesh(num_vertices=1000):
+    """Single precision vertices around a hemisphere-topped cylinder."""
+    rng = np.random.default_rng(3)
+    vertices = rng.uniform(-1.0, 2.0, size=(num_vertices, 3)).astype(np.float32)
+    faces = np.arange(num_vertices - num_vertices % 3).reshape(-1, 3)
+    return Mesh(vertices, faces)
+
+
+def failing_transform(vertices, offset):
+    """A transformation that always fails."""
+    raise ArithmeticError("Cannot transform.")
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+@pytest.mark.parametrize(
+    "offset",
+    [0.1, np.linspace(-0.1, 0.1, 1000), lambda vertices: vertices[:, 2] / 10],
+    ids=["single", "array", "field"],
+)
+def test_parallel_transform_matches_serial(workers, offset):
+    """Any number of workers gives the same vertices, bit for bit."""
+    mesh = random_mesh()
+    expected = TRANSFORMATION.transform(mesh, offset)
+
+    result = ParallelTransformer(workers, chunk_size=64).transform(
+        TRANSFORMATION, mesh, offset
+    )
+
+    np.testing.assert_array_equal(result.vertex_array, expected.vertex_array)
+    assert result.vertex_array.dtype == np.float64
+    assert result.face_array is mesh.face_array
+
+
+@pytest.mark.parametrize(
+    "normal_calculator",
+    [calculate_spherical_normals, calculate_cylindrical_normal],
+)
+def test_parallel_thicken_mesh_matches_serial(normal_calculator):
+    """Per-vertex and batched normals are calculated chunk by chunk."""
+    mesh = random_mesh()
+    offsets = np.linspace(0.0, 0.2, 1000)
+
+    with ParallelTransformer(2, chunk_size=100) as parallel:
+        result = parallel.thicken_mesh(mesh, offsets, normal_calculator)
+
+    np.testing.assert_array_equal(
+        result.vertex_array,
+        thicken_mesh(mesh, offsets, normal_calculator).vertex_array,
+    )
+
+
+def test_face_normals_run_in_this_process():
+    """Normals from the faces need the whole mesh, so are not split."""
+    mesh = random_mesh()
+    calculator = topological(
+        lambda vertices, faces: calculate_vertex_normals(vertices, faces)
+    )
+
+    result = ParallelTransformer(2, chunk_size=100).thicken_mesh(mesh, 0.1, calculator)
+
+    np.testing.assert_array_equal(
+        result.vertex_array, thicken_mesh(mesh, 0.1, calculator).vertex_array
+    )
+
+
+def test_one_pool_serves_many_calls():
+    """Within a with block every call shares one pool, shut down on exit."""
+    vertices = random_mesh().vertex_array
+    transform = TRANSFORMATION.transform_vertices
+
+    with ParallelTransformer(2, chunk_size=100) as parallel:
+        pool = parallel._executor
+        first = parallel.transform_vertices(transform, vertices, 0.1)
+        second = parallel.transform_vertices(transform, vertices[:500], 0.1)
+        assert parallel._executor is pool
+
+    assert parallel._executor is None
+    np.testing.assert_array_equal(first[:500], second)
+
+
+def test_chunks_cover_the_buffer():
+    """Chunks are contiguous, in order, and depend only on the chunk size."""
+    assert ParallelTransformer(4, chunk_size=3).chunks(8) == [(0, 3), (3, 6), (6, 8)]
+    assert ParallelTransformer(1, chunk_size=3).chunks(0) == []
+
+
+def test_worker_failures_are_raised():
+    """An error in a worker reaches the caller, who can carry on."""
+    vertices = random_mesh().vertex_array
+    parallel = ParallelTransformer(2, chunk_size=100)
+
+    with pytest.raises(ArithmeticError, match="Cannot transform"):
+        parallel.transform_vertices(failing_transform, vertices, np.ones(1000))
+
+    transformed = parallel.transform_vertices(
+        TRANSFORMATION.transform_vertices, vertices, 0.1
+    )
+    np.testing.assert_array_equal(
+        transformed, TRANSFORMATION.transform_vertices(vertices, 0.1)
+    )
+
+
+def test_transformer_validates_its_arguments():
+    """Worker counts and chunk sizes below one are errors."""
+    with pytest.raises(ValueError, match="workers"):
+        ParallelTransformer(0)
+    with pytest.raises(ValueError, match="Chunk size"):
+        ParallelTransformer(2, chunk_size=0)
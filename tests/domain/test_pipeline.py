@@ -0,0 +1,173 @@
+"""Test transformation pipelines over one vertex buffer."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from thicker.domain.cross_section_analysis import detect_narrow_cross_sections
+from thicker.domain.cross_section_thickening import CrossSectionThickener
+from thicker.domain.mesh import Mesh
+from thicker.domain.pipeline import (
+    CrossSectionStage,
+    HemisphericalCylinderStage,
+    OffsetStage,
+    Pipeline,
+    VertexBuffer,
+)
+from thicker.domain.transformations import (
+    HemisphericalCylinderTransformation,
+    batched,
+    calculate_spherical_normals,
+    thicken_mesh,
+    topological,
+)
+from thicker.domain.vertex_normals import calculate_vertex_normals
+
+
+def hourglass(rings=12, segments=16):
+    """A tube around the z-axis that narrows at half its height."""
+    heights = np.linspace(0.0, 4.0, rings)
+    radii = 1.0 - 0.8 * np.exp(-((heights - 2.0) ** 2))
+    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    vertices = np.column_stack(
+        [
+            np.outer(radii, np.cos(angles)).ravel(),
+            np.outer(radii, np.sin(angles)).ravel(),
+            np.repeat(heights, segments),
+        ]
+    )
+    faces = []
+    for ring in range(rings - 1):
+        for segment in range(segments):
+            a = ring * segments + segment
+            b = ring * segments + (segment + 1) % segments
+            faces += [(a, b, b + segments), (a, b + segments, a + segments)]
+    return Mesh(vertices, np.array(faces))
+
+
+THICKENER = CrossSectionThickener(threshold=0.5, offset=0.1)
+TRANSFORMATION = HemisphericalCylinderTransformation(3.0, 1.0)
+
+
+def chained(mesh):
+    """The stages of STAGES applied one transformation at a time."""
+    mesh = thicken_mesh(mesh, 0.1, calculate_spherical_normals)
+    mesh = THICKENER.thicken(mesh, detect_narrow_cross_sections(mesh, 0.5))
+    return TRANSFORMATION.transform(mesh, 0.05)
+
+
+STAGES = [
+    OffsetStage(0.1, calculate_spherical_normals),
+    CrossSectionStage(THICKENER),
+    HemisphericalCylinderStage(TRANSFORMATION, 0.05),
+]
+
+
+def test_pipeline_matches_chained_transformations():
+    """Running the stages over one buffer gives the same vertices, exactly."""
+    mesh = hourglass()
+
+    result = Pipeline(STAGES).run(mesh)
+
+    np.testing.assert_array_equal(result.vertex_array, chained(mesh).vertex_array)
+    assert result.face_array is mesh.face_array
+
+
+def test_copy_on_write_leaves_the_input_alone():
+    """The input vertices are copied once, on the first write."""
+    mesh = hourglass()
+    original = mesh.vertex_array.copy()
+    buffer = VertexBuffer(mesh.vertex_array)
+
+    for stage in STAGES:
+        stage(buffer, mesh.face_array)
+
+    np.testing.assert_array_equal(mesh.vertex_array, original)
+    assert buffer.copies == 1
+    assert buffer.array is not mesh.vertex_array
+
+
+def test_unchanged_vertices_are_not_copied():
+    """Stages that move nothing share the input's vertices."""
+    mesh = hourglass()
+    stages = [
+        OffsetStage(0.0, calculate_spherical_normals),
+        CrossSectionStage(THICKENER, detect=lambda mesh: []),
+    ]
+
+    result = Pipeline(stages).run(mesh)
+
+    assert result.vertex_array is mesh.vertex_array
+
+
+def test_in_place_writes_the_input_buffer():
+    """In place, the input mesh is transformed and its statistics refreshed."""
+    mesh = hourglass()
+    vertices = mesh.vertex_array
+    height = mesh.stats(0.1).height
+    expected = chained(hourglass()).vertex_array
+
+    result = Pipeline(STAGES, in_place=True).run(mesh)
+
+    assert result is mesh
+    assert mesh.vertex_array is vertices
+    np.testing.assert_array_equal(vertices, expected)
+    assert mesh.stats(0.1).height != height
+
+
+@pytest.mark.parametrize(
+    "vertices",
+    [
+        np.zeros((3, 3), dtype=np.float32),
+        np.broadcast_to(np.zeros(3), (3, 3)),
+    ],
+)
+def test_in_place_needs_a_writable_double_buffer(vertices):
+    """Single precision and read-only buffers cannot be written in place."""
+    mesh = Mesh(vertices, [(0, 1, 2)])
+
+    with pytest.raises(ValueError, match="writable float64"):
+        Pipeline(STAGES, in_place=True).run(mesh)
+
+
+def test_offset_stage_with_mesh_normals_and_offset_arrays():
+    """Face-based normal calculators and per-vertex offsets work as in
+    thicken_mesh."""
+    mesh = hourglass()
+    offsets = np.linspace(0.0, 0.2, len(mesh.vertex_array))
+    calculator = topological(
+        lambda vertices, faces: calculate_vertex_normals(vertices, faces)
+    )
+
+    result = Pipeline([OffsetStage(offsets, calculator)]).run(mesh)
+
+    np.testing.assert_array_equal(
+        result.vertex_array, thicken_mesh(mesh, offsets, calculator).vertex_array
+    )
+
+
+def test_normals_sharing_the_buffer_are_not_scaled_in_place():
+    """A calculator returning its own input does not corrupt the buffer."""
+    mesh = hourglass()
+    vertices = mesh.vertex_array.copy()
+
+    stage = OffsetStage(0.5, batched(lambda batch: batch))
+
+    result = Pipeline([stage], in_place=True).run(mesh)
+
+    np.testing.assert_array_equal(result.vertex_array, vertices * 1.5)
+
+
+def test_pipeline_peak_memory_stays_below_chaining():
+    """One buffer through every stage allocates less than a mesh per stage."""
+    mesh = hourglass(rings=200, segments=200)
+
+    def peak(transform):
+        tracemalloc.start()
+        transform(mesh)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    assert peak(Pipeline(STAGES).run) < peak(chained)
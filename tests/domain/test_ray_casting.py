@@ -0,0 +1,143 @@
+"""Test the bounding-volume hierarchy ray caster."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.ray_casting import BoundingVolumeHierarchy, morton_codes
+
+# One triangle in the z = 0 plane, facing up
+TRIANGLE_VERTICES = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+TRIANGLE_FACES = [(0, 1, 2)]
+
+
+def brute_force(vertices, faces, origins, directions):
+    """The nearest hit of every ray against every triangle, in a loop."""
+    nearest = np.full(len(origins), np.inf)
+    for ray, (origin, direction) in enumerate(zip(origins, directions)):
+        for a, b, c in vertices[faces]:
+            edge1, edge2 = b - a, c - a
+            p = np.cross(direction, edge2)
+            determinant = edge1 @ p
+            if determinant == 0:
+                continue
+            offset = origin - a
+            u = offset @ p / determinant
+            q = np.cross(offset, edge1)
+            v = direction @ q / determinant
+            distance = edge2 @ q / determinant
+            if u >= 0 and v >= 0 and u + v <= 1 and distance >= 0:
+                nearest[ray] = min(nearest[ray], distance)
+    return nearest
+
+
+def test_morton_codes_follow_the_corners():
+    """The lowest corner has code 0 and the highest has every bit set."""
+    points = np.array([(0.0, 0.0, 0.0), (1.0, 1.0, 1.0), (1.0, 0.0, 0.0)])
+
+    codes = morton_codes(points)
+
+    assert codes.tolist() == [0, (1 << 30) - 1, 0b100100100100100100100100100100]
+
+
+def test_ray_hits_a_triangle():
+    """A ray straight down through a triangle hits it at its height."""
+    hierarchy = BoundingVolumeHierarchy(TRIANGLE_VERTICES, TRIANGLE_FACES)
+
+    distances, triangles = hierarchy.intersect(
+        [(0.25, 0.25, 2.0), (2.0, 2.0, 2.0)], [(0, 0, -1), (0, 0, -1)]
+    )
+
+    np.testing.assert_array_equal(distances, [2.0, np.inf])
+    np.testing.assert_array_equal(triangles, [0, -1])
+
+
+def test_exits_only_ignores_front_faces():
+    """Only rays reaching a triangle from behind count as exits."""
+    hierarchy = BoundingVolumeHierarchy(TRIANGLE_VERTICES, TRIANGLE_FACES)
+    origins = [(0.25, 0.25, 1.0), (0.25, 0.25, -1.0)]
+    directions = [(0, 0, -1), (0, 0, 1)]
+
+    distances, _ = hierarchy.intersect(origins, directions, exits_only=True)
+
+    np.testing.assert_array_equal(distances, [np.inf, 1.0])
+
+
+def test_distance_limits():
+    """Hits outside [min_distance, max_distance] are ignored, per ray."""
+    hierarchy = BoundingVolumeHierarchy(TRIANGLE_VERTICES, TRIANGLE_FACES)
+    origins = [(0.25, 0.25, 2.0)] * 3
+
+    distances, _ = hierarchy.intersect(
+        origins, [(0, 0, -1)] * 3, min_distance=[0, 3, 0], max_distance=[3, 4, 1]
+    )
+
+    np.testing.assert_array_equal(distances, [2.0, np.inf, np.inf])
+
+
+def test_nearest_triangle_is_reported():
+    """Of a stack of triangles, the one nearest the ray origin is hit."""
+    vertices = np.array(TRIANGLE_VERTICES * 3, dtype=np.float64)
+    vertices[3:6, 2] = 1.0
+    vertices[6:, 2] = 2.0
+    faces = [(6, 7, 8), (0, 1, 2), (3, 4, 5)]
+    hierarchy = BoundingVolumeHierarchy(vertices, faces, leaf_size=1)
+
+    distances, triangles = hierarchy.intersect(
+        [(0.2, 0.2, 3.0), (0.2, 0.2, -1.0)], [(0, 0, -1), (0, 0, 1)]
+    )
+
+    np.testing.assert_array_equal(distances, [1.0, 1.0])
+    np.testing.assert_array_equal(triangles, [0, 1])
+
+
+def test_ray_through_a_shared_edge_hits():
+    """A ray along the diagonal shared by two triangles does not slip between."""
+    vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+    faces = [(0, 1, 2), (0, 2, 3)]
+    hierarchy = BoundingVolumeHierarchy(vertices, faces)
+    points = np.linspace(0.05, 0.95, 19)
+    origins = np.column_stack([points, points, np.full_like(points, 0.3)])
+
+    distances, _ = hierarchy.intersect(origins, np.tile([0.0, 0.0, -0.1], (19, 1)))
+
+    np.testing.assert_allclose(distances, 3.0)
+
+
+@pytest.mark.parametrize("leaf_size", [1, 3, 4])
+def test_matches_brute_force(leaf_size):
+    """Random rays against random triangles agree with testing every pair."""
+    rng = np.random.default_rng(7)
+    vertices = rng.uniform(-1, 1, size=(90, 3))
+    faces = np.arange(90).reshape(-1, 3)
+    origins = rng.uniform(-2, 2, size=(200, 3))
+    # Aim at triangle centres, some rays straight along the z-axis, which
+    # divide by zero in the slab tests
+    targets = vertices[faces].mean(axis=1)[rng.integers(0, 30, size=200)]
+    origins[:20, :2] = targets[:20, :2]
+    directions = targets - origins
+    hierarchy = BoundingVolumeHierarchy(vertices, faces, leaf_size=leaf_size)
+
+    distances, triangles = hierarchy.intersect(origins, directions)
+
+    expected = brute_force(vertices, faces, origins, directions)
+    np.testing.assert_allclose(distances, expected)
+    assert np.isfinite(expected).all()
+    assert (triangles >= 0).all()
+
+
+def test_bounds_cover_the_mesh():
+    """The root box is the bounding box of the triangles, barely padded."""
+    hierarchy = BoundingVolumeHierarchy(TRIANGLE_VERTICES, TRIANGLE_FACES)
+
+    lower, upper = hierarchy.bounds
+
+    np.testing.assert_allclose(lower, [0, 0, 0], atol=1e-8)
+    np.testing.assert_allclose(upper, [1, 1, 0], atol=1e-8)
+
+
+def test_hierarchy_needs_triangles():
+    """A mesh without triangles, or an empty leaf size, is an error."""
+    with pytest.raises(ValueError, match="no triangles"):
+        BoundingVolumeHierarchy(TRIANGLE_VERTICES, np.empty((0, 3), dtype=int))
+    with pytest.raises(ValueError, match="Leaf size"):
+        BoundingVolumeHierarchy(TRIANGLE_VERTICES, TRIANGLE_FACES, leaf_size=0)
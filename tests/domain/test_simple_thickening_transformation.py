@@ -1,9 +1,14 @@
 """Test a simple thickening transformation."""
 
+import numpy as np
 import pytest
 
 from thicker.domain.mesh import Mesh
-from thicker.domain.transformations import calculate_spherical_normal, thicken_mesh
+from thicker.domain.transformations import (
+    calculate_spherical_normal,
+    calculate_spherical_normals,
+    thicken_mesh,
+)
 
 
 @pytest.mark.parametrize("offset", [0.1, 0, -0.2])
@@ -73,3 +78,37 @@ def test_thicken_mesh_functional_equivalence():
     # Assert: Verify the thickened vertices match expectations
     assert thickened_mesh.vertices == expected_vertices
     assert thickened_mesh.faces == input_mesh.faces, "Faces should remain unchanged"
+
+
+def test_thickening_with_offset_array():
+    """Test that each vertex moves by its own offset along its normal."""
+    mesh = Mesh(vertices=[(0, 0, 1), (2, 0, 0), (0, 3, 0)], faces=[(0, 1, 2)])
+
+    thickened_mesh = thicken_mesh(
+        mesh, np.array([0.5, 0.0, -1.0]), calculate_spherical_normals
+    )
+
+    assert thickened_mesh.vertices == [(0, 0, 1.5), (2, 0, 0), (0, 2, 0)]
+
+
+def test_thickening_with_offset_field():
+    """Test that an offset field is evaluated once over the vertex array."""
+    mesh = Mesh(vertices=[(0, 0, 1), (2, 0, 0), (0, 3, 0)], faces=[(0, 1, 2)])
+    calls = []
+
+    def grow_high_vertices(vertices):
+        calls.append(len(vertices))
+        return np.where(vertices[:, 2] > 0.5, 1.0, 0.0)
+
+    thickened_mesh = thicken_mesh(mesh, grow_high_vertices, calculate_spherical_normal)
+
+    assert thickened_mesh.vertices == [(0, 0, 2), (2, 0, 0), (0, 3, 0)]
+    assert calls == [3]
+
+
+def test_thickening_rejects_mismatched_offsets():
+    """Test that an offset array must have one entry per vertex."""
+    mesh = Mesh(vertices=[(0, 0, 1), (2, 0, 0), (0, 3, 0)], faces=[(0, 1, 2)])
+
+    with pytest.raises(ValueError, match="3 vertices"):
+        thicken_mesh(mesh, np.array([0.5, 0.5]), calculate_spherical_normals)
@@ -2,6 +2,9 @@
 
 import math
 
+import numpy as np
+import pytest
+
 from thicker.domain.slice import Slice
 
 
@@ -225,3 +228,56 @@ def test_bad_class_eq():
     a_string = "moof"
 
     assert a_slice != a_string
+
+
+def test_slice_from_indices_shares_parent_buffer():
+    """A Slice built from indices holds no copy of the parent's vertices."""
+    mesh_vertices = np.array(
+        [(5.0, 5.0, 0.0), (1.0, 0.0, 0.5), (0.0, 2.0, 0.5), (5.0, 5.0, 1.0)]
+    )
+
+    slice_obj = Slice.from_indices(mesh_vertices, [1, 2], z_height=0.5)
+
+    assert slice_obj.source is mesh_vertices
+    assert slice_obj.indices.tolist() == [1, 2]
+    assert slice_obj.vertices == [(1.0, 0.0, 0.5), (0.0, 2.0, 0.5)]
+    assert slice_obj == Slice(vertices=[(1.0, 0.0, 0.5), (0.0, 2.0, 0.5)], z_height=0.5)
+
+
+def test_slice_statistics():
+    """The radius and bounding box statistics describe the slice's vertices."""
+    mesh_vertices = np.array(
+        [(9.0, 9.0, 9.0), (3.0, 4.0, 0.5), (0.0, -1.0, 0.6), (-2.0, 0.0, 0.4)]
+    )
+
+    slice_obj = Slice.from_indices(mesh_vertices, [1, 2, 3], z_height=0.4)
+
+    assert slice_obj.centroid() == (1 / 3, 1.0)
+    assert slice_obj.max_radius == 5.0
+    assert slice_obj.min_radius == 1.0
+    assert slice_obj.bounding_box == ((-2.0, -1.0, 0.4), (3.0, 4.0, 0.6))
+
+
+def test_slice_statistics_are_cached():
+    """The statistics are computed once and then reused."""
+    mesh_vertices = np.array([(0.0, 0.0, 0.5), (2.0, 2.0, 0.5)])
+    slice_obj = Slice.from_indices(mesh_vertices, [0, 1], z_height=0.5)
+
+    assert slice_obj.centroid() == (1.0, 1.0)
+    assert slice_obj.min_radius == 0.0
+    mesh_vertices[:] = 10.0
+
+    assert slice_obj.centroid() == (1.0, 1.0)
+    assert slice_obj.min_radius == 0.0
+
+
+def test_slice_statistics_empty():
+    """Radius and bounding box statistics need at least one vertex."""
+    slice_obj = Slice(vertices=[], z_height=0.5)
+
+    with pytest.raises(ValueError, match="Slice contains no vertices."):
+        _ = slice_obj.max_radius
+    with pytest.raises(ValueError, match="Slice contains no vertices."):
+        _ = slice_obj.min_radius
+    with pytest.raises(ValueError, match="Slice contains no vertices."):
+        _ = slice_obj.bounding_box
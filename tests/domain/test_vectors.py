@@ -0,0 +1,14 @@
+"""Test the shared vector helpers."""
+
+import numpy as np
+
+from thicker.domain.vectors import unit_vectors
+
+
+def test_unit_vectors():
+    """Rows are scaled to unit length, and zero rows stay zero."""
+    vectors = np.array([(3.0, 4.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, -2.0)])
+
+    result = unit_vectors(vectors)
+
+    assert result.tolist() == [[0.6, 0.8, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, -1.0]]
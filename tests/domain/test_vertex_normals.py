@@ -0,0 +1,137 @@
+"""Test the area-weighted vertex normals."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.mesh import Mesh
+from thicker.domain.transformations import thicken_mesh
+from thicker.domain.vertex_normals import (
+    calculate_area_weighted_normals,
+    calculate_corner_angles,
+    calculate_face_normals,
+    calculate_vertex_normals,
+)
+from thicker.domain.welding import weld_vertices
+
+SQUARE_VERTICES = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+SQUARE_FACES = [(0, 1, 2), (0, 2, 3)]
+
+
+def test_face_normals_are_area_weighted():
+    """Face normals follow the right-hand rule with twice the face area."""
+    vertices = [(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 3.0, 0.0)]
+
+    normals = calculate_face_normals(vertices, [(0, 1, 2), (0, 2, 1)])
+
+    assert np.array_equal(normals, [[0.0, 0.0, 6.0], [0.0, 0.0, -6.0]])
+
+
+def test_flat_square_normals():
+    """Every vertex of a flat square faces along the square's normal."""
+    normals = calculate_vertex_normals(SQUARE_VERTICES, SQUARE_FACES)
+
+    assert np.allclose(normals, [(0.0, 0.0, 1.0)] * 4)
+
+
+def test_larger_faces_weigh_more():
+    """A shared vertex leans towards the normal of the larger face."""
+    vertices = [
+        (0.0, 0.0, 0.0),
+        (3.0, 0.0, 0.0),
+        (0.0, 3.0, 0.0),  # A 4.5 area triangle facing +z
+        (0.0, 0.0, -1.0),
+        (1.0, 0.0, 0.0),  # A 0.5 area triangle facing -y
+    ]
+    faces = [(0, 1, 2), (0, 3, 4)]
+
+    normals = calculate_vertex_normals(vertices, faces)
+
+    expected = np.array([0.0, -0.5, 4.5]) / np.hypot(0.5, 4.5)
+    assert np.allclose(normals[0], expected)
+
+
+def test_corner_angles():
+    """A right isosceles triangle has one right angle; a degenerate one has none."""
+    vertices = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+
+    angles = calculate_corner_angles(vertices, [(0, 1, 2), (0, 0, 1)])
+
+    assert np.allclose(angles[0], [np.pi / 2, np.pi / 4, np.pi / 4])
+    assert np.array_equal(angles[1], [0.0, 0.0, 0.0])
+
+
+def test_angle_weighted_normals_ignore_face_size():
+    """Weighted by corner angle, the small face counts as much as the large one."""
+    vertices = [
+        (0.0, 0.0, 0.0),
+        (3.0, 0.0, 0.0),
+        (0.0, 3.0, 0.0),  # A right angle at vertex 0, facing +z
+        (0.0, 0.0, -1.0),
+        (1.0, 0.0, 0.0),  # A right angle at vertex 0, facing -y
+    ]
+    faces = [(0, 1, 2), (0, 3, 4)]
+
+    normals = calculate_vertex_normals(vertices, faces, angle_weighted=True)
+
+    assert np.allclose(normals[0], np.array([0.0, -1.0, 1.0]) / np.sqrt(2))
+
+
+def test_unwelded_corners_share_normals():
+    """Duplicate STL corners get the normal of the welded vertex."""
+    soup_vertices = np.array(SQUARE_VERTICES)[np.array(SQUARE_FACES)].reshape(-1, 3)
+    soup_faces = np.arange(6).reshape(-1, 3)
+    welded_vertices, welded_faces = weld_vertices(soup_vertices, soup_faces)
+
+    soup_normals = calculate_vertex_normals(soup_vertices, soup_faces)
+    welded_normals = calculate_vertex_normals(welded_vertices, welded_faces)
+
+    assert np.allclose(soup_normals, welded_normals[welded_faces.ravel()])
+
+
+def test_unwelded_normals_without_welding():
+    """Without welding each corner keeps its own face's normal."""
+    vertices = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)] * 2
+    faces = [(0, 1, 2), (3, 5, 4)]
+
+    normals = calculate_vertex_normals(vertices, faces, weld_tolerance=None)
+
+    assert np.allclose(normals[:3], [(0.0, 0.0, 1.0)] * 3)
+    assert np.allclose(normals[3:], [(0.0, 0.0, -1.0)] * 3)
+
+
+def test_closed_tetrahedron_normals_point_outwards():
+    """The corners of a regular tetrahedron, stored as STL does, face outwards."""
+    corners = np.array([(1, 1, 1), (1, -1, -1), (-1, 1, -1), (-1, -1, 1)], float)
+    faces = np.array([(0, 1, 2), (0, 3, 1), (0, 2, 3), (1, 3, 2)])
+    soup_vertices = corners[faces].reshape(-1, 3)
+    soup_faces = np.arange(12).reshape(-1, 3)
+
+    normals = calculate_vertex_normals(soup_vertices, soup_faces)
+
+    assert np.allclose(normals, soup_vertices / np.sqrt(3))
+
+
+def test_vertex_without_faces():
+    """A vertex used by no face has a zero normal."""
+    vertices = SQUARE_VERTICES + [(5.0, 5.0, 5.0)]
+
+    normals = calculate_vertex_normals(vertices, SQUARE_FACES)
+
+    assert np.array_equal(normals[4], [0.0, 0.0, 0.0])
+
+
+def test_thicken_mesh_with_area_weighted_normals():
+    """thicken_mesh passes the faces to the area-weighted strategy."""
+    mesh = Mesh(SQUARE_VERTICES, SQUARE_FACES)
+
+    thickened_mesh = thicken_mesh(mesh, 0.25, calculate_area_weighted_normals)
+
+    expected = np.array(SQUARE_VERTICES) + (0.0, 0.0, 0.25)
+    assert np.allclose(thickened_mesh.vertex_array, expected)
+    assert np.array_equal(thickened_mesh.face_array, mesh.face_array)
+
+
+def test_negative_weld_tolerance():
+    """A negative weld tolerance is rejected."""
+    with pytest.raises(ValueError, match="Weld tolerance must be non-negative."):
+        calculate_vertex_normals(SQUARE_VERTICES, SQUARE_FACES, weld_tolerance=-1.0)
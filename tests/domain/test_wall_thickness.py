@@ -0,0 +1,155 @@
+"""Test the wall thickness analysis."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.mesh import Mesh
+from thicker.domain.wall_thickness import measure_wall_thickness, thin_regions
+
+
+def sphere(radius, rings=16, segments=24, inward=False):
+    """The vertices and faces of a closed UV sphere around the origin."""
+    polar = np.linspace(0, np.pi, rings + 1)[1:-1]
+    azimuth = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    grid_polar, grid_azimuth = np.meshgrid(polar, azimuth, indexing="ij")
+    ring_vertices = np.column_stack(
+        [
+            (np.sin(grid_polar) * np.cos(grid_azimuth)).ravel(),
+            (np.sin(grid_polar) * np.sin(grid_azimuth)).ravel(),
+            np.cos(grid_polar).ravel(),
+        ]
+    )
+    vertices = radius * np.vstack([ring_vertices, [(0, 0, 1), (0, 0, -1)]])
+    north, south = len(ring_vertices), len(ring_vertices) + 1
+
+    faces = []
+    for ring in range(rings - 1):
+        for segment in range(segments):
+            a = ring * segments + segment
+            b = ring * segments + (segment + 1) % segments
+            if ring < rings - 2:
+                faces += [(a, a + segments, b), (b, a + segments, b + segments)]
+            if ring == 0:
+                faces.append((north, a, b))
+            if ring == rings - 2:
+                faces.append((south, b, a))
+    faces = np.array(faces)
+    return vertices, faces[:, ::-1] if inward else faces
+
+
+def hollow_sphere(outer, inner):
+    """A spherical shell: an outward outer surface and an inward inner one."""
+    outer_vertices, outer_faces = sphere(outer)
+    inner_vertices, inner_faces = sphere(inner, inward=True)
+    vertices = np.vstack([outer_vertices, inner_vertices])
+    faces = np.vstack([outer_faces, inner_faces + len(outer_vertices)])
+    return vertices, faces
+
+
+def soup(vertices, faces):
+    """The same mesh with every triangle corner stored separately, as in STL."""
+    return vertices[faces].reshape(-1, 3), np.arange(faces.size).reshape(-1, 3)
+
+
+def test_shell_thickness():
+    """Every vertex of a spherical shell measures the gap between its surfaces."""
+    mesh = Mesh(*hollow_sphere(2.0, 1.5))
+
+    thickness = measure_wall_thickness(mesh)
+
+    np.testing.assert_allclose(thickness, 0.5, atol=0.05)
+
+
+def test_solid_thickness_is_the_diameter():
+    """The rays of a solid sphere cross it through its centre."""
+    mesh = Mesh(*sphere(1.0))
+
+    thickness = measure_wall_thickness(mesh)
+
+    np.testing.assert_allclose(thickness, 2.0, atol=0.05)
+
+
+def test_walls_past_the_limit_are_not_measured():
+    """Walls thicker than max_thickness are reported as infinite."""
+    mesh = Mesh(*sphere(1.0))
+
+    thickness = measure_wall_thickness(mesh, max_thickness=1.0)
+
+    assert np.isinf(thickness).all()
+
+
+def test_batches_and_workers_agree():
+    """Splitting the rays into batches over threads changes nothing."""
+    mesh = Mesh(*hollow_sphere(2.0, 1.5))
+
+    expected = measure_wall_thickness(mesh)
+
+    np.testing.assert_array_equal(
+        measure_wall_thickness(mesh, batch_size=37, workers=3), expected
+    )
+
+
+def test_triangle_soup_matches_indexed_mesh():
+    """Unwelded corners cast one ray per position and share its thickness."""
+    vertices, faces = hollow_sphere(2.0, 1.5)
+
+    thickness = measure_wall_thickness(Mesh(*soup(vertices, faces)))
+
+    np.testing.assert_allclose(
+        thickness, measure_wall_thickness(Mesh(vertices, faces))[faces.ravel()]
+    )
+
+
+def test_vertices_without_normals_are_nan():
+    """A vertex outside every face has no inward direction to measure."""
+    vertices, faces = sphere(1.0)
+    vertices = np.vstack([vertices, [(5.0, 5.0, 5.0)]])
+
+    thickness = measure_wall_thickness(Mesh(vertices, faces))
+
+    assert np.isnan(thickness[-1])
+    assert np.isfinite(thickness[:-1]).all()
+
+
+def test_open_meshes_let_rays_escape():
+    """Rays that leave through a hole in the mesh find no wall."""
+    vertices, faces = sphere(1.0)
+    faces = faces[(vertices[faces][:, :, 2] > 0).all(axis=1)]  # A northern bowl
+
+    thickness = measure_wall_thickness(Mesh(vertices, faces))
+
+    assert np.isinf(thickness).any()
+
+
+def test_measure_validates_its_arguments():
+    """Batch sizes and worker counts below one are errors."""
+    mesh = Mesh(*sphere(1.0))
+    with pytest.raises(ValueError, match="Batch size"):
+        measure_wall_thickness(mesh, batch_size=0)
+    with pytest.raises(ValueError, match="workers"):
+        measure_wall_thickness(mesh, workers=0)
+
+
+def test_thin_regions_are_connected_patches():
+    """Each thin surface is one region; thick walls are left out."""
+    thin_vertices, thin_faces = hollow_sphere(2.0, 1.8)
+    thick_vertices, thick_faces = sphere(1.0)
+    vertices = np.vstack([thick_vertices + (10, 0, 0), thin_vertices])
+    faces = np.vstack([thick_faces, thin_faces + len(thick_vertices)])
+    mesh = Mesh(*soup(vertices, faces))
+
+    regions = thin_regions(mesh, measure_wall_thickness(mesh), 0.5)
+
+    assert len(regions) == 2  # The outer and inner surfaces of the shell
+    thin = np.concatenate(regions)
+    assert sorted(thin.tolist()) == list(range(3 * len(thick_faces), len(faces) * 3))
+    assert [int(region[0]) for region in regions] == sorted(
+        int(region[0]) for region in regions
+    )
+
+
+def test_no_thin_regions():
+    """A mesh thicker than the minimum everywhere has no thin regions."""
+    mesh = Mesh(*sphere(1.0))
+
+    assert thin_regions(mesh, measure_wall_thickness(mesh), 0.5) == []
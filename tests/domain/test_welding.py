@@ -0,0 +1,83 @@
+"""Test vertex welding."""
+
+import numpy as np
+import pytest
+
+from thicker.domain.welding import weld_vertices
+
+
+@pytest.fixture
+def triangle_soup():
+    """Two triangles sharing an edge, stored as an STL-style soup."""
+    vertices = np.array(
+        [
+            (0, 0, 0),
+            (1, 0, 0),
+            (0, 1, 0),
+            (1, 0, 0),
+            (1, 1, 0),
+            (0, 1, 0),
+        ],
+        dtype=float,
+    )
+    faces = np.arange(6).reshape(-1, 3)
+    return vertices, faces
+
+
+def test_weld_exact_duplicates(triangle_soup):
+    """Exact duplicates are merged and faces point at the shared copies."""
+    vertices, faces = triangle_soup
+
+    welded_vertices, welded_faces = weld_vertices(vertices, faces)
+
+    assert welded_vertices.tolist() == [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]]
+    assert welded_faces.tolist() == [[0, 1, 2], [1, 3, 2]]
+
+
+def test_weld_preserves_triangles(triangle_soup):
+    """Expanding the welded mesh gives back the original triangles."""
+    vertices, faces = triangle_soup
+
+    welded_vertices, welded_faces = weld_vertices(vertices, faces)
+
+    assert np.array_equal(welded_vertices[welded_faces], vertices[faces])
+
+
+def test_weld_within_tolerance(triangle_soup):
+    """Near-duplicates inside the tolerance are merged."""
+    vertices, faces = triangle_soup
+    vertices[3] += 1e-7
+    vertices[5] -= 1e-7
+
+    assert len(weld_vertices(vertices, faces)[0]) == 6
+    welded_vertices, welded_faces = weld_vertices(vertices, faces, tolerance=1e-4)
+
+    assert len(welded_vertices) == 4
+    assert welded_faces.tolist() == [[0, 1, 2], [1, 3, 2]]
+    # The first occurrence keeps its exact coordinates
+    assert welded_vertices[1].tolist() == [1, 0, 0]
+
+
+def test_weld_keeps_distinct_vertices(triangle_soup):
+    """Vertices further apart than the tolerance stay separate."""
+    vertices, faces = triangle_soup
+
+    welded_vertices, _ = weld_vertices(vertices, faces, tolerance=0.1)
+
+    assert len(welded_vertices) == 4
+
+
+def test_weld_empty_mesh():
+    """An empty mesh welds to an empty mesh."""
+    welded_vertices, welded_faces = weld_vertices([], [])
+
+    assert welded_vertices.shape == (0, 3)
+    assert welded_faces.shape == (0, 3)
+
+
+def test_weld_negative_tolerance(triangle_soup):
+    """A negative tolerance is rejected."""
+    vertices, faces = triangle_soup
+
+    with pytest.raises(ValueError, match="Weld tolerance must be non-negative."):
+        weld_vertices(vertices, faces, tolerance=-1)
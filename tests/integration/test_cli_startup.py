@@ -0,0 +1,65 @@
+"""Test that the CLI starts without loading its heavy dependencies."""
+
+import subprocess
+import sys
+
+HEAVY_MODULES = ("numpy", "stl")
+
+
+def run_with_importtime(*args):
+    """Run Python with -X importtime; return the result and imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    return result, imported
+
+
+def test_help_does_not_import_numpy():
+    """--help is answered without loading NumPy or numpy-stl."""
+    result, imported = run_with_importtime("-m", "thicker.cli.cli", "--help")
+
+    assert result.returncode == 0
+    assert "--offset" in result.stdout
+    assert not set(HEAVY_MODULES) & set(imported)
+
+
+def test_bad_arguments_fail_before_numpy():
+    """Invalid arguments are rejected before the heavy modules load."""
+    result, imported = run_with_importtime(
+        "-m",
+        "thicker.cli.cli",
+        "--input",
+        "a.stl",
+        "--output",
+        "b.stl",
+        "--offset",
+        "0",
+    )
+
+    assert result.returncode != 0
+    assert "Offset value must be non-zero." in result.stderr
+    assert not set(HEAVY_MODULES) & set(imported)
+
+
+def test_cli_import_leaves_heavy_modules_unloaded():
+    """Importing the CLI module loads neither NumPy, numpy-stl nor the domain."""
+    script = (
+        "import sys, thicker.cli.cli\n"
+        "print(*sorted(name for name in sys.modules"
+        f" if name.split('.')[0] in {HEAVY_MODULES!r}"
+        " or name.startswith('thicker.domain')))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == []
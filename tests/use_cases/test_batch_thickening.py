@@ -0,0 +1,120 @@
+"""Test the batch thickening use case."""
+
+import shutil
+from unittest.mock import Mock
+
+import pytest
+
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
+from thicker.use_cases.batch_thickening import (
+    JobResult,
+    ThickeningJob,
+    process_thickening_batch,
+)
+from thicker.use_cases.cached_thickening import thickening_parameters
+
+TRIANGLE = ([(0.0, 0.0, 1.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)], [(0, 1, 2)])
+
+
+def test_batch_runs_every_job():
+    """Every job is thickened and reported in order."""
+    mock_reader = Mock()
+    mock_writer = Mock()
+    mock_reader.read.return_value = TRIANGLE
+    jobs = [ThickeningJob(f"in{i}.stl", f"out{i}.stl") for i in range(3)]
+
+    results = process_thickening_batch(mock_reader, mock_writer, jobs, 0.1)
+
+    assert results == [JobResult(job) for job in jobs]
+    assert [c.args[0] for c in mock_writer.write.call_args_list] == [
+        "out0.stl",
+        "out1.stl",
+        "out2.stl",
+    ]
+
+
+def test_batch_continues_after_failure():
+    """A failing mesh is reported and the other jobs still run."""
+    mock_reader = Mock()
+    mock_writer = Mock()
+
+    def read(path):
+        if path == "bad.stl":
+            raise ValueError("Mesh contains no vertices.")
+        return TRIANGLE
+
+    mock_reader.read.side_effect = read
+    jobs = [
+        ThickeningJob("good.stl", "out/good.stl"),
+        ThickeningJob("bad.stl", "out/bad.stl"),
+        ThickeningJob("also_good.stl", "out/also_good.stl"),
+    ]
+
+    results = process_thickening_batch(mock_reader, mock_writer, jobs, 0.1)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "Mesh contains no vertices."
+    assert mock_writer.write.call_count == 2
+
+
+def test_batch_in_worker_processes(tmp_path, capfd):
+    """Jobs fan out over worker processes and failures stay isolated."""
+    shutil.copy("tests/fixtures/test_cylinder.stl", tmp_path / "cylinder.stl")
+    shutil.copy("tests/fixtures/test_cube.stl", tmp_path / "cube.stl")
+    (tmp_path / "broken.stl").write_bytes(b"not an stl file")
+    jobs = [
+        ThickeningJob(str(tmp_path / name), str(tmp_path / f"thick_{name}"))
+        for name in ("cylinder.stl", "broken.stl", "cube.stl")
+    ]
+
+    results = process_thickening_batch(
+        STLMeshReader(), STLMeshWriter(), jobs, 0.1, max_workers=2
+    )
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert (tmp_path / "thick_cylinder.stl").exists()
+    assert (tmp_path / "thick_cube.stl").exists()
+    assert not (tmp_path / "thick_broken.stl").exists()
+    # The workers leave reporting to the caller
+    assert capfd.readouterr().out == ""
+
+
+class _UnpicklableReader:
+    """A reader that cannot be sent to a worker process."""
+
+    def __init__(self):
+        self.read = lambda path: TRIANGLE
+
+
+def test_batch_reports_jobs_that_cannot_start():
+    """A job that cannot reach its worker process is reported as failed."""
+    jobs = [ThickeningJob("in.stl", "out.stl")]
+
+    results = process_thickening_batch(
+        _UnpicklableReader(), Mock(), jobs, 0.1, max_workers=2
+    )
+
+    assert not results[0].ok
+    assert results[0].error
+
+
+def test_batch_rejects_zero_workers():
+    """At least one worker is needed."""
+    with pytest.raises(ValueError, match="Number of jobs must be at least one."):
+        process_thickening_batch(Mock(), Mock(), [], 0.1, max_workers=0)
+
+
+def test_batch_uses_cache():
+    """Cached jobs are reported as such, keyed by the default parameters."""
+    mock_cache = Mock()
+    mock_cache.key.return_value = "abc"
+    mock_cache.fetch.return_value = True
+    jobs = [ThickeningJob("in.stl", "out.stl")]
+
+    results = process_thickening_batch(Mock(), Mock(), jobs, 0.1, cache=mock_cache)
+
+    assert results == [JobResult(jobs[0], cached=True)]
+    mock_cache.key.assert_called_once_with(
+        "in.stl", {**thickening_parameters(0.1), "output_format": ".stl"}
+    )
@@ -0,0 +1,84 @@
+"""Test the cached thickening use case."""
+
+from unittest.mock import Mock
+
+from thicker.use_cases import cached_thickening
+from thicker.use_cases.cached_thickening import (
+    process_with_cache,
+    thickening_parameters,
+    tool_version,
+)
+
+
+def test_cache_miss_thickens_and_stores():
+    """On a miss the mesh is thickened and the output is cached."""
+    mock_cache = Mock()
+    mock_cache.key.return_value = "abc"
+    mock_cache.fetch.return_value = False
+    thicken = Mock()
+
+    cached = process_with_cache(
+        mock_cache, "input.stl", "output.stl", {"offset": 0.1}, thicken
+    )
+
+    assert not cached
+    mock_cache.key.assert_called_once_with(
+        "input.stl", {"offset": 0.1, "output_format": ".stl"}
+    )
+    thicken.assert_called_once_with()
+    mock_cache.store.assert_called_once_with("abc", "output.stl")
+
+
+def test_cache_hit_skips_thickening():
+    """On a hit the cached output is used and nothing is recomputed."""
+    mock_cache = Mock()
+    mock_cache.key.return_value = "abc"
+    mock_cache.fetch.return_value = True
+    thicken = Mock()
+
+    cached = process_with_cache(
+        mock_cache, "input.stl", "output.stl", {"offset": 0.1}, thicken
+    )
+
+    assert cached
+    mock_cache.fetch.assert_called_once_with("abc", "output.stl")
+    thicken.assert_not_called()
+    mock_cache.store.assert_not_called()
+
+
+def test_thickening_parameters():
+    """Every option that changes the output is part of the parameters."""
+    parameters = thickening_parameters(0.5, weld_tolerance=0.01)
+
+    assert parameters["offset"] == 0.5
+    assert parameters["weld_tolerance"] == 0.01
+    assert parameters["transformation"] == "HemisphericalCylinderTransformation"
+    assert parameters["version"] == tool_version()
+    assert thickening_parameters(0.25) != thickening_parameters(0.5)
+
+
+def test_tool_version_when_not_installed(mocker):
+    """Running from a source tree without metadata still gives a version."""
+    tool_version.cache_clear()
+    mocker.patch.object(
+        cached_thickening.metadata,
+        "version",
+        side_effect=cached_thickening.metadata.PackageNotFoundError,
+    )
+
+    try:
+        assert tool_version() == "unknown"
+    finally:
+        tool_version.cache_clear()
+
+
+def test_cache_key_depends_on_output_format():
+    """Each output format and compression gets its own cache entries."""
+    mock_cache = Mock()
+    mock_cache.fetch.return_value = False
+
+    for output_path in ("output.stl", "output.obj", "output.STL.gz"):
+        process_with_cache(mock_cache, "input.stl", output_path, {}, Mock())
+
+    keys = [call.args[1]["output_format"] for call in mock_cache.key.call_args_list]
+    assert keys == [".stl", ".obj", ".stl.gz"]
@@ -0,0 +1,50 @@
+"""Test the per-stage instrumentation."""
+
+import tracemalloc
+
+import numpy as np
+
+from thicker.use_cases.instrumentation import StageRecorder
+
+
+def test_recorder_records_each_stage():
+    """Every stage is recorded in order, with its counts and timings."""
+    with StageRecorder(trace_memory=False) as recorder:
+        with recorder.stage("read") as counts:
+            counts.set(30, 10)
+        with recorder.stage("write"):
+            pass
+
+    assert [record.stage for record in recorder.records] == ["read", "write"]
+    assert (recorder.records[0].vertices, recorder.records[0].faces) == (30, 10)
+    assert recorder.records[1].vertices is None
+    assert all(record.wall_seconds >= 0 for record in recorder.records)
+    assert all(record.cpu_seconds >= 0 for record in recorder.records)
+    assert all(record.peak_memory_bytes is None for record in recorder.records)
+
+
+def test_recorder_traces_peak_memory():
+    """The peak memory of a stage includes its temporary allocations."""
+    was_tracing = tracemalloc.is_tracing()
+    with StageRecorder() as recorder:
+        with recorder.stage("allocate"):
+            buffer = np.ones(1_000_000)
+            del buffer
+        with recorder.stage("idle"):
+            pass
+
+    allocate, idle = recorder.records
+    assert allocate.peak_memory_bytes >= 8_000_000
+    assert idle.peak_memory_bytes < allocate.peak_memory_bytes
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_recorder_calls_hook():
+    """The hook is called with each stage's metrics as it finishes."""
+    seen = []
+    recorder = StageRecorder(trace_memory=False, on_stage=seen.append)
+
+    with recorder.stage("stats"):
+        pass
+
+    assert seen == recorder.records
@@ -5,7 +5,12 @@ import math
 import pytest
 
 from thicker.domain.mesh import Mesh
-from thicker.use_cases.thicken_mesh import calculate_mesh_height, calculate_mesh_radius
+from thicker.use_cases.constants import BASE_HEIGHT_PERCENTAGE
+from thicker.use_cases.thicken_mesh import (
+    calculate_mesh_height,
+    calculate_mesh_radius,
+    calculate_mesh_stats,
+)
 
 
 @pytest.fixture
@@ -89,3 +94,45 @@ def test_calculate_radius_different_z_levels():
     )
     radius = calculate_mesh_radius(varied_z_mesh)
     assert radius == 2, "Expected radius to be the maximum radial distance (2.0)"
+
+
+def test_calculate_mesh_stats():
+    """Test that one stats pass yields the box, height, base and radius."""
+    mesh = Mesh(
+        vertices=[
+            (3, 0, 0),  # Wide base vertex, below the base height
+            (1, -1, 4),
+            (-0.5, 0.5, 10),
+        ],
+        faces=[(0, 1, 2)],
+    )
+
+    stats = calculate_mesh_stats(mesh)
+
+    assert stats.min_corner == (-0.5, -1.0, 0.0)
+    assert stats.max_corner == (3.0, 0.5, 10.0)
+    assert stats.height == 10.0
+    assert math.isclose(stats.base_height, BASE_HEIGHT_PERCENTAGE * 10.0)
+    assert math.isclose(stats.radius, math.sqrt(2))
+
+
+def test_calculate_mesh_stats_is_cached(simple_vertical_mesh):
+    """Test that the stats are computed once per vertex buffer."""
+    stats = calculate_mesh_stats(simple_vertical_mesh)
+
+    assert calculate_mesh_stats(simple_vertical_mesh) is stats
+    assert calculate_mesh_height(simple_vertical_mesh) == stats.height
+
+    simple_vertical_mesh.vertices = [(0, 0, 0), (0, 0, 1), (0, 1, 1)]
+
+    assert calculate_mesh_stats(simple_vertical_mesh).height == 1
+
+
+def test_calculate_mesh_stats_no_radius():
+    """Test that stats without vertices above the base have no radius."""
+    flat_mesh = Mesh(vertices=[(1, 0, 0), (0, 1, 0), (0, 0, 0)], faces=[(0, 1, 2)])
+
+    stats = calculate_mesh_stats(flat_mesh)
+
+    assert stats.height == 0
+    assert stats.radius is None
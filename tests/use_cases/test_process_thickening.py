@@ -5,7 +5,11 @@ from unittest.mock import Mock
 
 import pytest
 
+from benchmarks.synthetic_meshes import generate_mesh
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
 from thicker.domain.mesh import Mesh
+from thicker.use_cases.instrumentation import StageRecorder
 from thicker.use_cases.thicken_mesh import (
     calculate_mesh_radius,
     process_thickening,
@@ -135,3 +139,60 @@ def test_calculate_radius_empty_mesh():
 
     with pytest.raises(ValueError, match="Mesh contains no vertices."):
         calculate_mesh_radius(mesh)
+
+
+def test_process_thickening_records_stages():
+    """Each stage of process_thickening is recorded with the mesh size."""
+    mock_reader = Mock()
+    mock_writer = Mock()
+    mock_reader.read.return_value = (
+        [(0.0, 0.0, 1.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)],
+        [(0, 1, 2)],
+    )
+    recorder = StageRecorder(trace_memory=False)
+
+    process_thickening(
+        mock_reader, mock_writer, "input.stl", "output.stl", 0.1, metrics=recorder
+    )
+
+    assert [record.stage for record in recorder.records] == [
+        "read",
+        "stats",
+        "transform",
+        "write",
+    ]
+    assert all(record.vertices == 3 for record in recorder.records)
+    assert all(record.faces == 1 for record in recorder.records)
+
+
+def test_process_thickening_with_workers_writes_the_same_mesh(tmp_path):
+    """Transforming over several processes gives an identical file."""
+    input_path = str(tmp_path / "dome.stl")
+    STLMeshWriter().write(input_path, *generate_mesh("dome", 8000))
+    serial_path = tmp_path / "serial.stl"
+    parallel_path = tmp_path / "parallel.stl"
+    process_thickening(
+        STLMeshReader(), STLMeshWriter(), input_path, str(serial_path), 0.1
+    )
+
+    process_thickening(
+        STLMeshReader(),
+        STLMeshWriter(),
+        input_path,
+        str(parallel_path),
+        0.1,
+        workers=2,
+    )
+
+    assert parallel_path.read_bytes() == serial_path.read_bytes()
+
+
+def test_process_thickening_needs_a_worker():
+    """Fewer than one worker is an error, before the mesh is read."""
+    mock_reader = Mock()
+
+    with pytest.raises(ValueError, match="workers"):
+        process_thickening(
+            mock_reader, Mock(), "input.stl", "output.stl", 0.1, workers=0
+        )
+    mock_reader.read.assert_not_called()
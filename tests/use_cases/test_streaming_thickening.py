@@ -0,0 +1,99 @@
+"""Test the streaming thickening use case."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_meshes import generate_mesh
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
+from thicker.domain.mesh import Mesh
+from thicker.use_cases.streaming_thickening import (
+    calculate_streamed_mesh_stats,
+    process_thickening_streaming,
+)
+from thicker.use_cases.thicken_mesh import calculate_mesh_stats, process_thickening
+
+CYLINDER_STL = "tests/fixtures/test_cylinder.stl"
+
+
+def test_streamed_stats_match_loaded_stats():
+    """The read-only streaming pass finds the same dimensions."""
+    reader = STLMeshReader()
+    mesh = Mesh(*reader.read(CYLINDER_STL))
+
+    stats = calculate_streamed_mesh_stats(reader, CYLINDER_STL, chunk_size=7)
+
+    assert stats == calculate_mesh_stats(mesh)
+
+
+def test_streaming_matches_process_thickening(tmp_path):
+    """Streaming in small chunks writes the same file as thickening at once."""
+    loaded_path = tmp_path / "loaded.stl"
+    streamed_path = tmp_path / "streamed.stl"
+    process_thickening(
+        STLMeshReader(), STLMeshWriter(), CYLINDER_STL, str(loaded_path), 0.5
+    )
+
+    process_thickening_streaming(
+        STLMeshReader(),
+        STLMeshWriter(),
+        CYLINDER_STL,
+        str(streamed_path),
+        0.5,
+        chunk_size=7,
+    )
+
+    assert streamed_path.read_bytes() == loaded_path.read_bytes()
+
+
+def test_streaming_with_workers_matches_process_thickening(tmp_path):
+    """Chunks split over several processes are written unchanged."""
+    input_path = str(tmp_path / "dome.stl")
+    STLMeshWriter().write(input_path, *generate_mesh("dome", 12000))
+    loaded_path = tmp_path / "loaded.stl"
+    streamed_path = tmp_path / "streamed.stl"
+    process_thickening(
+        STLMeshReader(), STLMeshWriter(), input_path, str(loaded_path), 0.5
+    )
+
+    process_thickening_streaming(
+        STLMeshReader(),
+        STLMeshWriter(),
+        input_path,
+        str(streamed_path),
+        0.5,
+        chunk_size=7000,
+        workers=2,
+    )
+
+    assert streamed_path.read_bytes() == loaded_path.read_bytes()
+
+
+def test_streaming_reads_twice_and_writes_once():
+    """The stats pass reads the input before the transform pass streams it."""
+    triangle = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    mock_reader = Mock()
+    mock_writer = Mock()
+    mock_reader.read_chunks.side_effect = lambda path, size: iter([triangle])
+    mock_writer.write_chunks.side_effect = lambda path, chunks: list(chunks)
+
+    process_thickening_streaming(
+        mock_reader, mock_writer, "input.stl", "output.stl", 0.1, chunk_size=10
+    )
+
+    assert mock_reader.read_chunks.call_count == 3
+    mock_writer.write_chunks.assert_called_once()
+
+
+def test_streaming_without_vertices_above_base():
+    """A mesh with no vertices above the base height cannot be thickened."""
+    flat = np.zeros((3, 3))
+    mock_reader = Mock()
+    mock_reader.read_chunks.side_effect = lambda path, size: iter([flat])
+
+    with pytest.raises(ValueError, match="No vertices found above the base height."):
+        process_thickening_streaming(
+            mock_reader, Mock(), "input.stl", "output.stl", 0.1
+        )
@@ -0,0 +1,149 @@
+"""Connector to cache thickened meshes in a directory."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import suppress
+from typing import Any, Dict, List, Tuple
+
+# Read inputs for hashing in 1 MiB blocks
+HASH_BLOCK_SIZE = 1 << 20
+DEFAULT_MAX_BYTES = 1 << 30
+# Entries hold outputs of any format, which is part of their key
+ENTRY_SUFFIX = ".bin"
+
+
+class FileResultCache:
+    """A size-bounded, content-addressed cache of output files.
+
+    Entries are named by a SHA-256 of the input file's bytes and the
+    parameters that produced the output. Each hit refreshes the entry's
+    modification time, and the least recently used entries are removed
+    when the cache grows past `max_bytes`.
+
+    Hard links avoid copying cached outputs, but an output that is a hard
+    link shares its bytes with the cache entry, so it must be replaced, not
+    edited in place, as the mesh writers do."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        hard_link: bool = False,
+    ):
+        """
+        Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory (str): The directory that holds the cache entries.
+            max_bytes (int): The total size the entries may take up.
+            hard_link (bool): Hard-link hits to the output path instead of
+                copying them, where the file system allows it.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hard_link = hard_link
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, file_path: str, parameters: Dict[str, Any]) -> str:
+        """
+        Hash the contents of a file together with the parameters.
+
+        Args:
+            file_path (str): Path to the input file.
+            parameters (Dict[str, Any]): JSON-serialisable parameters, such
+                as the offset, transformation and tool version.
+
+        Returns:
+            str: The hex digest that names the cache entry.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as input_file:
+            for block in iter(lambda: input_file.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        digest.update(json.dumps(parameters, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def fetch(self, key: str, file_path: str) -> bool:
+        """
+        Place the cached output for a key at the given path.
+
+        Args:
+            key (str): The cache key.
+            file_path (str): Where to put the output.
+
+        Returns:
+            bool: True on a hit, False if the key is not cached.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            os.utime(entry_path)  # Mark the entry as recently used
+        except FileNotFoundError:
+            return False
+        if os.path.lexists(file_path):
+            os.remove(file_path)
+        if self.hard_link:
+            try:
+                os.link(entry_path, file_path)
+                return True
+            except OSError:
+                pass  # e.g. across file systems; copy instead
+        try:
+            shutil.copyfile(entry_path, file_path)
+        except FileNotFoundError:
+            return False  # Evicted by another process in the meantime
+        return True
+
+    def store(self, key: str, file_path: str) -> None:
+        """
+        Copy an output file into the cache and evict old entries.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry. Outputs larger than
+        the whole cache are not stored.
+
+        Args:
+            key (str): The cache key.
+            file_path (str): The output file to cache.
+        """
+        if os.path.getsize(file_path) > self.max_bytes:
+            return
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        os.close(file_descriptor)
+        try:
+            shutil.copyfile(file_path, temporary_path)
+            os.replace(temporary_path, self._entry_path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits."""
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        for entry_path, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+            # Another process may have evicted the entry already
+            with suppress(FileNotFoundError):
+                os.remove(entry_path)
+            total -= size
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """List the (path, last use, size) of every cache entry."""
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(ENTRY_SUFFIX):
+                    with suppress(FileNotFoundError):
+                        stat = entry.stat()
+                        entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
@@ -0,0 +1,107 @@
+"""Choose the mesh reader and writer for a file by its extension.
+
+STL stores a triangle soup, three vertices per facet. OBJ and PLY keep
+shared vertices indexed, so intermediate files stay about a third of the
+size. Files with other extensions are treated as STL, as they always were.
+Every format may also be compressed, see compressed_streams.
+"""
+
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from thicker.adapters.compressed_streams import strip_compression_suffix
+
+if TYPE_CHECKING:  # The adapters load NumPy, so import them only when used
+    from thicker.domain.mesh import FaceArray, FaceData, VertexArray, VertexData
+
+DEFAULT_FORMAT = "stl"
+# The adapter classes of every format, by dotted path
+MESH_READERS: Dict[str, str] = {
+    "stl": "thicker.adapters.stl_mesh_reader.STLMeshReader",
+    "obj": "thicker.adapters.obj_mesh.OBJMeshReader",
+    "ply": "thicker.adapters.ply_mesh.PLYMeshReader",
+}
+MESH_WRITERS: Dict[str, str] = {
+    "stl": "thicker.adapters.stl_mesh_writer.STLMeshWriter",
+    "obj": "thicker.adapters.obj_mesh.OBJMeshWriter",
+    "ply": "thicker.adapters.ply_mesh.PLYMeshWriter",
+}
+
+
+def load_adapter(dotted_path: str) -> type:
+    """
+    Import an adapter class by its dotted path.
+
+    Args:
+        dotted_path (str): The module path and class name, such as
+            "thicker.adapters.obj_mesh.OBJMeshReader".
+
+    Returns:
+        type: The adapter class.
+    """
+    module_name, _, class_name = dotted_path.rpartition(".")
+    return getattr(import_module(module_name), class_name)
+
+
+def mesh_format(file_path: str) -> str:
+    """
+    Return the mesh format of a file from its extension.
+
+    A compression suffix is skipped, so "model.ply.gz" is a PLY file.
+
+    Args:
+        file_path (str): Path to the mesh file.
+
+    Returns:
+        str: "stl", "obj" or "ply".
+    """
+    extension = os.path.splitext(strip_compression_suffix(file_path))[1]
+    extension = extension.lower().lstrip(".")
+    return extension if extension in MESH_READERS else DEFAULT_FORMAT
+
+
+class MeshFormatReader:
+    """Read each mesh with the reader for its file extension."""
+
+    def __init__(self, weld_tolerance: Optional[float] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            weld_tolerance (Optional[float]): If set, merge vertices that
+                coincide within this tolerance, whatever the format.
+        """
+        self.weld_tolerance = weld_tolerance
+
+    def read(self, file_path: str) -> Tuple["VertexArray", "FaceArray"]:
+        """
+        Load a mesh file in the format given by its extension.
+
+        Args:
+            file_path (str): Path to the mesh file.
+
+        Returns:
+            Tuple[VertexArray, FaceArray]: Parsed (N, 3) vertices and (M, 3)
+                faces.
+        """
+        reader_class = load_adapter(MESH_READERS[mesh_format(file_path)])
+        reader = reader_class(self.weld_tolerance)
+        return reader.read(file_path)
+
+
+class MeshFormatWriter:
+    """Write each mesh with the writer for its file extension."""
+
+    @staticmethod
+    def write(output_path: str, vertices: "VertexData", faces: "FaceData") -> None:
+        """
+        Save a mesh file in the format given by its extension.
+
+        Args:
+            output_path (str): Path to the mesh file to create.
+            vertices (VertexData): The (N, 3) vertex coordinates.
+            faces (FaceData): The (M, 3) vertex indices.
+        """
+        writer_class = load_adapter(MESH_WRITERS[mesh_format(output_path)])
+        writer_class.write(output_path, vertices, faces)
@@ -0,0 +1,33 @@
+"""Connector to write stage metrics as JSON."""
+
+import json
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from thicker.use_cases.instrumentation import StageMetrics
+
+
+def write_metrics_json(
+    file_path: str, records: List[StageMetrics], run: Dict[str, Any]
+) -> None:
+    """
+    Save the metrics of one run as a JSON document.
+
+    The document holds a "run" object, with the given details and a UTC
+    "recorded_at" timestamp, and a "stages" list with one object per stage,
+    so runs can be collected and charted over time.
+
+    Args:
+        file_path (str): Path to the JSON file to create.
+        records (List[StageMetrics]): The metrics of each stage, in order.
+        run (Dict[str, Any]): JSON-serialisable details of the run, such as
+            the input path and offset.
+    """
+    document = {
+        "run": {"recorded_at": datetime.now(timezone.utc).isoformat(), **run},
+        "stages": [asdict(record) for record in records],
+    }
+    with open(file_path, "w", encoding="utf-8") as metrics_file:
+        json.dump(document, metrics_file, indent=2)
+        metrics_file.write("\n")
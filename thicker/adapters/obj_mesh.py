@@ -0,0 +1,155 @@
+"""Connectors to read and write Wavefront OBJ files.
+
+OBJ keeps shared vertices indexed: ``v x y z`` lines list the vertices
+once, and ``f a b c`` lines refer to them by 1-based index. Texture and
+normal indices (``f a/t/n ...``) are ignored, and polygons are split into
+triangle fans.
+"""
+
+import re
+from typing import Optional, Tuple
+
+import numpy as np
+
+from thicker.adapters.compressed_streams import open_stream
+from thicker.domain.mesh import (
+    FaceArray,
+    FaceData,
+    VertexArray,
+    VertexData,
+    as_face_array,
+    as_vertex_array,
+)
+from thicker.domain.welding import weld_vertices
+
+_VERTEX_LINE = re.compile(
+    rb"^[ \t]*v[ \t]+(\S+[ \t]+\S+[ \t]+\S+)[^\n]*$", re.MULTILINE
+)
+_FACE_LINE = re.compile(rb"^[ \t]*f[ \t]+([^\n#]*)", re.MULTILINE)
+# The texture and normal parts of a face corner, such as "/2/3" in "1/2/3"
+_CORNER_SUFFIX = re.compile(rb"/\S*")
+
+
+def parse_obj(data: bytes) -> Tuple[VertexArray, FaceArray]:
+    """
+    Parse the vertices and faces of OBJ text.
+
+    Vertex lines are converted in bulk. Faces are converted in bulk when all
+    of them are triangles; other polygons are split into triangle fans.
+    Negative indices count back from the last vertex defined before the
+    face, so every object in the file can use them.
+
+    Args:
+        data (bytes): The OBJ text.
+
+    Returns:
+        Tuple[VertexArray, FaceArray]: The (N, 3) float64 vertices and the
+            (M, 3) 0-based triangle indices.
+
+    Raises:
+        ValueError: If a vertex or face is malformed, a face index is 0 or
+            a face refers to a vertex that does not exist.
+    """
+    vertex_lines = list(_VERTEX_LINE.finditer(data))
+    coordinates = [line.group(1) for line in vertex_lines]
+    vertices = _parse_numbers(b" ".join(coordinates), np.float64).reshape(-1, 3)
+
+    face_lines = list(_FACE_LINE.finditer(data))
+    polygons = [_CORNER_SUFFIX.sub(b"", line.group(1)).split() for line in face_lines]
+    # The number of vertices defined before each face line
+    defined = np.searchsorted(
+        np.array([line.start() for line in vertex_lines], dtype=np.int64),
+        np.array([line.start() for line in face_lines], dtype=np.int64),
+    )
+    if all(len(polygon) == 3 for polygon in polygons):
+        corners = b" ".join(b" ".join(polygon) for polygon in polygons)
+        faces = _parse_numbers(corners, np.int64).reshape(-1, 3)
+    else:
+        faces = np.array(
+            [
+                (polygon[0], polygon[i], polygon[i + 1])
+                for polygon in (
+                    [int(corner) for corner in polygon] for polygon in polygons
+                )
+                for i in range(1, len(polygon) - 1)
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        defined = np.repeat(defined, [max(len(polygon) - 2, 0) for polygon in polygons])
+
+    # OBJ indices start at 1, so 0 names no vertex
+    if (faces == 0).any():
+        raise ValueError("OBJ face index 0 is invalid; indices start at 1.")
+    # 1-based indices count from the start, negative ones back from the
+    # last vertex defined before the face
+    faces = np.where(faces > 0, faces - 1, faces + defined[:, np.newaxis])
+    if len(faces) and (faces.min() < 0 or faces.max() >= len(vertices)):
+        raise ValueError("OBJ face refers to a missing vertex.")
+    return vertices, faces.astype(np.intp)
+
+
+def _parse_numbers(text: bytes, dtype: type) -> np.ndarray:
+    """Convert whitespace separated numbers in bulk."""
+    if not text:
+        return np.empty(0, dtype=dtype)
+    try:
+        return np.fromstring(text, dtype=dtype, sep=" ")
+    except ValueError as e:
+        raise ValueError("Malformed number in OBJ data.") from e
+
+
+class OBJMeshReader:
+    """A humble object to handle OBJ file operations."""
+
+    def __init__(self, weld_tolerance: Optional[float] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            weld_tolerance (Optional[float]): If set, also merge vertices
+                that coincide within this tolerance.
+        """
+        self.weld_tolerance = weld_tolerance
+
+    def read(self, file_path: str) -> Tuple[VertexArray, FaceArray]:
+        """
+        Load an OBJ file, keeping its shared vertices.
+
+        Args:
+            file_path (str): Path to the OBJ file, optionally compressed, or
+                "-" for stdin.
+
+        Returns:
+            Tuple[VertexArray, FaceArray]: Parsed (N, 3) vertices and (M, 3)
+                triangle faces.
+        """
+        with open_stream(file_path, "rb") as obj_file:
+            vertices, faces = parse_obj(obj_file.read())
+        if self.weld_tolerance is not None:
+            vertices, faces = weld_vertices(vertices, faces, self.weld_tolerance)
+        return vertices, faces
+
+
+class OBJMeshWriter:
+    """A humble object to handle OBJ file operations."""
+
+    @staticmethod
+    def write(output_path: str, vertices: VertexData, faces: FaceData) -> None:
+        """
+        Save an indexed mesh as an OBJ file.
+
+        Coordinates are written with enough digits to read back exactly.
+
+        Args:
+            output_path (str): Path to the OBJ file to create, optionally
+                compressed, or "-" for stdout.
+            vertices (VertexData): The (N, 3) vertex coordinates.
+            faces (FaceData): The (M, 3) vertex indices.
+        """
+        vertices = as_vertex_array(vertices)
+        faces = as_face_array(faces)
+        digits = 9 if vertices.dtype == np.float32 else 17
+        with open_stream(output_path, "wb") as obj_file:
+            obj_file.write(b"# written by thicker-stl\n")
+            np.savetxt(obj_file, vertices, fmt=f"v %.{digits}g %.{digits}g %.{digits}g")
+            np.savetxt(obj_file, faces + 1, fmt="f %d %d %d")
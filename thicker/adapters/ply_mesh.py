@@ -0,0 +1,339 @@
+"""Connectors to read and write binary PLY files.
+
+PLY keeps shared vertices indexed: a vertex element lists the vertices
+once, and a face element lists polygons as lists of vertex indices. Both
+elements are read and written as NumPy structured arrays, one bulk
+conversion per element. ASCII PLY files are not supported.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from thicker.adapters.compressed_streams import open_stream
+from thicker.domain.mesh import (
+    FaceArray,
+    FaceData,
+    VertexArray,
+    VertexData,
+    as_face_array,
+    as_vertex_array,
+)
+from thicker.domain.welding import weld_vertices
+
+PLY_MAGIC = b"ply"
+END_HEADER = b"end_header"
+BYTE_ORDERS = {"binary_little_endian": "<", "binary_big_endian": ">"}
+SCALAR_TYPES = {
+    "char": "i1",
+    "int8": "i1",
+    "uchar": "u1",
+    "uint8": "u1",
+    "short": "i2",
+    "int16": "i2",
+    "ushort": "u2",
+    "uint16": "u2",
+    "int": "i4",
+    "int32": "i4",
+    "uint": "u4",
+    "uint32": "u4",
+    "float": "f4",
+    "float32": "f4",
+    "double": "f8",
+    "float64": "f8",
+}
+FACE_LIST_NAMES = ("vertex_indices", "vertex_index")
+
+
+@dataclass
+class PLYProperty:
+    """A property of a PLY element; list properties have a count type."""
+
+    name: str
+    value_type: str
+    count_type: Optional[str] = None
+
+
+@dataclass
+class PLYElement:
+    """An element declared in a PLY header."""
+
+    name: str
+    count: int
+    properties: List[PLYProperty] = field(default_factory=list)
+
+
+def parse_ply_header(data: bytes) -> Tuple[str, List[PLYElement], int]:
+    """
+    Parse the header of a binary PLY file.
+
+    Args:
+        data (bytes): The file contents, or at least its header.
+
+    Returns:
+        Tuple[str, List[PLYElement], int]: The byte order ("<" or ">"), the
+            declared elements and the offset of the first data byte.
+
+    Raises:
+        ValueError: If the header is malformed, the file is ASCII PLY or
+            the faces have no single vertex index list.
+    """
+    end = data.find(END_HEADER)
+    if not data.startswith(PLY_MAGIC) or end < 0:
+        raise ValueError("Not a PLY file.")
+    data_start = data.index(b"\n", end) + 1
+    byte_order = None
+    elements: List[PLYElement] = []
+    for line in data[:end].decode("ascii").splitlines()[1:]:
+        words = line.split()
+        if not words or words[0] in ("comment", "obj_info"):
+            continue
+        try:
+            if words[0] == "format":
+                if words[1] not in BYTE_ORDERS:
+                    raise ValueError("Only binary PLY files are supported.")
+                byte_order = BYTE_ORDERS[words[1]]
+            elif words[0] == "element":
+                elements.append(PLYElement(words[1], int(words[2])))
+            elif words[0] == "property" and words[1] == "list":
+                elements[-1].properties.append(
+                    PLYProperty(
+                        words[4], SCALAR_TYPES[words[3]], SCALAR_TYPES[words[2]]
+                    )
+                )
+            elif words[0] == "property":
+                elements[-1].properties.append(
+                    PLYProperty(words[2], SCALAR_TYPES[words[1]])
+                )
+            else:
+                raise ValueError(f"Unknown PLY header line: {line}")
+        except (IndexError, KeyError) as e:
+            raise ValueError(f"Malformed PLY header line: {line}") from e
+    if byte_order is None:
+        raise ValueError("PLY header has no format line.")
+    for element in (e for e in elements if e.name == "face"):
+        lists = [p.name for p in element.properties if p.count_type is not None]
+        if len(lists) != 1 or lists[0] not in FACE_LIST_NAMES:
+            raise ValueError("PLY faces need exactly one vertex index list.")
+    return byte_order, elements, data_start
+
+
+def _scalar_dtype(element: PLYElement, byte_order: str) -> np.dtype:
+    """The record dtype of an element whose properties are all scalars."""
+    return np.dtype([(p.name, byte_order + p.value_type) for p in element.properties])
+
+
+def _read_list_element(
+    data: bytes, offset: int, element: PLYElement, byte_order: str
+) -> Tuple[List[np.ndarray], int]:
+    """
+    Walk the records of an element with list properties one at a time.
+
+    Returns:
+        Tuple[List[np.ndarray], int]: The face list of every record, or the
+            first list property if the element has no face list, and the
+            offset after the element.
+    """
+    lists = []
+    for _ in range(element.count):
+        record_list = None
+        for prop in element.properties:
+            value_type = np.dtype(byte_order + prop.value_type)
+            if prop.count_type is None:
+                offset += value_type.itemsize
+                continue
+            count_type = np.dtype(byte_order + prop.count_type)
+            length = int(np.frombuffer(data, count_type, 1, offset)[0])
+            offset += count_type.itemsize
+            values = np.frombuffer(data, value_type, length, offset)
+            offset += length * value_type.itemsize
+            if record_list is None or prop.name in FACE_LIST_NAMES:
+                record_list = values
+        lists.append(record_list)
+    return lists, offset
+
+
+def _face_dtype(element: PLYElement, byte_order: str, length: int) -> np.dtype:
+    """The record dtype of a face element whose lists all hold length indices."""
+    fields = []
+    for prop in element.properties:
+        if prop.count_type is None:
+            fields.append((prop.name, byte_order + prop.value_type))
+        else:
+            fields.append(("count", byte_order + prop.count_type))
+            fields.append(("indices", byte_order + prop.value_type, (length,)))
+    return np.dtype(fields)
+
+
+def _fans(polygons: np.ndarray) -> FaceArray:
+    """Split (M, K) polygons into triangle fans, polygon by polygon."""
+    corners = np.arange(1, polygons.shape[1] - 1)
+    fan = np.stack([np.zeros_like(corners), corners, corners + 1], axis=1)
+    return polygons[:, fan].reshape(-1, 3).astype(np.intp)
+
+
+def _read_faces(
+    data: bytes, offset: int, element: PLYElement, byte_order: str
+) -> Tuple[FaceArray, int]:
+    """
+    Read a face element as triangles, splitting polygons into fans.
+
+    The length of the first face's list is read first, and the element is
+    read as if every face had that many corners, which is one structured
+    read for all-triangle or all-quad meshes. If the lengths vary, the
+    records are walked instead.
+
+    Returns:
+        Tuple[FaceArray, int]: The (M, 3) faces and the offset after the
+            element.
+    """
+    if element.count == 0:
+        return np.empty((0, 3), dtype=np.intp), offset
+    count_type, count_offset = _face_dtype(element, byte_order, 0).fields["count"]
+    length = int(np.frombuffer(data, count_type, 1, offset + count_offset)[0])
+    fixed = _face_dtype(element, byte_order, length)
+    try:
+        records = np.frombuffer(data, fixed, element.count, offset)
+        if (records["count"] == length).all():
+            return _fans(records["indices"]), offset + element.count * fixed.itemsize
+    except ValueError:  # Shorter than fixed-length faces, so lengths vary
+        pass
+
+    polygons, offset = _read_list_element(data, offset, element, byte_order)
+    faces = np.array(
+        [
+            (polygon[0], polygon[i], polygon[i + 1])
+            for polygon in polygons
+            for i in range(1, len(polygon) - 1)
+        ],
+        dtype=np.intp,
+    ).reshape(-1, 3)
+    return faces, offset
+
+
+def parse_ply(data: bytes) -> Tuple[VertexArray, FaceArray]:
+    """
+    Parse the vertices and faces of a binary PLY file.
+
+    Extra vertex and face properties, such as normals or colours, and other
+    elements are skipped.
+
+    Args:
+        data (bytes): The file contents.
+
+    Returns:
+        Tuple[VertexArray, FaceArray]: The (N, 3) vertices, in single
+            precision if stored so, and the (M, 3) triangle indices.
+
+    Raises:
+        ValueError: If the file is not a binary PLY mesh or is truncated.
+    """
+    byte_order, elements, offset = parse_ply_header(data)
+    vertices = faces = None
+    try:
+        for element in elements:
+            has_lists = any(p.count_type is not None for p in element.properties)
+            if element.name == "face":
+                faces, offset = _read_faces(data, offset, element, byte_order)
+            elif has_lists:
+                _, offset = _read_list_element(data, offset, element, byte_order)
+            else:
+                dtype = _scalar_dtype(element, byte_order)
+                records = np.frombuffer(data, dtype, element.count, offset)
+                offset += element.count * dtype.itemsize
+                if element.name == "vertex":
+                    vertices = records
+    except ValueError as e:
+        raise ValueError("PLY data is shorter than its header declares.") from e
+    if vertices is None or not {"x", "y", "z"} <= set(vertices.dtype.names):
+        raise ValueError("PLY file has no vertex coordinates.")
+
+    coordinates = [vertices[axis] for axis in "xyz"]
+    single = all(c.dtype.kind == "f" and c.dtype.itemsize == 4 for c in coordinates)
+    vertex_array = np.empty((len(vertices), 3), np.float32 if single else np.float64)
+    for axis, values in enumerate(coordinates):
+        vertex_array[:, axis] = values
+    if faces is None:
+        faces = np.empty((0, 3), dtype=np.intp)
+    if len(faces) and (faces.min() < 0 or faces.max() >= len(vertex_array)):
+        raise ValueError("PLY face refers to a missing vertex.")
+    return vertex_array, faces
+
+
+class PLYMeshReader:
+    """A humble object to handle PLY file operations."""
+
+    def __init__(self, weld_tolerance: Optional[float] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            weld_tolerance (Optional[float]): If set, also merge vertices
+                that coincide within this tolerance.
+        """
+        self.weld_tolerance = weld_tolerance
+
+    def read(self, file_path: str) -> Tuple[VertexArray, FaceArray]:
+        """
+        Load a binary PLY file, keeping its shared vertices.
+
+        Args:
+            file_path (str): Path to the PLY file, optionally compressed, or
+                "-" for stdin.
+
+        Returns:
+            Tuple[VertexArray, FaceArray]: Parsed (N, 3) vertices and (M, 3)
+                triangle faces.
+        """
+        with open_stream(file_path, "rb") as ply_file:
+            vertices, faces = parse_ply(ply_file.read())
+        if self.weld_tolerance is not None:
+            vertices, faces = weld_vertices(vertices, faces, self.weld_tolerance)
+        return vertices, faces
+
+
+class PLYMeshWriter:
+    """A humble object to handle PLY file operations."""
+
+    @staticmethod
+    def write(output_path: str, vertices: VertexData, faces: FaceData) -> None:
+        """
+        Save an indexed mesh as a little-endian binary PLY file.
+
+        Single precision vertices are stored as float and others as double.
+
+        Args:
+            output_path (str): Path to the PLY file to create, optionally
+                compressed, or "-" for stdout.
+            vertices (VertexData): The (N, 3) vertex coordinates.
+            faces (FaceData): The (M, 3) vertex indices.
+        """
+        vertices = as_vertex_array(vertices)
+        faces = as_face_array(faces)
+        single = vertices.dtype == np.float32
+        value_type = "float" if single else "double"
+        header = "\n".join(
+            [
+                "ply",
+                "format binary_little_endian 1.0",
+                "comment written by thicker-stl",
+                f"element vertex {len(vertices)}",
+                f"property {value_type} x",
+                f"property {value_type} y",
+                f"property {value_type} z",
+                f"element face {len(faces)}",
+                "property list uchar int vertex_indices",
+                "end_header\n",
+            ]
+        )
+        records = np.empty(
+            len(faces), dtype=[("count", "u1"), ("indices", "<i4", (3,))]
+        )
+        records["count"] = 3
+        records["indices"] = faces
+        coordinates = vertices.astype("<f4" if single else "<f8", order="C", copy=False)
+        with open_stream(output_path, "wb") as ply_file:
+            ply_file.write(header.encode("ascii"))
+            ply_file.write(memoryview(coordinates.view(np.uint8)))
+            ply_file.write(memoryview(records.view(np.uint8)))
@@ -0,0 +1,152 @@
+"""Bulk parsing of ASCII STL files.
+
+An ASCII STL file is a ``solid`` block of ``facet`` blocks, each with three
+``vertex x y z`` lines. Only the vertex lines carry the mesh, so they are
+matched with one regular expression over a memory-mapped buffer and their
+coordinates converted with a single np.fromstring call per block, instead of
+tokenizing the file line by line in Python.
+"""
+
+import mmap
+import re
+from typing import BinaryIO, List
+
+import numpy as np
+
+ASCII_MAGIC = b"solid"
+# Parse the file in blocks of about this many bytes to bound temporary memory
+BLOCK_SIZE = 16 << 20
+
+_VERTEX_LINE = re.compile(
+    rb"^[ \t]*vertex[ \t]+(\S+[ \t]+\S+[ \t]+\S+)[ \t]*\r?$", re.MULTILINE
+)
+
+
+def is_ascii_stl(file_path: str) -> bool:
+    """
+    Tell whether a file starts like an ASCII STL file.
+
+    Binary files may also start with ``solid``, so check for a well-formed
+    binary file first.
+
+    Args:
+        file_path (str): Path to the STL file.
+
+    Returns:
+        bool: True if the first word of the file is ``solid``.
+    """
+    with open(file_path, "rb") as stl_file:
+        start = stl_file.read(512)
+    return start.lstrip().startswith(ASCII_MAGIC)
+
+
+def looks_like_ascii_stl(start: bytes) -> bool:
+    """
+    Tell whether the first bytes of a stream look like ASCII STL text.
+
+    A stream's length is not known up front, so binary files whose header
+    starts with ``solid`` are told apart by their NUL bytes instead.
+
+    Args:
+        start (bytes): The first few hundred bytes of the stream.
+
+    Returns:
+        bool: True if the bytes start with ``solid`` and are all text.
+    """
+    return start.lstrip().startswith(ASCII_MAGIC) and b"\0" not in start
+
+
+def parse_ascii_vertices(buffer: bytes) -> np.ndarray:
+    """
+    Extract the coordinates of every vertex line in a buffer.
+
+    Args:
+        buffer (bytes): ASCII STL text, or any bytes-like object.
+
+    Returns:
+        np.ndarray: A (K, 3) float64 array of the vertex coordinates.
+
+    Raises:
+        ValueError: If a vertex line has a coordinate that is not a number.
+    """
+    coordinates = _VERTEX_LINE.findall(buffer)
+    if not coordinates:
+        return np.empty((0, 3))
+    try:
+        values = np.fromstring(b" ".join(coordinates), sep=" ")
+    except ValueError:
+        values = None  # NumPy stops at the first token that is not a number
+    if values is None or len(values) != 3 * len(coordinates):
+        raise ValueError("Malformed vertex coordinates in ASCII STL data.")
+    return values.reshape(-1, 3)
+
+
+def read_ascii_stl(file_path: str) -> np.ndarray:
+    """
+    Read the triangles of an ASCII STL file.
+
+    The file is memory-mapped and parsed in blocks that end on a line break,
+    so temporary memory is bounded by the block size. Coordinates are
+    rounded to float32, as in binary STL files.
+
+    Args:
+        file_path (str): Path to the ASCII STL file.
+
+    Returns:
+        np.ndarray: An (M, 3, 3) float32 array of triangle corners.
+
+    Raises:
+        ValueError: If the file is not an ASCII STL file or its vertices do
+            not make whole triangles.
+    """
+    if not is_ascii_stl(file_path):
+        raise ValueError(f"Not an ASCII STL file: {file_path}")
+    blocks = []
+    with open(file_path, "rb") as stl_file:
+        with mmap.mmap(stl_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = 0
+            while start < len(buffer):
+                end = buffer.find(b"\n", start + BLOCK_SIZE)
+                end = len(buffer) if end == -1 else end + 1
+                vertices = parse_ascii_vertices(buffer[start:end])
+                blocks.append(vertices.astype(np.float32))
+                start = end
+    return _as_triangles(blocks, file_path)
+
+
+def read_ascii_stl_stream(stream: BinaryIO, prefix: bytes = b"") -> np.ndarray:
+    """
+    Read the triangles of an ASCII STL stream, parsing it as it arrives.
+
+    The stream is read in blocks; each block is parsed up to its last line
+    break and the rest carried over to the next, so temporary memory is
+    bounded by the block size.
+
+    Args:
+        stream (BinaryIO): The stream, at the start of the STL text.
+        prefix (bytes): Bytes already read from the start of the stream.
+
+    Returns:
+        np.ndarray: An (M, 3, 3) float32 array of triangle corners.
+
+    Raises:
+        ValueError: If the vertices do not make whole triangles.
+    """
+    blocks = []
+    pending = prefix
+    while True:
+        data = stream.read(BLOCK_SIZE)
+        pending += data
+        end = pending.rfind(b"\n") + 1 if data else len(pending)
+        blocks.append(parse_ascii_vertices(pending[:end]).astype(np.float32))
+        pending = pending[end:]
+        if not data:
+            return _as_triangles(blocks, "stream")
+
+
+def _as_triangles(blocks: List[np.ndarray], source: str) -> np.ndarray:
+    """Join the parsed vertex blocks into (M, 3, 3) triangles."""
+    vertices = np.concatenate(blocks) if blocks else np.empty((0, 3), np.float32)
+    if len(vertices) % 3:
+        raise ValueError(f"ASCII STL vertices do not form triangles: {source}")
+    return vertices.reshape(-1, 3, 3)
@@ -0,0 +1,293 @@
+"""Native binary STL layout and memory-mapped access.
+
+A binary STL file is an 80 byte header, a little-endian uint32 facet count
+and then one packed 50 byte record per facet: a float32 normal, three
+float32 vertices and a uint16 attribute byte count.
+"""
+
+import os
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from thicker.adapters.compressed_streams import read_into, replace_file
+
+HEADER_SIZE = 80
+COUNT_SIZE = 4
+DATA_OFFSET = HEADER_SIZE + COUNT_SIZE
+# Binary headers must not start with "solid", which marks ASCII files
+DEFAULT_HEADER = b"binary STL written by thicker-stl"
+
+STL_RECORD_DTYPE = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vectors", "<f4", (3, 3)),
+        ("attr", "<u2"),
+    ]
+)
+
+
+def binary_stl_facet_count(file_path: str) -> Optional[int]:
+    """
+    Return the facet count of a binary STL file.
+
+    The count in the header is trusted only when the file size matches it
+    exactly, which also rules out ASCII files that start with ``solid``.
+
+    Args:
+        file_path (str): Path to the STL file.
+
+    Returns:
+        Optional[int]: The number of facets, or None if the file is not a
+            well-formed binary STL.
+    """
+    with open(file_path, "rb") as stl_file:
+        stl_file.seek(HEADER_SIZE)
+        count_bytes = stl_file.read(COUNT_SIZE)
+    if len(count_bytes) != COUNT_SIZE:
+        return None
+    count = int(np.frombuffer(count_bytes, dtype="<u4")[0])
+    if os.path.getsize(file_path) != DATA_OFFSET + count * STL_RECORD_DTYPE.itemsize:
+        return None
+    return count
+
+
+def read_binary_stl(file_path: str, count: Optional[int] = None) -> np.ndarray:
+    """
+    Memory-map the facet records of a binary STL file.
+
+    The returned structured array is a read-only view of the file; the
+    ``normal``, ``vectors`` and ``attr`` fields are views as well, so nothing
+    is copied until a caller asks for contiguous data.
+
+    Args:
+        file_path (str): Path to the binary STL file.
+        count (Optional[int]): The facet count, if already known.
+
+    Returns:
+        np.ndarray: A (M,) array of STL_RECORD_DTYPE records.
+
+    Raises:
+        ValueError: If the file is not a well-formed binary STL.
+    """
+    if count is None:
+        count = binary_stl_facet_count(file_path)
+        if count is None:
+            raise ValueError(f"Not a binary STL file: {file_path}")
+    if count == 0:
+        # mmap cannot map a zero-length region
+        return np.empty(0, dtype=STL_RECORD_DTYPE)
+    return np.memmap(
+        os.fspath(file_path),
+        dtype=STL_RECORD_DTYPE,
+        mode="r",
+        offset=DATA_OFFSET,
+        shape=(count,),
+    )
+
+
+def iter_binary_stl_chunks(file_path: str, chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Read the facet records of a binary STL file in fixed-size chunks.
+
+    Each chunk is read into its own small buffer, so memory use depends on
+    the chunk size and not on the size of the file.
+
+    Args:
+        file_path (str): Path to the binary STL file.
+        chunk_size (int): The number of facets per chunk.
+
+    Yields:
+        np.ndarray: Up to chunk_size STL_RECORD_DTYPE records.
+
+    Raises:
+        ValueError: If the file is not a well-formed binary STL or the chunk
+            size is less than one.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least one.")
+    count = binary_stl_facet_count(file_path)
+    if count is None:
+        raise ValueError(f"Not a binary STL file: {file_path}")
+    with open(file_path, "rb") as stl_file:
+        stl_file.seek(DATA_OFFSET)
+        for start in range(0, count, chunk_size):
+            yield np.fromfile(
+                stl_file, dtype=STL_RECORD_DTYPE, count=min(chunk_size, count - start)
+            )
+
+
+def _read_stream_header(stream: BinaryIO, prefix: bytes) -> Tuple[int, bytes]:
+    """Read the facet count of a stream, returning it and any bytes after it."""
+    head = prefix + stream.read(max(0, DATA_OFFSET - len(prefix)))
+    if len(head) < DATA_OFFSET:
+        raise ValueError("Binary STL stream ends inside its header.")
+    count = int(np.frombuffer(head, dtype="<u4", count=1, offset=HEADER_SIZE)[0])
+    return count, head[DATA_OFFSET:]
+
+
+def _read_stream_records(
+    stream: BinaryIO, count: int, leading: bytes = b""
+) -> np.ndarray:
+    """Read count records from a stream straight into a new record array."""
+    records = np.empty(count, dtype=STL_RECORD_DTYPE)
+    buffer = memoryview(records.view(np.uint8))
+    if len(leading) > len(buffer):
+        raise ValueError("Binary STL stream is longer than its facet count.")
+    buffer[: len(leading)] = leading
+    filled = len(leading) + read_into(stream, buffer[len(leading) :])
+    if filled < len(buffer):
+        raise ValueError("Binary STL stream is shorter than its facet count.")
+    return records
+
+
+def read_binary_stl_stream(stream: BinaryIO, prefix: bytes = b"") -> np.ndarray:
+    """
+    Read the facet records of a binary STL stream.
+
+    The stream is read, and decompressed if it is a compressed file, straight
+    into the record array, without an intermediate copy of the file.
+
+    Args:
+        stream (BinaryIO): The stream, at the start of the STL data.
+        prefix (bytes): Bytes already read from the start of the stream, for
+            example to tell binary from ASCII data.
+
+    Returns:
+        np.ndarray: A (M,) array of STL_RECORD_DTYPE records.
+
+    Raises:
+        ValueError: If the stream length does not match its facet count.
+    """
+    count, leading = _read_stream_header(stream, prefix)
+    records = _read_stream_records(stream, count, leading)
+    if stream.read(1):
+        raise ValueError("Binary STL stream is longer than its facet count.")
+    return records
+
+
+def iter_binary_stl_stream_chunks(
+    stream: BinaryIO, chunk_size: int
+) -> Iterator[np.ndarray]:
+    """
+    Read the facet records of a binary STL stream in fixed-size chunks.
+
+    Args:
+        stream (BinaryIO): The stream, at the start of the STL data.
+        chunk_size (int): The number of facets per chunk.
+
+    Yields:
+        np.ndarray: Up to chunk_size STL_RECORD_DTYPE records.
+
+    Raises:
+        ValueError: If the stream is shorter than its facet count or the
+            chunk size is less than one.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least one.")
+    count, _ = _read_stream_header(stream, b"")
+    for start in range(0, count, chunk_size):
+        yield _read_stream_records(stream, min(chunk_size, count - start))
+
+
+def facet_normals(triangles: np.ndarray) -> np.ndarray:
+    """
+    Calculate unit facet normals for a batch of triangles.
+
+    Args:
+        triangles (np.ndarray): An (M, 3, 3) array of triangle corners.
+
+    Returns:
+        np.ndarray: An (M, 3) array of unit normals, following the right-hand
+            rule, with (0, 0, 0) for degenerate triangles.
+    """
+    normals = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths != 0)
+
+
+def write_binary_stl(
+    file_path: str,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    header: bytes = DEFAULT_HEADER,
+) -> None:
+    """
+    Write an indexed triangle mesh as a binary STL file.
+
+    The triangles are gathered with one fancy-indexing operation, their
+    normals come from one batched cross product and the records are written
+    with a single buffered write.
+
+    Args:
+        file_path (str): Path to the STL file to create.
+        vertices (np.ndarray): An (N, 3) array of vertex coordinates.
+        faces (np.ndarray): An (M, 3) array of vertex indices.
+        header (bytes): Up to 80 bytes of header text.
+    """
+    with replace_file(file_path) as stl_file:
+        write_binary_stl_stream(stl_file, vertices, faces, header)
+
+
+def write_binary_stl_stream(
+    stream: BinaryIO,
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    header: bytes = DEFAULT_HEADER,
+) -> None:
+    """
+    Write an indexed triangle mesh as binary STL data to a stream.
+
+    The records are handed to the stream as one buffer, so compressing
+    streams and pipes get the data without an extra copy.
+
+    Args:
+        stream (BinaryIO): The stream to write to.
+        vertices (np.ndarray): An (N, 3) array of vertex coordinates.
+        faces (np.ndarray): An (M, 3) array of vertex indices.
+        header (bytes): Up to 80 bytes of header text.
+    """
+    triangles = vertices[faces]
+    records = np.zeros(len(faces), dtype=STL_RECORD_DTYPE)
+    records["vectors"] = triangles
+    records["normal"] = facet_normals(triangles)
+    stream.write(header[:HEADER_SIZE].ljust(HEADER_SIZE, b"\0"))
+    stream.write(np.uint32(len(records)).astype("<u4").tobytes())
+    stream.write(memoryview(records.view(np.uint8)))
+
+
+def write_binary_stl_chunks(
+    file_path: str,
+    triangle_chunks: Iterable[np.ndarray],
+    header: bytes = DEFAULT_HEADER,
+) -> int:
+    """
+    Write triangles to a binary STL file as they arrive, chunk by chunk.
+
+    The facet count is written as zero and patched once the last chunk is
+    written, so the chunks never need to be held in memory together.
+
+    Args:
+        file_path (str): Path to the STL file to create.
+        triangle_chunks (Iterable[np.ndarray]): (M, 3, 3) arrays of triangle
+            corners.
+        header (bytes): Up to 80 bytes of header text.
+
+    Returns:
+        int: The number of facets written.
+    """
+    count = 0
+    with replace_file(file_path) as stl_file:
+        stl_file.write(header[:HEADER_SIZE].ljust(HEADER_SIZE, b"\0"))
+        stl_file.write(bytes(COUNT_SIZE))
+        for triangles in triangle_chunks:
+            records = np.zeros(len(triangles), dtype=STL_RECORD_DTYPE)
+            records["vectors"] = triangles
+            records["normal"] = facet_normals(triangles)
+            records.tofile(stl_file)
+            count += len(records)
+        stl_file.seek(HEADER_SIZE)
+        stl_file.write(np.uint32(count).astype("<u4").tobytes())
+    return count
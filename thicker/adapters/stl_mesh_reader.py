@@ -1,62 +1,142 @@
 """Connector to read STL files."""
 
-from typing import List, Tuple
+from typing import BinaryIO, Iterator, Optional, Tuple
 
+import numpy as np
 from stl import mesh
 
+from thicker.adapters.compressed_streams import is_stream_path, open_stream
+from thicker.adapters.stl_ascii import (
+    is_ascii_stl,
+    looks_like_ascii_stl,
+    read_ascii_stl,
+    read_ascii_stl_stream,
+)
+from thicker.adapters.stl_binary import (
+    binary_stl_facet_count,
+    iter_binary_stl_chunks,
+    iter_binary_stl_stream_chunks,
+    read_binary_stl,
+    read_binary_stl_stream,
+)
+from thicker.domain.mesh import FaceArray, VertexArray
+from thicker.domain.welding import weld_vertices
 
-def _convert_to_float(vertices: List[Tuple]) -> List[Tuple[float, float, float]]:
+# Read this much of a stream to tell binary from ASCII STL data
+SNIFF_SIZE = 512
+
+
+def read_stl_file(file_path: str) -> np.ndarray:
+    """
+    Read the triangles of a binary or ASCII STL file.
+
+    Args:
+        file_path (str): Path to the STL file.
+
+    Returns:
+        np.ndarray: An (M, 3, 3) array of triangle corners, a view of the
+            file for binary STL.
     """
-    Ensure all vertex coordinates are Python float type.
+    count = binary_stl_facet_count(file_path)
+    if count is not None:
+        return read_binary_stl(file_path, count)["vectors"]
+    if is_ascii_stl(file_path):
+        return read_ascii_stl(file_path)
+    # Non-standard files go through numpy-stl
+    return mesh.Mesh.from_file(file_path).vectors
+
+
+def read_stl_stream(stream: BinaryIO) -> np.ndarray:
+    """
+    Read the triangles of a binary or ASCII STL stream.
 
     Args:
-        vertices (List[Tuple]): List of vertices, possibly with NumPy float types.
+        stream (BinaryIO): The stream, at the start of the STL data.
 
     Returns:
-        List[Tuple[float, float, float]]: List of vertices with native Python floats.
+        np.ndarray: An (M, 3, 3) array of triangle corners.
     """
-    return [
-        (float(vertex[0]), float(vertex[1]), float(vertex[2])) for vertex in vertices
-    ]
+    start = stream.read(SNIFF_SIZE)
+    if looks_like_ascii_stl(start):
+        return read_ascii_stl_stream(stream, start)
+    return read_binary_stl_stream(stream, start)["vectors"]
 
 
 class STLMeshReader:
     """A humble object to handle STL file operations."""
 
-    @staticmethod
-    def read(
-        file_path: str,
-    ) -> Tuple[List[Tuple[float, float, float]], List[Tuple[int, int, int]]]:
+    def __init__(self, weld_tolerance: Optional[float] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            weld_tolerance (Optional[float]): If set, merge vertices that
+                coincide within this tolerance into an indexed mesh.
+        """
+        self.weld_tolerance = weld_tolerance
+
+    def read(self, file_path: str) -> Tuple[VertexArray, FaceArray]:
         """
         Load an STL file and parse its vertices and faces.
 
+        The format is detected from the file. Binary files are memory-mapped
+        and viewed as STL records, and ASCII files are parsed in bulk, so load
+        time is bound by disk bandwidth rather than per-vertex Python work.
+        Compressed files and stdin are decompressed into the parser as they
+        are read.
+
         Args:
-            file_path (str): Path to the STL file.
+            file_path (str): Path to the STL file, optionally compressed
+                (.gz, .xz or .bz2), or "-" for stdin.
 
         Returns:
-            Tuple[List[Tuple[float, float, float]],
-                List[Tuple[int, int, int]]]: Parsed vertices and faces.
+            Tuple[VertexArray, FaceArray]: Parsed (N, 3) vertices and
+                (M, 3) faces, with three vertices per STL facet unless the
+                reader welds shared vertices.
         """
-        stl_mesh = mesh.Mesh.from_file(file_path)
-        vertices = [(v[0], v[1], v[2]) for v in stl_mesh.vectors.reshape(-1, 3)]
-        # Ensure vertices are Python floats
-        vertices = _convert_to_float(vertices)
-        faces = [(i, i + 1, i + 2) for i in range(0, len(vertices), 3)]
-
-        # Type assertions to ensure the data is well-formed
-        assert isinstance(vertices, list), "Vertices must be a list."
-        assert all(
-            isinstance(v, tuple)
-            and len(v) == 3
-            and all(isinstance(coord, (float, int)) for coord in v)
-            for v in vertices
-        ), "Each vertex must have three numeric coordinates."
-        assert isinstance(faces, list), "Faces must be a list."
-        assert all(
-            isinstance(f, tuple)
-            and len(f) == 3
-            and all(isinstance(idx, int) for idx in f)
-            for f in faces
-        ), "Each face must be a tuple of three integers."
+        if is_stream_path(file_path):
+            with open_stream(file_path, "rb") as stream:
+                vectors = read_stl_stream(stream)
+        else:
+            vectors = read_stl_file(file_path)
+        # One bulk copy out of the 50 byte records into an (N, 3) buffer
+        vertices = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, 3)
+        faces = np.arange(len(vertices), dtype=np.intp).reshape(-1, 3)
+
+        # Shape assertions to ensure the data is well-formed
+        assert vertices.ndim == 2 and vertices.shape[1] == 3, (
+            "Vertices must be an (N, 3) array."
+        )
+        assert faces.ndim == 2 and faces.shape[1] == 3, "Faces must be an (M, 3) array."
+
+        if self.weld_tolerance is not None:
+            vertices, faces = weld_vertices(vertices, faces, self.weld_tolerance)
 
         return vertices, faces
+
+    @staticmethod
+    def read_chunks(file_path: str, chunk_size: int) -> Iterator[VertexArray]:
+        """
+        Stream the triangles of a binary STL file in fixed-size chunks.
+
+        Only one chunk is in memory at a time. Streaming does not weld
+        vertices, which would need the whole mesh.
+
+        Args:
+            file_path (str): Path to the binary STL file, optionally
+                compressed.
+            chunk_size (int): The number of triangles per chunk.
+
+        Yields:
+            VertexArray: A (3 * K, 3) triangle soup, every three rows one facet.
+
+        Raises:
+            ValueError: If the file is not a binary STL.
+        """
+        if is_stream_path(file_path):
+            with open_stream(file_path, "rb") as stream:
+                for records in iter_binary_stl_stream_chunks(stream, chunk_size):
+                    yield np.ascontiguousarray(records["vectors"]).reshape(-1, 3)
+            return
+        for records in iter_binary_stl_chunks(file_path, chunk_size):
+            yield np.ascontiguousarray(records["vectors"]).reshape(-1, 3)
@@ -1,9 +1,20 @@
 """Connector to read STL files."""
 
-from typing import List, Tuple
+from typing import Iterable
 
-import numpy as np
-from stl import mesh
+from thicker.adapters.compressed_streams import is_stream_path, open_stream
+from thicker.adapters.stl_binary import (
+    write_binary_stl,
+    write_binary_stl_chunks,
+    write_binary_stl_stream,
+)
+from thicker.domain.mesh import (
+    FaceData,
+    VertexArray,
+    VertexData,
+    as_face_array,
+    as_vertex_array,
+)
 
 
 class STLMeshWriter:
@@ -12,30 +23,54 @@ class STLMeshWriter:
     @staticmethod
     def write(
         output_path: str,
-        vertices: List[Tuple[float, float, float]],
-        faces: List[Tuple[int, int, int]],
+        vertices: VertexData,
+        faces: FaceData,
     ):
         """
-        Save an STL file from vertices and faces.
+        Save a binary STL file from vertices and faces.
 
         Args:
-            output_path (str): Path to the STL file to create.
-            vertices (List[Tuple[float, float, float]]): The vertices in the shape.
-            faces (List[Tuple[int, int, int]]): The paces made of vertices in the shape.
+            output_path (str): Path to the STL file to create, compressed if
+                it ends in .gz, .xz or .bz2, or "-" for stdout.
+            vertices (VertexData): The vertices in the shape, as an (N, 3)
+                array or a list of tuples.
+            faces (FaceData): The faces made of vertices in the shape, as an
+                (M, 3) array or a list of tuples.
 
         Returns:
             None
         """
+        vertices = as_vertex_array(vertices)
+        faces = as_face_array(faces)
+        if is_stream_path(output_path):
+            with open_stream(output_path, "wb") as stream:
+                write_binary_stl_stream(stream, vertices, faces)
+        else:
+            write_binary_stl(output_path, vertices, faces)
+
+    @staticmethod
+    def write_chunks(output_path: str, chunks: Iterable[VertexArray]) -> None:
+        """
+        Save a binary STL file from triangle soups, appending chunk by chunk.
+
+        The facet count is patched in once the last chunk is written, so the
+        output must be a plain file, not compressed and not stdout.
 
-        # Convert regular lists to np.arrays
-        vertices = np.array(vertices)
-        faces = np.array(faces)
+        Args:
+            output_path (str): Path to the STL file to create.
+            chunks (Iterable[VertexArray]): (3 * K, 3) arrays, every three
+                rows one facet.
 
-        # Create the mesh object
-        new_mesh = mesh.Mesh(np.zeros(faces.shape[0], dtype=mesh.Mesh.dtype))
-        for i, face in enumerate(faces):
-            for j in range(3):
-                new_mesh.vectors[i][j] = vertices[face[j], :]
+        Returns:
+            None
 
-        # Save the mesh to a file
-        new_mesh.save(output_path)
+        Raises:
+            ValueError: If the output is compressed or stdout.
+        """
+        if is_stream_path(output_path):
+            raise ValueError(
+                f"Chunked STL output must be an uncompressed file: {output_path}"
+            )
+        write_binary_stl_chunks(
+            output_path, (chunk.reshape(-1, 3, 3) for chunk in chunks)
+        )
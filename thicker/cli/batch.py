@@ -0,0 +1,99 @@
+"""
+Input discovery for the CLI batch mode.
+
+A batch source is a directory of mesh files, a glob pattern, or a manifest
+file listing one input path per line.
+"""
+
+import glob
+import os
+from collections import Counter
+from typing import List
+
+from thicker.adapters.compressed_streams import COMPRESSION_OPENERS
+from thicker.adapters.mesh_formats import MESH_READERS
+from thicker.use_cases.batch_thickening import ThickeningJob
+
+GLOB_CHARACTERS = "*?["
+# The extensions picked up from a batch directory, compressed or not
+MESH_EXTENSIONS = tuple(
+    f".{name}{suffix}" for name in MESH_READERS for suffix in ("", *COMPRESSION_OPENERS)
+)
+
+
+def read_manifest(manifest_path: str) -> List[str]:
+    """
+    Read the input paths listed in a manifest file.
+
+    Blank lines and lines starting with '#' are skipped. Relative paths are
+    resolved against the manifest's directory.
+
+    Args:
+        manifest_path (str): Path to the manifest file.
+
+    Returns:
+        List[str]: The input paths, in manifest order.
+    """
+    base_dir = os.path.dirname(manifest_path)
+    with open(manifest_path, encoding="utf-8") as manifest:
+        lines = [line.strip() for line in manifest]
+    return [
+        os.path.join(base_dir, line)
+        for line in lines
+        if line and not line.startswith("#")
+    ]
+
+
+def collect_batch_inputs(source: str) -> List[str]:
+    """
+    Expand a batch source into the list of input files.
+
+    Args:
+        source (str): A directory, a glob pattern or a manifest file.
+
+    Returns:
+        List[str]: The input paths. Directories and globs are sorted.
+
+    Raises:
+        FileNotFoundError: If the source matches no input files.
+    """
+    if os.path.isdir(source):
+        inputs = sorted(
+            entry.path
+            for entry in os.scandir(source)
+            if entry.is_file() and entry.name.lower().endswith(MESH_EXTENSIONS)
+        )
+    elif any(character in source for character in GLOB_CHARACTERS):
+        matches = glob.glob(source, recursive=True)
+        inputs = sorted(path for path in matches if os.path.isfile(path))
+    elif os.path.isfile(source):
+        inputs = read_manifest(source)
+    else:
+        inputs = []
+    if not inputs:
+        raise FileNotFoundError(f"No input files found for batch: {source}")
+    return inputs
+
+
+def plan_batch_jobs(inputs: List[str], output_dir: str) -> List[ThickeningJob]:
+    """
+    Pair every input file with an output file of the same name.
+
+    Args:
+        inputs (List[str]): The input paths.
+        output_dir (str): The directory for the thickened files.
+
+    Returns:
+        List[ThickeningJob]: One job per input.
+
+    Raises:
+        ValueError: If two inputs share a file name.
+    """
+    names = [os.path.basename(path) for path in inputs]
+    duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Batch inputs share output names: {', '.join(duplicates)}")
+    return [
+        ThickeningJob(input_path, os.path.join(output_dir, name))
+        for input_path, name in zip(inputs, names)
+    ]
@@ -7,13 +7,23 @@ to clean architecture.
 """
 
 import argparse
+import os
 import sys
 
-from thicker.adapters.stl_mesh_reader import STLMeshReader
-from thicker.adapters.stl_mesh_writer import STLMeshWriter
-from thicker.interfaces.mesh_reader import MeshReader
-from thicker.interfaces.mesh_writer import MeshWriter
-from thicker.use_cases.thicken_mesh import process_thickening
+# Only light modules are imported here, so that --help and argument errors
+# do not wait for NumPy; the commands module loads it once arguments are valid.
+from thicker.adapters.compressed_streams import STDIO_PATH, is_stream_path
+from thicker.adapters.file_result_cache import DEFAULT_MAX_BYTES
+from thicker.adapters.mesh_formats import mesh_format
+from thicker.use_cases.constants import DEFAULT_CHUNK_SIZE
+
+
+def default_cache_dir() -> str:
+    """Return the user's cache directory for thickened meshes."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "thicker-stl")
 
 
 def parse_arguments():
@@ -26,11 +36,26 @@ def parse_arguments():
     parser = argparse.ArgumentParser(
         description="Thickens a 3D mesh by the specified offset."
     )
-    parser.add_argument(
-        "--input", type=str, required=True, help="Path to the input STL file."
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument(
+        "--input",
+        type=str,
+        help="Path to the input mesh file; the extension picks the format "
+        "(.stl, .obj or binary .ply), optionally compressed (.gz, .xz or .bz2). "
+        "Use - to read an STL mesh from stdin.",
+    )
+    inputs.add_argument(
+        "--batch",
+        type=str,
+        help="Thicken many files: a directory of mesh files, a glob pattern, "
+        "or a manifest file listing one input path per line.",
     )
     parser.add_argument(
-        "--output", type=str, required=True, help="Path to save the thickened STL file."
+        "--output",
+        type=str,
+        required=True,
+        help="Path to save the thickened mesh file, or the output directory "
+        "in batch mode. Use - to write a binary STL mesh to stdout.",
     )
     parser.add_argument(
         "--offset",
@@ -38,6 +63,60 @@ def parse_arguments():
         required=True,
         help="Offset value for thickening the mesh (positive or negative).",
     )
+    parser.add_argument(
+        "--weld-tolerance",
+        type=float,
+        default=None,
+        help="Merge vertices closer than this tolerance before thickening, "
+        "so shared corners move together (0 merges exact duplicates only).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes: meshes thickened at once in batch "
+        "mode, otherwise processes sharing the vertices of one mesh.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Thicken a binary STL chunk by chunk, for meshes larger than memory.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of triangles per chunk in streaming mode.",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write the wall time, CPU time, peak memory and mesh size of "
+        "each stage to a JSON file.",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=default_cache_dir(),
+        default=None,
+        metavar="DIR",
+        help="Reuse the output of earlier runs with the same input and "
+        "options, cached in DIR (default: ~/.cache/thicker-stl).",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 2**20,
+        metavar="MB",
+        help="Evict the least recently used cache entries beyond this size.",
+    )
+    parser.add_argument(
+        "--cache-hard-link",
+        action="store_true",
+        help="Hard-link cached outputs instead of copying them.",
+    )
     return parser.parse_args()
 
 
@@ -54,21 +133,38 @@ def main():
     # Validate parsed arguments
     if args.offset == 0:
         raise ValueError("Offset value must be non-zero.")
+    if args.weld_tolerance is not None and args.weld_tolerance < 0:
+        raise ValueError("Weld tolerance must be non-negative.")
+    if args.jobs < 1:
+        raise ValueError("Number of jobs must be at least one.")
+    if args.chunk_size < 1:
+        raise ValueError("Chunk size must be at least one.")
+    if args.stream and (args.batch is not None or args.weld_tolerance is not None):
+        raise ValueError("Streaming supports a single input without welding.")
+    if args.stream and {mesh_format(args.input), mesh_format(args.output)} != {"stl"}:
+        raise ValueError("Streaming reads and writes STL files only.")
+    if args.stream and (args.input == STDIO_PATH or is_stream_path(args.output)):
+        raise ValueError(
+            "Streaming needs an input file and an uncompressed output file."
+        )
+    if args.metrics_json is not None and args.batch is not None:
+        raise ValueError("Metrics are recorded for a single input only.")
+    if args.cache_max_size < 0:
+        raise ValueError("Cache size must be non-negative.")
+    if args.cache is not None and STDIO_PATH in (args.input, args.output):
+        raise ValueError("The cache needs input and output files, not stdin or stdout.")
+
+    from thicker.cli.commands import run_batch, run_single
+
+    if args.batch is not None:
+        run_batch(args)
+        return
     try:
         # Simulate file operations
         # if not os.path.exists(args.input):
         #     raise FileNotFoundError(f"Input file not found: {args.input}")
 
-        reader: MeshReader = STLMeshReader()
-        writer: MeshWriter = STLMeshWriter()
-        # Call the thickening use case
-        process_thickening(
-            reader,
-            writer,
-            input_path=args.input,
-            output_path=args.output,
-            offset=args.offset,
-        )
+        run_single(args)
     except FileNotFoundError as e:
         print(e, file=sys.stderr)
         sys.exit(2)
@@ -0,0 +1,164 @@
+"""
+Commands run by the CLI once its arguments are parsed and validated.
+
+They wire the adapters to the use cases. Importing this module loads NumPy
+and the mesh adapters, so the CLI imports it only when there is work to do.
+"""
+
+import os
+import sys
+from contextlib import nullcontext, redirect_stdout
+from functools import partial
+from typing import Optional
+
+from thicker.adapters.compressed_streams import STDIO_PATH
+from thicker.adapters.file_result_cache import FileResultCache
+from thicker.adapters.mesh_formats import MeshFormatReader, MeshFormatWriter
+from thicker.adapters.metrics_json_writer import write_metrics_json
+from thicker.adapters.stl_mesh_reader import STLMeshReader
+from thicker.adapters.stl_mesh_writer import STLMeshWriter
+from thicker.cli.batch import collect_batch_inputs, plan_batch_jobs
+from thicker.interfaces.mesh_reader import MeshReader
+from thicker.interfaces.mesh_writer import MeshWriter
+from thicker.use_cases.batch_thickening import process_thickening_batch
+from thicker.use_cases.cached_thickening import (
+    process_with_cache,
+    thickening_parameters,
+)
+from thicker.use_cases.instrumentation import StageRecorder
+from thicker.use_cases.streaming_thickening import process_thickening_streaming
+from thicker.use_cases.thicken_mesh import process_thickening
+
+
+def create_cache(args) -> Optional[FileResultCache]:
+    """
+    Create the result cache asked for on the command line.
+
+    Args:
+        args (Namespace): The parsed arguments.
+
+    Returns:
+        Optional[FileResultCache]: The cache, or None without --cache.
+    """
+    if args.cache is None:
+        return None
+    return FileResultCache(
+        args.cache,
+        max_bytes=int(args.cache_max_size * 2**20),
+        hard_link=args.cache_hard_link,
+    )
+
+
+def run_batch(args) -> None:
+    """
+    Thicken every file of a batch and report each outcome.
+
+    Exits with code 2 if the batch has no inputs and code 1 if any file
+    failed; a failing file does not stop the others.
+
+    Args:
+        args (Namespace): The parsed arguments, in batch mode.
+    """
+    try:
+        jobs = plan_batch_jobs(collect_batch_inputs(args.batch), args.output)
+    except (FileNotFoundError, ValueError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+    os.makedirs(args.output, exist_ok=True)
+
+    results = process_thickening_batch(
+        MeshFormatReader(weld_tolerance=args.weld_tolerance),
+        MeshFormatWriter(),
+        jobs,
+        offset=args.offset,
+        max_workers=args.jobs,
+        cache=create_cache(args),
+        cache_parameters=thickening_parameters(args.offset, args.weld_tolerance),
+    )
+
+    for result in results:
+        if result.ok:
+            cached = " (cached)" if result.cached else ""
+            print(f"OK {result.job.input_path} -> {result.job.output_path}{cached}")
+        else:
+            print(f"FAILED {result.job.input_path}: {result.error}", file=sys.stderr)
+    failed = sum(not result.ok for result in results)
+    print(f"Batch complete: {len(results) - failed} succeeded, {failed} failed.")
+    if failed:
+        sys.exit(1)
+
+
+def run_single(args) -> None:
+    """
+    Thicken a single file, through the cache and with metrics if asked for.
+
+    The metrics are written even if thickening fails, with the stages that
+    finished and "completed" set to false in the run details.
+
+    Args:
+        args (Namespace): The parsed arguments, for a single input.
+    """
+    metrics = StageRecorder() if args.metrics_json is not None else None
+    # Only pass a recorder when metrics were asked for
+    options = {} if metrics is None else {"metrics": metrics}
+    # Transform on several cores only when --jobs asks for more than one
+    if args.jobs > 1:
+        options["workers"] = args.jobs
+    if args.stream:
+        # The streaming thickening use case
+        thicken = partial(
+            process_thickening_streaming,
+            STLMeshReader(),
+            STLMeshWriter(),
+            input_path=args.input,
+            output_path=args.output,
+            offset=args.offset,
+            chunk_size=args.chunk_size,
+            **options,
+        )
+    else:
+        # The input and output formats follow the file extensions
+        reader: MeshReader = MeshFormatReader(weld_tolerance=args.weld_tolerance)
+        writer: MeshWriter = MeshFormatWriter()
+        # The thickening use case
+        thicken = partial(
+            process_thickening,
+            reader,
+            writer,
+            input_path=args.input,
+            output_path=args.output,
+            offset=args.offset,
+            **options,
+        )
+
+    cache = create_cache(args)
+    # Keep progress messages out of a mesh written to stdout
+    if args.output == STDIO_PATH:
+        progress = redirect_stdout(sys.stderr)
+    else:
+        progress = nullcontext()
+    completed = False
+    try:
+        with progress:
+            if cache is None:
+                thicken()
+            else:
+                # Streaming writes the same output, so both modes share entries
+                parameters = thickening_parameters(args.offset, args.weld_tolerance)
+                process_with_cache(cache, args.input, args.output, parameters, thicken)
+        completed = True
+    finally:
+        # Stop tracing and keep the stages that finished, even on failure
+        if metrics is not None:
+            metrics.close()
+            write_metrics_json(
+                args.metrics_json,
+                metrics.records,
+                {
+                    "input": args.input,
+                    "output": args.output,
+                    "offset": args.offset,
+                    "stream": args.stream,
+                    "completed": completed,
+                },
+            )
@@ -1,47 +1,165 @@
 """Cross-section analysis of meshes."""
 
+import numpy as np
+
 from thicker.domain.mesh import Mesh
 from thicker.domain.slice import Slice
 
+DEFAULT_NUM_SLICES = 100
+
+
+def assign_slices(
+    z_values: np.ndarray, min_z: float, slice_height: float
+) -> np.ndarray:
+    """
+    Assign each z-coordinate to a horizontal slice.
+
+    Slice i covers min_z + i * slice_height <= z < the next slice. The index
+    comes from one vectorized floor division, then is corrected by one step
+    where rounding put a value across the edge computed as min_z + i * height.
+
+    Args:
+        z_values (np.ndarray): The z-coordinates to bin.
+        min_z (float): The bottom of the lowest slice.
+        slice_height (float): The height of each slice.
+
+    Returns:
+        np.ndarray: The slice index of every z-coordinate.
+    """
+    indices = np.floor((z_values - min_z) / slice_height).astype(np.intp)
+    lower_edges = min_z + indices * slice_height
+    indices -= z_values < lower_edges
+    indices += z_values >= lower_edges + slice_height
+    return indices
 
-def detect_narrow_cross_sections(mesh: Mesh, threshold: float = 0.5) -> list[Slice]:
+
+def detect_narrow_cross_sections(
+    mesh: Mesh, threshold: float = 0.5, num_slices: int = DEFAULT_NUM_SLICES
+) -> list[Slice]:
     """
     Detect narrow cross-sections in a given mesh.
 
+    The vertices are binned into slices in a single pass and the maximum
+    radius of every slice is reduced with np.maximum.at, so the cost does not
+    grow with the number of slices. Only vertices of narrow slices are sorted.
+
     Args:
         mesh: The Mesh object containing vertices and faces.
         threshold: The minimum allowable radius for a cross-section.
+        num_slices: Number of horizontal slices to analyze.
 
     Returns:
-        A list of Slices where the cross-section radius is below the threshold.
+        A list of Slices where the cross-section radius is below the threshold,
+        indexing into the mesh's vertex buffer.
+
+    Raises:
+        ValueError: If num_slices is less than one.
     """
-    narrow_sections = []
-    z_values = [z for _, _, z in mesh.vertices]
+    if num_slices < 1:
+        raise ValueError("Number of slices must be at least one.")
+    vertices = np.asarray(mesh.vertex_array, dtype=np.float64)
+    z_values = vertices[:, 2]
 
     # Determine the height range of the mesh
-    min_z = min(z_values)
-    max_z = max(z_values)
-    num_slices = 100  # Number of horizontal slices to analyze
-
+    min_z = float(z_values.min())
+    max_z = float(z_values.max())
     slice_height = (max_z - min_z) / num_slices
+    if slice_height == 0:
+        return []  # A flat mesh has no non-empty slices
+
+    # Bin the vertices, dropping any that fall past the top slice
+    slice_indices = assign_slices(z_values, min_z, slice_height)
+    in_range = (slice_indices >= 0) & (slice_indices < num_slices)
+
+    # Calculate the max squared distance from the z-axis in every slice
+    x, y = vertices[:, 0], vertices[:, 1]
+    max_squared_radii = np.full(num_slices, -1.0)  # -1 marks an empty slice
+    np.maximum.at(max_squared_radii, slice_indices[in_range], (x * x + y * y)[in_range])
 
-    for i in range(num_slices):
-        slice_z_min = min_z + i * slice_height
-        slice_z_max = slice_z_min + slice_height
+    # Check if the radius is below the threshold
+    max_radii = np.sqrt(np.maximum(max_squared_radii, 0))
+    is_narrow = (max_squared_radii >= 0) & (max_radii < threshold)
+    members = np.flatnonzero(in_range)
+    members = members[is_narrow[slice_indices[members]]]
+    return group_into_slices(mesh, members, slice_indices, min_z, slice_height)
 
-        # Get vertices in this slice
-        slice_vertices = [
-            (x, y, z) for x, y, z in mesh.vertices if slice_z_min <= z < slice_z_max
-        ]
 
-        if not slice_vertices:
-            continue  # Skip empty slices
+def group_into_slices(
+    mesh: Mesh,
+    members: np.ndarray,
+    slice_indices: np.ndarray,
+    min_z: float,
+    slice_height: float,
+) -> list[Slice]:
+    """
+    Gather vertices into one Slice per horizontal slice they fall in.
+
+    Args:
+        mesh: The mesh the vertices belong to.
+        members: The indices of the vertices to gather.
+        slice_indices: The slice index of every mesh vertex.
+        min_z: The bottom of the lowest slice.
+        slice_height: The height of each slice.
+
+    Returns:
+        The slices holding at least one member, from the bottom up, each
+        indexing into the mesh's vertex buffer.
+    """
+    order = members[np.argsort(slice_indices[members], kind="stable")]
+    sorted_indices = slice_indices[order]
+    starts = np.flatnonzero(np.diff(sorted_indices, prepend=-1))
+    ends = np.append(starts[1:], len(order))
+
+    sections = []
+    for start, end in zip(starts, ends):
+        slice_index = int(sorted_indices[start])
+        sections.append(
+            Slice.from_indices(
+                mesh.vertex_array,
+                order[start:end],
+                min_z + slice_index * slice_height,
+            )
+        )
+
+    return sections
 
-        # Calculate the max distance from the z-axis
-        max_radius = max((x**2 + y**2) ** 0.5 for x, y, _ in slice_vertices)
 
-        # Check if the radius is below the threshold
-        if max_radius < threshold:
-            narrow_sections.append(Slice(slice_vertices, slice_z_min))
+def detect_thin_wall_sections(
+    mesh: Mesh,
+    thickness: np.ndarray,
+    minimum_thickness: float,
+    num_slices: int = DEFAULT_NUM_SLICES,
+) -> list[Slice]:
+    """
+    Gather the vertices of walls thinner than a minimum into slices.
+
+    This is the measured counterpart of detect_narrow_cross_sections: a
+    vertex is included by its wall thickness, as from measure_wall_thickness,
+    rather than by the radius of its slice. The result can be passed to
+    CrossSectionThickener.thicken in the same way.
+
+    Args:
+        mesh: The Mesh object containing vertices and faces.
+        thickness: The wall thickness at every vertex.
+        minimum_thickness: The thinnest printable wall.
+        num_slices: Number of horizontal slices to group the vertices into.
+
+    Returns:
+        A list of Slices holding the thin vertices of each slice.
 
-    return narrow_sections
+    Raises:
+        ValueError: If num_slices is less than one.
+    """
+    if num_slices < 1:
+        raise ValueError("Number of slices must be at least one.")
+    z_values = np.asarray(mesh.vertex_array[:, 2], dtype=np.float64)
+    min_z = float(z_values.min())
+    slice_height = (float(z_values.max()) - min_z) / num_slices
+    members = np.flatnonzero(np.asarray(thickness) < minimum_thickness)
+    if slice_height == 0:
+        slice_indices = np.zeros(len(z_values), dtype=np.intp)
+    else:
+        slice_indices = np.minimum(
+            assign_slices(z_values, min_z, slice_height), num_slices - 1
+        )
+    return group_into_slices(mesh, members, slice_indices, min_z, slice_height)
@@ -1,14 +1,20 @@
 """Thicken narrow cross-sections."""
 
 import math
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from thicker.domain.mesh import Mesh
+from thicker.domain.offset_fields import Offset, resolve_offsets
 from thicker.domain.slice import Slice
 
+# Relative tolerance of math.isclose, used to detect vertices on a centroid
+_REL_TOL = 1e-09
+
 
 def thicken_cross_section(
-    mesh: Mesh, narrow_sections: list[Slice], offset: float
+    mesh: Mesh, narrow_sections: list[Slice], offset: Offset
 ) -> Mesh:
     threshold = 1.0
     thickener = CrossSectionThickener(threshold, offset)
@@ -17,8 +23,56 @@ def thicken_cross_section(
     return thickened_mesh
 
 
+def map_vertices_to_slices(mesh: Mesh, narrow_sections: list[Slice]) -> np.ndarray:
+    """
+    Map every mesh vertex to the narrow slice that contains it.
+
+    Slices that index into the mesh's own vertex buffer are mapped by index.
+    Other slices are matched by hashing the coordinate tuple. A vertex found
+    in several slices belongs to the first one.
+
+    Args:
+        mesh: The mesh whose vertices are looked up.
+        narrow_sections: The narrow slices of the mesh.
+
+    Returns:
+        np.ndarray: The slice index of every vertex, or -1 outside any slice.
+    """
+    slice_ids = np.full(len(mesh.vertex_array), -1, dtype=np.intp)
+    slice_of_vertex: dict[tuple, int] = {}
+    # Assign in reverse so the first slice containing a vertex wins
+    for slice_id in reversed(range(len(narrow_sections))):
+        narrow_slice = narrow_sections[slice_id]
+        if narrow_slice.source is mesh.vertex_array:
+            slice_ids[narrow_slice.indices] = slice_id
+        else:
+            for vertex in narrow_slice.vertices:
+                slice_of_vertex[vertex] = slice_id
+    if slice_of_vertex:
+        matches = np.fromiter(
+            (slice_of_vertex.get(tuple(v), -1) for v in mesh.vertex_array.tolist()),
+            dtype=np.intp,
+            count=len(mesh.vertex_array),
+        )
+        slice_ids = np.where(
+            (matches >= 0) & ((slice_ids < 0) | (matches < slice_ids)),
+            matches,
+            slice_ids,
+        )
+    return slice_ids
+
+
 class CrossSectionThickener:
-    def __init__(self, threshold: float, offset: float):
+    def __init__(self, threshold: float, offset: Offset):
+        """
+        Initialize the thickener.
+
+        Args:
+            threshold: The radius below which a cross-section is narrow.
+            offset: The distance to move each vertex: one distance, an (N,)
+                array over the mesh vertices, or an OffsetField of the
+                vertex array. thicken_vertex needs one distance.
+        """
         self.threshold = threshold
         self.offset = offset
 
@@ -54,10 +108,43 @@ class CrossSectionThickener:
 
         return vertex[0] + delta_x, vertex[1] + delta_y, vertex[2]
 
+    def thicken_vertices(
+        self,
+        xy: np.ndarray,
+        centroids: np.ndarray,
+        offsets: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Thicken an array of vertices away from their centroids.
+
+        This is the vectorized form of thicken_vertex, using the same
+        math.isclose test to leave coordinates on the centroid in place.
+
+        :param xy: The (K, 2) x-y coordinates of vertices in narrow sections.
+        :param centroids: The (K, 2) centroid of each vertex's cross-section.
+        :param offsets: The (K,) offset of each vertex; self.offset if omitted.
+
+        :return: The (K, 2) thickened x-y coordinates.
+        """
+        if offsets is None:
+            offsets = self.offset
+        else:
+            offsets = np.asarray(offsets, dtype=np.float64)[:, np.newaxis]
+        deltas = xy - centroids
+        on_centroid = np.abs(deltas) <= _REL_TOL * np.maximum(
+            np.abs(xy), np.abs(centroids)
+        )
+        return xy + np.where(on_centroid, 0.0, np.copysign(offsets, deltas))
+
     def thicken(self, mesh: Mesh, narrow_sections: list[Slice]) -> Mesh:
         """
         Thicken the narrow cross-sections of the mesh.
 
+        Each vertex is looked up once in a map from coordinates to slice, and
+        each slice centroid is computed once, so the work is linear in the
+        number of vertices. A varying offset is evaluated over the whole
+        vertex buffer, then applied to the slice members in the same pass.
+
         Args:
             mesh: The original mesh to be thickened.
             narrow_sections: A list of Slices where narrow cross-sections
@@ -66,28 +153,40 @@ class CrossSectionThickener:
         Returns:
             A new Mesh object with thickened cross-sections.
         """
-        new_vertices = []
-        slice_vertices = []
-        for narrow_section in narrow_sections:
-            slice_vertices.extend(iter(narrow_section.vertices))
-        for x, y, z in mesh.vertices:
-            if (x, y, z) in slice_vertices:
-                new_vertex = self.get_thickened_vertex(x, y, z, narrow_sections)
-                new_vertices.append(new_vertex)
-            else:
-                new_vertices.append((x, y, z))
-        return Mesh(vertices=new_vertices, faces=mesh.faces)
-
-    def get_thickened_vertex(
-        self, x: float, y: float, z: float, narrow_sections: list[Slice]
-    ) -> Tuple[float, float, float]:
-        """Adjust vertices at detected narrow sections."""
-        for narrow_slice in narrow_sections:
-            if (x, y, z) in narrow_slice.vertices:
-                # Thicken according to the slice centroid
-                # Move x and y radially from the slice centroid
-                slice_centroid = narrow_slice.centroid()
-                return self.thicken_vertex(
-                    vertex=(x, y, z),
-                    centroid=slice_centroid,
-                )
+        new_vertices = np.array(mesh.vertex_array, dtype=np.float64)
+        members, thickened_xy = self.thicken_members(mesh, narrow_sections)
+        new_vertices[members, :2] = thickened_xy
+        return Mesh(vertices=new_vertices, faces=mesh.face_array)
+
+    def thicken_members(
+        self, mesh: Mesh, narrow_sections: list[Slice]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Thicken the narrow cross-sections without copying the mesh.
+
+        Only the vertices in narrow sections are gathered, so the caller can
+        write them back into whichever vertex buffer it owns.
+
+        Args:
+            mesh: The mesh to be thickened; it is not modified.
+            narrow_sections: A list of Slices where narrow cross-sections
+                were detected.
+
+        Returns:
+            The indices of the vertices in narrow sections and their (K, 2)
+            thickened x-y coordinates.
+        """
+        slice_ids = map_vertices_to_slices(mesh, narrow_sections)
+        members = np.flatnonzero(slice_ids >= 0)
+        if not len(members):
+            return members, np.empty((0, 2))
+        centroids = np.array([s.centroid() for s in narrow_sections])
+        offsets = resolve_offsets(
+            self.offset, np.asarray(mesh.vertex_array, dtype=np.float64)
+        )
+        thickened_xy = self.thicken_vertices(
+            np.asarray(mesh.vertex_array[members, :2], dtype=np.float64),
+            centroids[slice_ids[members]],
+            None if np.ndim(offsets) == 0 else offsets[members],
+        )
+        return members, thickened_xy
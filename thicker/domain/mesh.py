@@ -1,24 +1,213 @@
 """Define the Mesh class."""
 
-from typing import List, Tuple
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+Vertex = Tuple[float, float, float]
+Face = Tuple[int, int, int]
+VertexArray = npt.NDArray[np.floating]
+FaceArray = npt.NDArray[np.integer]
+VertexData = Union[VertexArray, Sequence[Vertex]]
+FaceData = Union[FaceArray, Sequence[Face]]
+
+
+def as_vertex_array(vertices: VertexData) -> VertexArray:
+    """
+    Return vertices as an (N, 3) floating point array.
+
+    Floating point (N, 3) arrays are returned as they are, without copying,
+    so memory-mapped or single precision buffers keep their storage.
+
+    Args:
+        vertices: An (N, 3) array or a sequence of (x, y, z) tuples.
+
+    Returns:
+        VertexArray: The vertices as an (N, 3) array.
+    """
+    array = np.asarray(vertices)
+    if not np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float64)
+    return array if array.shape[1:] == (3,) else array.reshape(-1, 3)
+
+
+def as_face_array(faces: FaceData) -> FaceArray:
+    """
+    Return faces as an (M, 3) integer index array.
+
+    Args:
+        faces: An (M, 3) array or a sequence of vertex index triples.
+
+    Returns:
+        FaceArray: The faces as an (M, 3) array.
+    """
+    array = np.asarray(faces)
+    if not np.issubdtype(array.dtype, np.integer):
+        array = array.astype(np.intp)
+    return array if array.shape[1:] == (3,) else array.reshape(-1, 3)
+
+
+@dataclass(frozen=True)
+class MeshStats:
+    """Dimensions of a mesh, summarised from its vertex buffer."""
+
+    min_corner: Vertex
+    max_corner: Vertex
+    height: float
+    base_height: float
+    # None when no vertex lies above the base height
+    radius: Optional[float]
+
+
+def calculate_stats(vertices: VertexArray, base_height_fraction: float) -> MeshStats:
+    """
+    Summarise the dimensions of a vertex buffer with vectorized reductions.
+
+    The base height is `base_height_fraction` of the mesh height, measured
+    from z = 0. The radius is the largest distance from the z-axis of any
+    vertex above the base height.
+
+    Args:
+        vertices (VertexArray): The (N, 3) vertex coordinates.
+        base_height_fraction (float): The fraction of the height that is base.
+
+    Returns:
+        MeshStats: The bounding box, height, base height and radius.
+
+    Raises:
+        ValueError: If there are no vertices.
+    """
+    if not len(vertices):
+        raise ValueError("Mesh contains no vertices.")
+    vertices = np.asarray(vertices, dtype=np.float64)
+    min_corner = tuple(vertices.min(axis=0).tolist())
+    max_corner = tuple(vertices.max(axis=0).tolist())
+    height = max_corner[2] - min_corner[2]
+    base_height = base_height_fraction * height
+
+    above_base = vertices[vertices[:, 2] > base_height]
+    radius = None
+    if len(above_base):
+        x, y = above_base[:, 0], above_base[:, 1]
+        radius = math.sqrt(float((x * x + y * y).max()))
+
+    return MeshStats(min_corner, max_corner, height, base_height, radius)
+
+
+def calculate_chunked_stats(
+    read_chunks: Callable[[], Iterable[VertexArray]], base_height_fraction: float
+) -> MeshStats:
+    """
+    Summarise the dimensions of a vertex stream without holding it in memory.
+
+    The base height depends on the full height, so the stream is read twice:
+    once for the bounding box and once for the radius above the base. The
+    result equals calculate_stats on the concatenated chunks.
+
+    Args:
+        read_chunks (Callable[[], Iterable[VertexArray]]): Returns a fresh
+            iterable of (K, 3) vertex chunks each time it is called.
+        base_height_fraction (float): The fraction of the height that is base.
+
+    Returns:
+        MeshStats: The bounding box, height, base height and radius.
+
+    Raises:
+        ValueError: If there are no vertices.
+    """
+    lower = np.full(3, np.inf)
+    upper = np.full(3, -np.inf)
+    for chunk in read_chunks():
+        if len(chunk):
+            np.minimum(lower, chunk.min(axis=0), out=lower)
+            np.maximum(upper, chunk.max(axis=0), out=upper)
+    if not np.isfinite(lower).all():
+        raise ValueError("Mesh contains no vertices.")
+    min_corner = tuple(lower.tolist())
+    max_corner = tuple(upper.tolist())
+    height = max_corner[2] - min_corner[2]
+    base_height = base_height_fraction * height
+
+    max_squared_radius = -1.0  # -1 marks no vertex above the base
+    for chunk in read_chunks():
+        chunk = np.asarray(chunk, dtype=np.float64)
+        above_base = chunk[chunk[:, 2] > base_height]
+        if len(above_base):
+            x, y = above_base[:, 0], above_base[:, 1]
+            max_squared_radius = max(max_squared_radius, float((x * x + y * y).max()))
+    radius = math.sqrt(max_squared_radius) if max_squared_radius >= 0 else None
+
+    return MeshStats(min_corner, max_corner, height, base_height, radius)
 
 
 class Mesh:
     """Define the Polygonal Mesh Representation.
 
+    Vertices are held in an (N, 3) float array and faces in an (M, 3)
+    integer array of vertex indices. The `vertices` and `faces` properties
+    are list-of-tuples views for callers that predate the array buffers.
+
     Edges are not included at this time and
     could be dynamically calculated from faces."""
 
-    def __init__(
-        self,
-        vertices: List[Tuple[float, float, float]],
-        faces: List[Tuple[int, int, int]],
-    ):
-        self.vertices = vertices
-        self.faces = faces
+    def __init__(self, vertices: VertexData, faces: FaceData):
+        self.vertex_array = as_vertex_array(vertices)
+        self.face_array = as_face_array(faces)
+
+    @property
+    def vertex_array(self) -> VertexArray:
+        """The (N, 3) vertex buffer."""
+        return self._vertex_array
+
+    @vertex_array.setter
+    def vertex_array(self, vertices: VertexArray) -> None:
+        self._vertex_array = vertices
+        self._stats: Dict[float, MeshStats] = {}
+
+    def stats(self, base_height_fraction: float) -> MeshStats:
+        """
+        Return the dimensions of the mesh, computed once and then cached.
+
+        The cache is cleared when a new vertex buffer is assigned; edit the
+        buffer in place only before asking for statistics.
+
+        Args:
+            base_height_fraction (float): The fraction of the height that is base.
+
+        Returns:
+            MeshStats: The bounding box, height, base height and radius.
+        """
+        if base_height_fraction not in self._stats:
+            self._stats[base_height_fraction] = calculate_stats(
+                self.vertex_array, base_height_fraction
+            )
+        return self._stats[base_height_fraction]
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """The vertices as a list of (x, y, z) tuples of Python floats."""
+        return [tuple(vertex) for vertex in self.vertex_array.tolist()]
+
+    @vertices.setter
+    def vertices(self, vertices: VertexData) -> None:
+        self.vertex_array = as_vertex_array(vertices)
+
+    @property
+    def faces(self) -> List[Face]:
+        """The faces as a list of vertex index tuples of Python ints."""
+        return [tuple(face) for face in self.face_array.tolist()]
+
+    @faces.setter
+    def faces(self, faces: FaceData) -> None:
+        self.face_array = as_face_array(faces)
 
     def __eq__(self, other):
         """Overrides the default implementation"""
         if isinstance(other, Mesh):
-            return (self.vertices == other.vertices) and (self.faces == other.faces)
+            return np.array_equal(
+                self.vertex_array, other.vertex_array
+            ) and np.array_equal(self.face_array, other.face_array)
         return False
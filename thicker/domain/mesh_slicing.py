@@ -0,0 +1,248 @@
+"""Planar cross-sections of a triangle mesh.
+
+Every triangle is intersected with a set of horizontal planes in one
+vectorized pass. Each crossing gives a segment, directed by the triangle's
+winding so that the sections of a closed, outward-facing mesh run
+counterclockwise seen from above. Area, perimeter and centroid are sums
+over the directed segments, so they need no stitching; the segments are
+stitched into polygons only when asked for. Coincident vertices are welded
+first, so a triangle soup such as an STL file stitches like an indexed mesh.
+
+A vertex exactly on a plane counts as above it, so triangles lying in a
+plane and edges touching it from above give no segments.
+"""
+
+from functools import cached_property
+from typing import List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from thicker.domain.mesh import FaceData, Mesh, VertexData
+from thicker.domain.welding import weld_vertices
+
+# The corner that ends each edge of a triangle, edge k running k -> k + 1
+_NEXT_CORNER = np.array([1, 2, 0])
+
+
+def section_heights(min_z: float, max_z: float, num_slices: int) -> np.ndarray:
+    """
+    Return the mid-heights of equal horizontal slices of a height range.
+
+    Args:
+        min_z (float): The bottom of the lowest slice.
+        max_z (float): The top of the highest slice.
+        num_slices (int): The number of slices.
+
+    Returns:
+        np.ndarray: The num_slices plane heights, in ascending order.
+
+    Raises:
+        ValueError: If num_slices is less than one.
+    """
+    if num_slices < 1:
+        raise ValueError("Number of slices must be at least one.")
+    slice_height = (max_z - min_z) / num_slices
+    return min_z + (np.arange(num_slices) + 0.5) * slice_height
+
+
+class MeshSections:
+    """The cross-sections of a mesh at a set of z-planes.
+
+    The per-plane statistics are arrays indexed like the planes. Polygons
+    are stitched for one plane at a time, on request."""
+
+    def __init__(self, vertices: VertexData, faces: FaceData, z_values: npt.ArrayLike):
+        """
+        Intersect every triangle with every plane.
+
+        Only the triangle and plane pairs that cross are visited: the planes
+        each triangle spans are found by binary search, so the work grows
+        with the number of segments rather than triangles times planes.
+
+        Args:
+            vertices (VertexData): The (N, 3) vertex coordinates.
+            faces (FaceData): The (M, 3) vertex indices of the triangles.
+            z_values (ArrayLike): The heights of the planes, in any order.
+        """
+        # Weld exact duplicates, so triangles that share an edge in space
+        # also share its vertex indices
+        vertices, faces = weld_vertices(vertices, faces)
+        vertices = np.asarray(vertices, dtype=np.float64)
+        self.z_values = np.asarray(z_values, dtype=np.float64).reshape(-1)
+        self._num_vertices = len(vertices)
+
+        # Find the planes that each triangle spans, min z < plane <= max z
+        order = np.argsort(self.z_values, kind="stable")
+        sorted_z = self.z_values[order]
+        corner_z = vertices[:, 2][faces]
+        first = np.searchsorted(sorted_z, corner_z.min(axis=1), side="right")
+        last = np.searchsorted(sorted_z, corner_z.max(axis=1), side="right")
+        counts = last - first
+
+        # One row per crossing triangle and plane pair
+        triangle = np.repeat(np.arange(len(faces)), counts)
+        offsets = np.arange(len(triangle)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        plane = order[np.repeat(first, counts) + offsets]
+        corners = faces[triangle]
+        plane_z = self.z_values[plane]
+        below = corner_z[triangle] < plane_z[:, None]
+        next_below = below[:, _NEXT_CORNER]
+
+        # The plane leaves the triangle through the edge that climbs across
+        # it and enters through the edge that descends across it
+        up_edge = np.argmax(below & ~next_below, axis=1)
+        down_edge = np.argmax(~below & next_below, axis=1)
+        start, start_key = self._crossing(vertices, corners, down_edge, plane_z)
+        end, end_key = self._crossing(vertices, corners, up_edge, plane_z)
+
+        # Keep the segments grouped by plane
+        by_plane = np.argsort(plane, kind="stable")
+        self._plane = plane[by_plane]
+        self._start = start[by_plane]
+        self._end = end[by_plane]
+        self._start_key = start_key[by_plane]
+        self._end_key = end_key[by_plane]
+
+    def _crossing(
+        self,
+        vertices: np.ndarray,
+        corners: np.ndarray,
+        edge: np.ndarray,
+        plane_z: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Intersect one edge of each triangle with its plane.
+
+        The point is computed from the edge's lower-indexed welded vertex,
+        so both triangles sharing an edge find exactly the same point.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The (S, 2) x-y points and a key
+                naming each edge by its two welded vertex indices.
+        """
+        rows = np.arange(len(corners))
+        a = corners[rows, edge]
+        b = corners[rows, _NEXT_CORNER[edge]]
+        low, high = np.minimum(a, b), np.maximum(a, b)
+        p, q = vertices[low], vertices[high]
+        t = (plane_z - p[:, 2]) / (q[:, 2] - p[:, 2])
+        points = p[:, :2] + t[:, None] * (q[:, :2] - p[:, :2])
+        return points, low.astype(np.int64) * self._num_vertices + high
+
+    def __len__(self) -> int:
+        return len(self.z_values)
+
+    def _per_plane(self, values: np.ndarray) -> np.ndarray:
+        """Sum segment values by plane."""
+        return np.bincount(self._plane, weights=values, minlength=len(self))
+
+    @cached_property
+    def _cross(self) -> np.ndarray:
+        """The shoelace term x_start * y_end - x_end * y_start of each segment."""
+        return self._start[:, 0] * self._end[:, 1] - self._end[:, 0] * self._start[:, 1]
+
+    @cached_property
+    def areas(self) -> np.ndarray:
+        """The enclosed area of every section, holes subtracted."""
+        return 0.5 * self._per_plane(self._cross)
+
+    @cached_property
+    def perimeters(self) -> np.ndarray:
+        """The total length of every section's outline."""
+        lengths = np.hypot(*(self._end - self._start).T)
+        return self._per_plane(lengths)
+
+    @cached_property
+    def centroids(self) -> np.ndarray:
+        """The (P, 2) area centroids of the sections, NaN where empty."""
+        sums = np.stack(
+            [
+                self._per_plane(
+                    (self._start[:, axis] + self._end[:, axis]) * self._cross
+                )
+                for axis in (0, 1)
+            ],
+            axis=1,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return sums / (6 * self.areas[:, None])
+
+    def centroid(self, index: int) -> Optional[Tuple[float, float]]:
+        """
+        Return the centroid of one section.
+
+        Args:
+            index (int): The index of the plane.
+
+        Returns:
+            Optional[Tuple[float, float]]: The (x, y) centroid, or None if
+                the section encloses no area.
+        """
+        if self.areas[index] == 0:
+            return None
+        centroid_x, centroid_y = self.centroids[index].tolist()
+        return centroid_x, centroid_y
+
+    def polygons(self, index: int) -> List[np.ndarray]:
+        """
+        Stitch the segments of one section into closed polygons.
+
+        Consecutive segments share the mesh edge they cross. Open chains,
+        left where the mesh has holes, are not returned.
+
+        Args:
+            index (int): The index of the plane.
+
+        Returns:
+            List[np.ndarray]: One (K, 3) array per polygon, its points in
+                order without repeating the first; outer boundaries run
+                counterclockwise and holes clockwise for an outward-facing
+                mesh.
+        """
+        lower, upper = np.searchsorted(self._plane, [index, index + 1])
+        start_key = self._start_key[lower:upper]
+        end_key = self._end_key[lower:upper]
+        starts = self._start[lower:upper]
+
+        # The segment that starts where each segment ends, or -1
+        by_start = np.argsort(start_key, kind="stable")
+        sorted_keys = np.append(start_key[by_start], -1)
+        position = np.searchsorted(sorted_keys[:-1], end_key)
+        following = np.where(
+            sorted_keys[position] == end_key, np.append(by_start, -1)[position], -1
+        ).tolist()
+
+        polygons = []
+        visited = [False] * len(following)
+        for first in range(len(following)):
+            if visited[first]:
+                continue
+            loop = []
+            segment = first
+            while segment >= 0 and not visited[segment]:
+                visited[segment] = True
+                loop.append(segment)
+                segment = following[segment]
+            if segment == first:
+                points = starts[loop]
+                z = np.full((len(loop), 1), self.z_values[index])
+                polygons.append(np.hstack([points, z]))
+        return polygons
+
+
+def slice_mesh(mesh: Mesh, z_values: npt.ArrayLike) -> MeshSections:
+    """
+    Cut a mesh with horizontal planes.
+
+    Args:
+        mesh (Mesh): The mesh to cut.
+        z_values (ArrayLike): The heights of the planes.
+
+    Returns:
+        MeshSections: The sections, with per-plane area, perimeter and
+            centroid, and polygons on request.
+    """
+    return MeshSections(mesh.vertex_array, mesh.face_array, z_values)
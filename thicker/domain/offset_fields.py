@@ -0,0 +1,125 @@
+"""Offsets that vary from vertex to vertex.
+
+Wherever a transformation takes an offset it accepts an Offset: one distance
+for every vertex, an (N,) array with one distance per vertex, or an
+OffsetField that computes the (N,) distances from the (N, 3) vertex array in
+one vectorized call. The transformation then moves all the vertices in a
+single pass, however the distances vary.
+"""
+
+from typing import Callable, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from thicker.domain.mesh import VertexArray
+
+OffsetField = Callable[[VertexArray], npt.ArrayLike]
+Offset = Union[float, npt.ArrayLike, OffsetField]
+
+
+def resolve_offsets(offset: Offset, vertices: VertexArray) -> Union[float, np.ndarray]:
+    """
+    Evaluate an offset over a vertex array.
+
+    Args:
+        offset (Offset): A distance, an (N,) array of distances, or an
+            OffsetField.
+        vertices (VertexArray): The (N, 3) vertices being moved.
+
+    Returns:
+        Union[float, np.ndarray]: A single distance unchanged, otherwise
+            the (N,) distances in double precision.
+
+    Raises:
+        ValueError: If the offsets do not match the vertices one to one.
+    """
+    if callable(offset):
+        offset = offset(vertices)
+    if np.ndim(offset) == 0:
+        return offset
+    offsets = np.asarray(offset, dtype=np.float64)
+    if offsets.shape != (len(vertices),):
+        raise ValueError(
+            f"Offsets have shape {offsets.shape}, "
+            f"but there are {len(vertices)} vertices."
+        )
+    return offsets
+
+
+def offset_column(offset: Offset, vertices: VertexArray) -> Union[float, np.ndarray]:
+    """
+    Evaluate an offset so that it scales an (N, 3) array of directions.
+
+    Args:
+        offset (Offset): A distance, an (N,) array of distances, or an
+            OffsetField.
+        vertices (VertexArray): The (N, 3) vertices being moved.
+
+    Returns:
+        Union[float, np.ndarray]: A single distance, or an (N, 1) column.
+    """
+    offsets = resolve_offsets(offset, vertices)
+    return offsets if np.ndim(offsets) == 0 else offsets[:, np.newaxis]
+
+
+def falloff_weights(values: npt.ArrayLike, full: float, zero: float) -> np.ndarray:
+    """
+    Ease weights from 1 down to 0 across a range of values.
+
+    The weight is 1 at or below `full`, 0 at or above `zero`, and follows a
+    smoothstep curve in between, so a field built from it has no kinks.
+    NaN values get a weight of 0.
+
+    Args:
+        values (ArrayLike): The values to weigh, such as wall thicknesses.
+        full (float): The largest value with the full weight.
+        zero (float): The smallest value with no weight.
+
+    Returns:
+        np.ndarray: The weights, between 0 and 1.
+
+    Raises:
+        ValueError: If `zero` is not above `full`.
+    """
+    if zero <= full:
+        raise ValueError("Falloff must end above where it starts.")
+    values = np.asarray(values, dtype=np.float64)
+    t = np.clip((zero - values) / (zero - full), 0.0, 1.0)
+    return np.nan_to_num(t * t * (3.0 - 2.0 * t))
+
+
+def thin_wall_offsets(
+    thickness: npt.ArrayLike,
+    minimum_thickness: float,
+    offset: float,
+    falloff: float = 0.0,
+) -> np.ndarray:
+    """
+    Offset only the vertices of thin walls.
+
+    Vertices of walls thinner than the minimum get the full offset, easing
+    to none at `falloff` above the minimum, so that thin regions grow and
+    blend into the walls around them while the rest of the mesh stays put.
+
+    Args:
+        thickness (ArrayLike): The wall thickness at every vertex, as from
+            measure_wall_thickness.
+        minimum_thickness (float): The thinnest printable wall.
+        offset (float): The offset of the thinnest walls.
+        falloff (float): The thickness range above the minimum over which
+            the offset eases out.
+
+    Returns:
+        np.ndarray: The (N,) offsets, 0 where the thickness is unknown.
+
+    Raises:
+        ValueError: If falloff is negative.
+    """
+    if falloff < 0:
+        raise ValueError("Falloff must be non-negative.")
+    thickness = np.asarray(thickness, dtype=np.float64)
+    if falloff == 0:
+        return np.where(thickness < minimum_thickness, float(offset), 0.0)
+    weights = falloff_weights(thickness, minimum_thickness, minimum_thickness + falloff)
+    return offset * weights
@@ -0,0 +1,274 @@
+"""Transform vertex buffers on several cores through shared memory.
+
+The vertices are copied once into a block of shared memory, and each worker
+process transforms a contiguous chunk of rows in that block in place. Only
+the name of the block and the chunk bounds are sent to the workers, never
+the vertex data.
+
+Every transformation here moves each vertex independently of the others,
+and the chunks depend only on the chunk size, so the result is the same bit
+for bit whatever the number of workers.
+"""
+
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from thicker.domain.mesh import Mesh, VertexArray
+from thicker.domain.offset_fields import Offset, offset_column, resolve_offsets
+from thicker.domain.transformations import (
+    BatchNormalCalculator,
+    HemisphericalCylinderTransformation,
+    MeshNormalCalculator,
+    NormalCalculator,
+    as_batch_normal_calculator,
+    thicken_mesh,
+)
+
+# Transforms an (N, 3) block of vertices given its offsets, like
+# HemisphericalCylinderTransformation.transform_vertices
+VertexTransform = Callable[[VertexArray, Offset], VertexArray]
+
+# The number of vertices each worker transforms at a time
+DEFAULT_CHUNK_VERTICES = 16384
+
+
+@dataclass(frozen=True)
+class NormalOffsetTransform:
+    """Move vertices along their normals, as thicken_mesh does, one block at a
+    time. The normal calculator must be picklable to run in workers."""
+
+    normal_calculator: Union[NormalCalculator, BatchNormalCalculator]
+
+    def __call__(self, vertices: VertexArray, offset: Offset) -> VertexArray:
+        vertices = np.asarray(vertices, dtype=np.float64)
+        normals = as_batch_normal_calculator(self.normal_calculator)(vertices)
+        return vertices + normals * offset_column(offset, vertices)
+
+
+def _close(memories: List[SharedMemory], error: Optional[BaseException]) -> None:
+    """Detach from shared memory, first dropping the views held by a failure."""
+    if error is not None:
+        traceback.clear_frames(error.__traceback__)
+    for memory in memories:
+        memory.close()
+
+
+def _write_chunk(
+    transform: VertexTransform,
+    memories: List[SharedMemory],
+    num_vertices: int,
+    offset: Optional[float],
+    start: int,
+    stop: int,
+) -> None:
+    """Transform rows start to stop of the shared vertices in place, with
+    one offset, or without one, the shared offsets of those rows."""
+    vertices = np.ndarray((num_vertices, 3), dtype=np.float64, buffer=memories[0].buf)
+    if len(memories) > 1:
+        offsets = np.ndarray((num_vertices,), dtype=np.float64, buffer=memories[1].buf)
+        offset = offsets[start:stop]
+    vertices[start:stop] = transform(vertices[start:stop], offset)
+
+
+def _transform_chunk(
+    transform: VertexTransform,
+    names: List[str],
+    num_vertices: int,
+    offset: Optional[float],
+    start: int,
+    stop: int,
+) -> None:
+    """Run in a worker: attach to the shared blocks and transform a chunk."""
+    memories = [SharedMemory(name=name) for name in names]
+    try:
+        _write_chunk(transform, memories, num_vertices, offset, start, stop)
+    except BaseException as error:
+        _close(memories, error)
+        raise
+    _close(memories, None)
+
+
+class ParallelTransformer:
+    """Runs vertex transformations over a pool of worker processes.
+
+    Use it as a context manager to keep one pool for many calls, as when
+    streaming a mesh; otherwise each call starts and stops its own pool.
+    With one worker, or no more vertices than one chunk, the transformation
+    runs in this process."""
+
+    def __init__(self, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_VERTICES):
+        """
+        Initialize the transformer.
+
+        Args:
+            workers (int): The number of worker processes.
+            chunk_size (int): The number of vertices per chunk.
+
+        Raises:
+            ValueError: If workers or chunk_size is less than one.
+        """
+        if workers < 1:
+            raise ValueError("Number of workers must be at least one.")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least one.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "ParallelTransformer":
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def chunks(self, num_vertices: int) -> List[Tuple[int, int]]:
+        """
+        Split a vertex buffer into the chunks given to the workers.
+
+        Args:
+            num_vertices (int): The number of vertices.
+
+        Returns:
+            List[Tuple[int, int]]: The start and stop row of every chunk.
+        """
+        starts = range(0, num_vertices, self.chunk_size)
+        return [(start, min(start + self.chunk_size, num_vertices)) for start in starts]
+
+    def transform_vertices(
+        self, transform: VertexTransform, vertices: VertexArray, offset: Offset
+    ) -> VertexArray:
+        """
+        Transform a vertex buffer chunk by chunk in the worker processes.
+
+        Offset arrays are shared with the workers like the vertices, and
+        OffsetFields are evaluated in this process, over the whole buffer.
+
+        Args:
+            transform (VertexTransform): Transforms a block of vertices with
+                its offsets; it must be picklable, such as the bound
+                transform_vertices of a HemisphericalCylinderTransformation.
+            vertices (VertexArray): The (N, 3) vertex coordinates.
+            offset (Offset): One distance, an (N,) array, or an OffsetField.
+
+        Returns:
+            VertexArray: The (N, 3) transformed vertices, in double precision.
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if self.workers == 1 or len(vertices) <= self.chunk_size:
+            return transform(vertices, offset)
+        if self._executor is not None:
+            return self._run(self._executor, transform, vertices, offset)
+        with self:
+            return self._run(self._executor, transform, vertices, offset)
+
+    def _run(
+        self,
+        executor: Executor,
+        transform: VertexTransform,
+        vertices: VertexArray,
+        offset: Offset,
+    ) -> VertexArray:
+        """Share the buffers, transform every chunk and copy the result out."""
+        offsets = resolve_offsets(offset, vertices)
+        if np.ndim(offsets) == 0:
+            arrays, offset = [vertices], offsets
+        else:
+            # Workers read their offsets from shared memory too
+            arrays, offset = [vertices, offsets], None
+        memories = [SharedMemory(create=True, size=array.nbytes) for array in arrays]
+        try:
+            result = self._share_and_wait(executor, transform, memories, arrays, offset)
+        except BaseException as error:
+            _close(memories, error)
+            raise
+        finally:
+            for memory in memories:
+                memory.unlink()
+        _close(memories, None)
+        return result
+
+    def _share_and_wait(
+        self,
+        executor: Executor,
+        transform: VertexTransform,
+        memories: List[SharedMemory],
+        arrays: List[np.ndarray],
+        offset: Optional[float],
+    ) -> VertexArray:
+        """Copy the arrays into shared memory and wait for every chunk."""
+        for memory, array in zip(memories, arrays):
+            np.ndarray(array.shape, dtype=np.float64, buffer=memory.buf)[:] = array
+        names = [memory.name for memory in memories]
+        num_vertices = len(arrays[0])
+        futures = [
+            executor.submit(
+                _transform_chunk, transform, names, num_vertices, offset, start, stop
+            )
+            for start, stop in self.chunks(num_vertices)
+        ]
+        for future in futures:
+            future.result()
+        shared = np.ndarray((num_vertices, 3), dtype=np.float64, buffer=memories[0].buf)
+        return shared.copy()
+
+    def transform(
+        self,
+        transformation: HemisphericalCylinderTransformation,
+        mesh: Mesh,
+        offset: Offset,
+    ) -> Mesh:
+        """
+        Apply a HemisphericalCylinderTransformation in the workers.
+
+        Args:
+            transformation (HemisphericalCylinderTransformation): The
+                transformation to apply.
+            mesh (Mesh): The mesh to transform.
+            offset (Offset): One distance, an (N,) array, or an OffsetField.
+
+        Returns:
+            Mesh: A new mesh with transformed vertices and unchanged faces.
+        """
+        vertices = self.transform_vertices(
+            transformation.transform_vertices, mesh.vertex_array, offset
+        )
+        return Mesh(vertices=vertices, faces=mesh.face_array)
+
+    def thicken_mesh(
+        self,
+        mesh: Mesh,
+        offset: Offset,
+        normal_calculator: Union[
+            NormalCalculator, BatchNormalCalculator, MeshNormalCalculator
+        ],
+    ) -> Mesh:
+        """
+        Thicken a mesh along its normals, as thicken_mesh does, in the workers.
+
+        Normals from the faces of the mesh need the whole mesh at once, so
+        calculators marked as topological run in this process.
+
+        Args:
+            mesh (Mesh): The original mesh to be thickened.
+            offset (Offset): One distance, an (N,) array, or an OffsetField.
+            normal_calculator (Callable): A per-vertex, batched or
+                topological normal calculator.
+
+        Returns:
+            Mesh: A new Mesh instance with thickened vertices.
+        """
+        if getattr(normal_calculator, "uses_faces", False) is True:
+            return thicken_mesh(mesh, offset, normal_calculator)
+        vertices = self.transform_vertices(
+            NormalOffsetTransform(normal_calculator), mesh.vertex_array, offset
+        )
+        return Mesh(vertices=vertices, faces=mesh.face_array)
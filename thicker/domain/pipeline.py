@@ -0,0 +1,205 @@
+"""Chain transformations over a single vertex buffer.
+
+Each transformation on its own returns a new Mesh, so chaining several
+allocates the mesh once per step. A Pipeline instead passes one
+VertexBuffer through its stages, and every stage writes its result into
+that buffer in place. The faces are shared throughout.
+
+The buffer is copy-on-write by default: the input mesh's vertices are
+shared until the first stage that changes them, which copies them once into
+a double precision buffer that all later stages reuse. The input mesh is
+left untouched, and a pipeline that changes nothing copies nothing. In place
+mode skips the copy and writes into the input mesh's own buffer.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+from thicker.domain.cross_section_analysis import detect_narrow_cross_sections
+from thicker.domain.cross_section_thickening import CrossSectionThickener
+from thicker.domain.mesh import FaceArray, Mesh, VertexArray
+from thicker.domain.offset_fields import Offset, offset_column
+from thicker.domain.slice import Slice
+from thicker.domain.transformations import (
+    BatchNormalCalculator,
+    HemisphericalCylinderTransformation,
+    MeshNormalCalculator,
+    NormalCalculator,
+    as_batch_normal_calculator,
+)
+
+
+class VertexBuffer:
+    """The vertex coordinates passed through a pipeline.
+
+    Stages read the current coordinates from `array` and must call
+    `writable()` for an array they may change. With copy-on-write, the first
+    call copies a shared buffer; later calls return the same copy."""
+
+    def __init__(self, vertices: VertexArray, copy_on_write: bool = True):
+        """
+        Wrap a vertex array.
+
+        Args:
+            vertices (VertexArray): The (N, 3) vertex coordinates.
+            copy_on_write (bool): Copy the vertices before the first write,
+                rather than writing into them.
+
+        Raises:
+            ValueError: If the vertices are to be written in place but are
+                not a writable double precision array.
+        """
+        if not copy_on_write and not (
+            vertices.dtype == np.float64 and vertices.flags.writeable
+        ):
+            raise ValueError(
+                "In-place pipelines need a writable float64 vertex buffer."
+            )
+        self._array = vertices
+        self._owned = not copy_on_write
+        # The number of times the vertices were copied, for diagnostics
+        self.copies = 0
+
+    @property
+    def array(self) -> VertexArray:
+        """The current (N, 3) coordinates, for reading only."""
+        return self._array
+
+    def writable(self) -> VertexArray:
+        """
+        Return the coordinates as an array the caller may change.
+
+        Returns:
+            VertexArray: The (N, 3) double precision buffer of the pipeline.
+        """
+        if not self._owned:
+            self._array = np.array(self._array, dtype=np.float64)
+            self._owned = True
+            self.copies += 1
+        return self._array
+
+
+class Stage(Protocol):
+    """Protocol for one step of a Pipeline."""
+
+    def __call__(self, buffer: VertexBuffer, faces: FaceArray) -> None:
+        """Transform the vertices in `buffer`, writing through writable()."""
+        ...
+
+
+@dataclass(frozen=True)
+class OffsetStage:
+    """Move every vertex along its normal, as thicken_mesh does."""
+
+    offset: Offset
+    normal_calculator: Union[
+        NormalCalculator, BatchNormalCalculator, MeshNormalCalculator
+    ]
+
+    def __call__(self, buffer: VertexBuffer, faces: FaceArray) -> None:
+        vertices = np.asarray(buffer.array, dtype=np.float64)
+        if getattr(self.normal_calculator, "uses_faces", False) is True:
+            normals = self.normal_calculator(vertices, faces)
+        else:
+            normals = as_batch_normal_calculator(self.normal_calculator)(vertices)
+        _add_scaled(buffer, normals, offset_column(self.offset, vertices))
+
+
+@dataclass(frozen=True)
+class HemisphericalCylinderStage:
+    """Apply a HemisphericalCylinderTransformation."""
+
+    transformation: HemisphericalCylinderTransformation
+    offset: Offset
+
+    def __call__(self, buffer: VertexBuffer, faces: FaceArray) -> None:
+        vertices = np.asarray(buffer.array, dtype=np.float64)
+        normals = self.transformation.calculate_normals(vertices)
+        _add_scaled(buffer, normals, offset_column(self.offset, vertices))
+
+
+@dataclass(frozen=True)
+class CrossSectionStage:
+    """Detect the narrow cross-sections, then thicken them.
+
+    The sections are detected on the vertices as they are when the stage
+    runs. Without narrow sections the buffer is not written, so it is not
+    copied either."""
+
+    thickener: CrossSectionThickener
+    # Finds the sections to thicken; by default the slices narrower than
+    # the thickener's threshold
+    detect: Optional[Callable[[Mesh], List[Slice]]] = None
+
+    def __call__(self, buffer: VertexBuffer, faces: FaceArray) -> None:
+        mesh = Mesh(buffer.array, faces)
+        if self.detect is None:
+            narrow_sections = detect_narrow_cross_sections(
+                mesh, self.thickener.threshold
+            )
+        else:
+            narrow_sections = self.detect(mesh)
+        members, thickened_xy = self.thickener.thicken_members(mesh, narrow_sections)
+        if len(members):
+            buffer.writable()[members, :2] = thickened_xy
+
+
+def _add_scaled(
+    buffer: VertexBuffer,
+    directions: np.ndarray,
+    offsets: Union[float, np.ndarray],
+) -> None:
+    """Add offsets times directions to the buffer, reusing the directions."""
+    if np.ndim(offsets) == 0 and offsets == 0:
+        return
+    if (
+        directions.dtype != np.float64
+        or not directions.flags.writeable
+        or np.may_share_memory(directions, buffer.array)
+    ):
+        directions = np.array(directions, dtype=np.float64)
+    np.multiply(directions, offsets, out=directions)
+    vertices = buffer.writable()
+    vertices += directions
+
+
+class Pipeline:
+    """A sequence of stages run over one vertex buffer."""
+
+    def __init__(self, stages: Sequence[Stage], in_place: bool = False):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages (Sequence[Stage]): The stages, in the order they run.
+            in_place (bool): Write into the input mesh's vertex buffer
+                instead of copying it on the first write.
+        """
+        self.stages = list(stages)
+        self.in_place = in_place
+
+    def run(self, mesh: Mesh) -> Mesh:
+        """
+        Run every stage over the mesh's vertices.
+
+        Args:
+            mesh (Mesh): The mesh to transform.
+
+        Returns:
+            Mesh: In place, the input mesh itself, its statistics cache
+                cleared; otherwise a new Mesh, sharing the faces and, if no
+                stage changed them, the vertices of the input.
+
+        Raises:
+            ValueError: If in place, but the mesh's vertex buffer is not a
+                writable double precision array.
+        """
+        buffer = VertexBuffer(mesh.vertex_array, copy_on_write=not self.in_place)
+        for stage in self.stages:
+            stage(buffer, mesh.face_array)
+        if self.in_place:
+            mesh.vertex_array = buffer.array  # Clears the cached statistics
+            return mesh
+        return Mesh(vertices=buffer.array, faces=mesh.face_array)
@@ -0,0 +1,291 @@
+"""Cast rays against a triangle mesh through a bounding-volume hierarchy.
+
+The hierarchy is a linear BVH: the triangles are sorted along a Morton
+curve through their centroids, grouped into leaves of a fixed size, and the
+leaves are paired up level by level into a complete binary tree. Every step
+of the build is a whole-array operation, and so is the traversal, which
+carries a batch of rays down the tree one level at a time as (ray, node)
+pairs, keeping only the pairs whose ray passes through the node's box.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from thicker.domain.mesh import FaceData, VertexData, as_face_array, as_vertex_array
+
+DEFAULT_LEAF_SIZE = 4
+# The Morton code resolution, in bits per axis
+_MORTON_BITS = 10
+# Boxes are padded by this fraction of the mesh size, so that rounding does
+# not let a ray slip past a flat box
+_BOX_PADDING = 1e-9
+# Triangles are widened by this fraction of their edges, so that a ray
+# through a shared edge or vertex hits at least one of its triangles
+_EDGE_TOLERANCE = 1e-9
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert two zero bits after each of the low 10 bits of every value."""
+    values = values.astype(np.uint32)
+    values = (values * np.uint32(0x00010001)) & np.uint32(0xFF0000FF)
+    values = (values * np.uint32(0x00000101)) & np.uint32(0x0F00F00F)
+    values = (values * np.uint32(0x00000011)) & np.uint32(0xC30C30C3)
+    values = (values * np.uint32(0x00000005)) & np.uint32(0x49249249)
+    return values
+
+
+def morton_codes(points: np.ndarray) -> np.ndarray:
+    """
+    Return the 30-bit Morton code of every point in its bounding box.
+
+    Args:
+        points (np.ndarray): The (K, 3) points.
+
+    Returns:
+        np.ndarray: The K codes; sorting by them orders the points along a
+            space-filling curve, so nearby codes are nearby points.
+    """
+    lower = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lower, np.finfo(np.float64).tiny)
+    scale = (1 << _MORTON_BITS) - 1
+    cells = np.clip((points - lower) / extent * scale, 0, scale).astype(np.uint32)
+    return (
+        (_spread_bits(cells[:, 0]) << 2)
+        | (_spread_bits(cells[:, 1]) << 1)
+        | _spread_bits(cells[:, 2])
+    )
+
+
+def _pair_up(corners: np.ndarray, combine: np.ufunc) -> np.ndarray:
+    """Combine the (3, K) corners of sibling boxes, an odd last box alone."""
+    if corners.shape[1] % 2:
+        corners = np.hstack([corners, corners[:, -1:]])
+    return combine(corners[:, 0::2], corners[:, 1::2])
+
+
+def _dot(a: List[np.ndarray], b: List[np.ndarray]) -> np.ndarray:
+    """The dot products of vectors given as x, y and z arrays."""
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a: List[np.ndarray], b: List[np.ndarray]) -> List[np.ndarray]:
+    """The cross products of vectors given as x, y and z arrays."""
+    return [
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ]
+
+
+class BoundingVolumeHierarchy:
+    """A linear BVH over the triangles of a mesh.
+
+    Level k of the tree holds up to 2**k axis-aligned boxes, node i having
+    the children 2i and 2i + 1 on the level below, where they exist. The
+    last level holds the leaves, and only the last leaf may be partly
+    filled."""
+
+    def __init__(
+        self,
+        vertices: VertexData,
+        faces: FaceData,
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+    ):
+        """
+        Build the hierarchy.
+
+        Args:
+            vertices (VertexData): The (N, 3) vertex coordinates.
+            faces (FaceData): The (M, 3) vertex indices of the triangles.
+            leaf_size (int): The number of triangles in each leaf.
+
+        Raises:
+            ValueError: If the mesh has no triangles or leaf_size is less
+                than one.
+        """
+        if leaf_size < 1:
+            raise ValueError("Leaf size must be at least one.")
+        vertices = np.asarray(as_vertex_array(vertices), dtype=np.float64)
+        faces = as_face_array(faces)
+        if not len(faces):
+            raise ValueError("Mesh contains no triangles.")
+        self.leaf_size = leaf_size
+
+        corners = vertices[faces]
+        order = np.argsort(morton_codes(corners.mean(axis=1)), kind="stable")
+        corners = corners[order]
+        self.triangle_index = order
+        self._origin = np.ascontiguousarray(corners[:, 0].T)
+        self._edge1 = np.ascontiguousarray((corners[:, 1] - corners[:, 0]).T)
+        self._edge2 = np.ascontiguousarray((corners[:, 2] - corners[:, 0]).T)
+
+        # Fill the leaves in order, -1 marking the free slots of the last
+        num_leaves = -(-len(faces) // leaf_size)
+        slots = np.full(num_leaves * leaf_size, -1, dtype=np.intp)
+        slots[: len(faces)] = np.arange(len(faces))
+        self._leaves = slots.reshape(-1, leaf_size)
+
+        # Bound the leaves, then every level above them
+        leaf_of = np.arange(len(faces)) // leaf_size
+        lower = np.full((num_leaves, 3), np.inf)
+        upper = np.full((num_leaves, 3), -np.inf)
+        np.minimum.at(lower, leaf_of, corners.min(axis=1))
+        np.maximum.at(upper, leaf_of, corners.max(axis=1))
+        padding = _BOX_PADDING * float(np.ptp(corners.reshape(-1, 3), axis=0).max())
+        # Each level's corners are stored axis by axis, as (3, K) arrays
+        self._lower = [np.ascontiguousarray((lower - padding).T)]
+        self._upper = [np.ascontiguousarray((upper + padding).T)]
+        while self._lower[0].shape[1] > 1:
+            self._lower.insert(0, _pair_up(self._lower[0], np.minimum))
+            self._upper.insert(0, _pair_up(self._upper[0], np.maximum))
+        self.depth = len(self._lower) - 1
+
+    @property
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The (min, max) corners of the box around the whole mesh."""
+        return self._lower[0][:, 0], self._upper[0][:, 0]
+
+    def _enter_boxes(
+        self,
+        level: int,
+        nodes: np.ndarray,
+        rays: np.ndarray,
+        origins: np.ndarray,
+        inverse_directions: np.ndarray,
+        near: np.ndarray,
+        far: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Test which rays pass through their node's box within [near, far].
+
+        The slab test runs one axis at a time on (3, R) ray arrays; a zero
+        direction component gives NaN on a slab's plane, which np.fmin and
+        np.fmax ignore.
+        """
+        enter = near[rays]
+        leave = far[rays]
+        for axis in range(3):
+            origin = origins[axis][rays]
+            inverse = inverse_directions[axis][rays]
+            with np.errstate(invalid="ignore"):
+                t1 = (self._lower[level][axis][nodes] - origin) * inverse
+                t2 = (self._upper[level][axis][nodes] - origin) * inverse
+            enter = np.fmax(enter, np.fmin(t1, t2))
+            leave = np.fmin(leave, np.fmax(t1, t2))
+        return enter <= leave
+
+    def intersect(
+        self,
+        origins: npt.ArrayLike,
+        directions: npt.ArrayLike,
+        min_distance: npt.ArrayLike = 0.0,
+        max_distance: npt.ArrayLike = np.inf,
+        exits_only: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest triangle that each ray hits.
+
+        Distances are measured in units of each ray's direction vector.
+
+        Args:
+            origins (ArrayLike): The (R, 3) ray origins.
+            directions (ArrayLike): The (R, 3) ray directions.
+            min_distance (ArrayLike): Hits nearer than this are ignored, for
+                all rays or per ray.
+            max_distance (ArrayLike): Hits farther than this are ignored,
+                for all rays or per ray.
+            exits_only (bool): Only count triangles the ray passes through
+                from their back, that is where it leaves a closed,
+                outward-facing mesh.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The R hit distances, inf for a
+                miss, and the index of every hit triangle, -1 for a miss.
+        """
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        num_rays = len(origins)
+        near = np.broadcast_to(np.asarray(min_distance, dtype=np.float64), num_rays)
+        far = np.broadcast_to(np.asarray(max_distance, dtype=np.float64), num_rays)
+        columns = np.ascontiguousarray(origins.T)
+        direction_columns = np.ascontiguousarray(directions.T)
+        with np.errstate(divide="ignore"):
+            inverse_columns = 1.0 / direction_columns
+
+        # Carry the rays down the tree as (ray, node) pairs
+        rays = np.arange(num_rays)
+        nodes = np.zeros(num_rays, dtype=np.intp)
+        for level in range(self.depth + 1):
+            if level:
+                rays = np.repeat(rays, 2)
+                nodes = np.repeat(2 * nodes, 2)
+                nodes[1::2] += 1
+                exists = nodes < self._lower[level].shape[1]
+                rays, nodes = rays[exists], nodes[exists]
+            hit = self._enter_boxes(
+                level, nodes, rays, columns, inverse_columns, near, far
+            )
+            rays, nodes = rays[hit], nodes[hit]
+
+        # Test the rays against the triangles of the leaves they reached
+        triangles = self._leaves[nodes].ravel()
+        rays = np.repeat(rays, self.leaf_size)
+        present = triangles >= 0
+        rays, triangles = rays[present], triangles[present]
+        distances = self._hit_triangles(
+            rays, triangles, columns, direction_columns, exits_only
+        )
+        valid = (distances >= near[rays]) & (distances <= far[rays])
+        rays, triangles, distances = rays[valid], triangles[valid], distances[valid]
+
+        # Keep the nearest hit of every ray
+        nearest = np.full(num_rays, np.inf)
+        np.minimum.at(nearest, rays, distances)
+        hit_triangle = np.full(num_rays, -1, dtype=np.intp)
+        best = distances == nearest[rays]
+        hit_triangle[rays[best]] = self.triangle_index[triangles[best]]
+        return nearest, hit_triangle
+
+    def _hit_triangles(
+        self,
+        rays: np.ndarray,
+        triangles: np.ndarray,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        exits_only: bool,
+    ) -> np.ndarray:
+        """
+        Intersect each ray with one triangle, Möller–Trumbore style.
+
+        Like the slab test, this runs on the axis columns of the (3, R) ray
+        and (3, M) triangle arrays.
+
+        Returns:
+            np.ndarray: The distance along each ray to its triangle, NaN
+                where the ray misses it.
+        """
+        direction = [directions[axis][rays] for axis in range(3)]
+        edge1 = [self._edge1[axis][triangles] for axis in range(3)]
+        edge2 = [self._edge2[axis][triangles] for axis in range(3)]
+        offset = [
+            origins[axis][rays] - self._origin[axis][triangles] for axis in range(3)
+        ]
+        p = _cross(direction, edge2)
+        determinant = _dot(edge1, p)
+        # The determinant is negative where the ray meets the triangle's back
+        facing = determinant < 0 if exits_only else determinant != 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse = 1.0 / determinant
+            u = _dot(offset, p) * inverse
+            q = _cross(offset, edge1)
+            v = _dot(direction, q) * inverse
+            distances = _dot(edge2, q) * inverse
+            inside = (
+                facing
+                & (u >= -_EDGE_TOLERANCE)
+                & (v >= -_EDGE_TOLERANCE)
+                & (u + v <= 1 + _EDGE_TOLERANCE)
+            )
+        return np.where(inside, distances, np.nan)
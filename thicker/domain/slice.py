@@ -1,20 +1,89 @@
 """The Slice class  - a set of vertices in a height range."""
 
-from typing import Tuple
+from functools import cached_property
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from thicker.domain.mesh import Vertex, VertexArray, VertexData, as_vertex_array
 
 
 class Slice:
-    def __init__(self, vertices, z_height):
+    """A set of vertices in a height range.
+
+    A slice refers to its vertices by index into a vertex buffer, usually
+    the parent mesh's, instead of holding its own copy. The centroid and
+    radius statistics are computed on first use and cached, so slices are
+    treated as immutable."""
+
+    def __init__(
+        self,
+        vertices: VertexData,
+        z_height: float,
+        indices: Optional[npt.ArrayLike] = None,
+    ):
         """
         Initialize a Slice object.
 
         Args:
-            vertices (list of tuples): List of (x, y, z) vertices in the slice.
+            vertices (VertexData): List of (x, y, z) vertices in the slice,
+                or the vertex buffer that `indices` refers to.
             z_height (float): The z-height at which this slice was taken.
+            indices (Optional[ArrayLike]): Indices of the slice's vertices
+                in `vertices`. All vertices are in the slice if omitted.
         """
-        self.vertices = vertices
+        self.source = as_vertex_array(vertices)
+        if indices is None:
+            indices = np.arange(len(self.source))
+        self.indices = np.asarray(indices, dtype=np.intp)
         self.z_height = z_height
 
+    @classmethod
+    def from_indices(
+        cls, mesh_vertices: VertexArray, indices: npt.ArrayLike, z_height: float
+    ) -> "Slice":
+        """
+        Create a Slice that shares the vertex buffer of its parent mesh.
+
+        Args:
+            mesh_vertices (VertexArray): The parent mesh's (N, 3) vertices.
+            indices (ArrayLike): Indices of the slice's vertices.
+            z_height (float): The z-height at which this slice was taken.
+
+        Returns:
+            Slice: The slice, holding only an index array.
+        """
+        return cls(mesh_vertices, z_height, indices=indices)
+
+    @property
+    def vertex_array(self) -> VertexArray:
+        """The (K, 3) coordinates of the slice's vertices."""
+        return self.source[self.indices]
+
+    @property
+    def vertices(self) -> list[Vertex]:
+        """The slice's vertices as a list of (x, y, z) tuples."""
+        return [tuple(vertex) for vertex in self.vertex_array.tolist()]
+
+    @cached_property
+    def _xy(self) -> np.ndarray:
+        """The x-y coordinates of the slice's vertices, in double precision."""
+        return np.asarray(self.vertex_array[:, :2], dtype=np.float64)
+
+    @cached_property
+    def _radii(self) -> np.ndarray:
+        """The distance of every vertex from the z-axis."""
+        x, y = self._xy[:, 0], self._xy[:, 1]
+        return np.sqrt(x * x + y * y)
+
+    @cached_property
+    def _centroid(self) -> Tuple[float, float]:
+        if not len(self.indices):
+            return 0.0, 0.0
+        centroid_x, centroid_y = self._xy.mean(axis=0).tolist()
+        return centroid_x, centroid_y
+
     def centroid(self) -> Tuple[float, float]:
         """
         Calculate the centroid of the slice in the x-y plane.
@@ -22,33 +91,49 @@ class Slice:
         Returns:
             tuple: The (x, y) coordinates of the centroid.
         """
-        if not self.vertices:
-            return 0.0, 0.0
+        return self._centroid
 
-        x_coordinates = [v[0] for v in self.vertices]
-        y_coordinates = [v[1] for v in self.vertices]
+    @cached_property
+    def max_radius(self) -> float:
+        """The largest distance of a vertex from the z-axis."""
+        self._require_vertices()
+        return float(self._radii.max())
 
-        centroid_x = sum(x_coordinates) / len(x_coordinates)
-        centroid_y = sum(y_coordinates) / len(y_coordinates)
+    @cached_property
+    def min_radius(self) -> float:
+        """The smallest distance of a vertex from the z-axis."""
+        self._require_vertices()
+        return float(self._radii.min())
 
-        return centroid_x, centroid_y
+    @cached_property
+    def bounding_box(self) -> Tuple[Vertex, Vertex]:
+        """The (min, max) corners of the box around the slice's vertices."""
+        self._require_vertices()
+        lower = self.vertex_array.min(axis=0).tolist()
+        upper = self.vertex_array.max(axis=0).tolist()
+        return tuple(lower), tuple(upper)
+
+    def _require_vertices(self) -> None:
+        if not len(self.indices):
+            raise ValueError("Slice contains no vertices.")
 
     def __eq__(self, other):
         """Overrides the default implementation"""
         if isinstance(other, Slice):
-            return (self.vertices == other.vertices) and (
+            return np.array_equal(self.vertex_array, other.vertex_array) and (
                 self.z_height == other.z_height
             )
         return False
 
     def __repr__(self) -> str:
-        num_vertices = len(self.vertices)
+        num_vertices = len(self.indices)
+        preview = [tuple(v) for v in self.source[self.indices[:3]].tolist()]
         if num_vertices == 0:
             vertices_preview = "[]"
         elif num_vertices <= 3:
-            vertices_preview = f"{self.vertices}"
+            vertices_preview = f"{preview}"
         else:
-            vertices_preview = f"{self.vertices[:3]}, ..."
+            vertices_preview = f"{preview}, ..."
 
         return (
             f"Slice(z_height={self.z_height:.2f}, "
@@ -1,10 +1,12 @@
 """Mesh transformations."""
 
-from typing import Callable, Tuple
+from typing import Callable, Protocol, Tuple, Union
 
 import numpy as np
 
-from thicker.domain.mesh import Mesh
+from thicker.domain.mesh import FaceArray, Mesh, Vertex, VertexArray
+from thicker.domain.offset_fields import Offset, offset_column
+from thicker.domain.vectors import unit_vectors
 
 
 def unity_transformation(mesh: Mesh) -> Mesh:
@@ -46,11 +48,119 @@ def calculate_cylindrical_normal(
     return (x / norm, y / norm, 0) if norm != 0 else (0, 0, 0)
 
 
+class BatchNormalCalculator(Protocol):
+    """Protocol for calculating the normals of a whole vertex buffer at once."""
+
+    def __call__(self, vertices: VertexArray) -> VertexArray:
+        """Return an (N, 3) array of normals for an (N, 3) array of vertices."""
+        ...
+
+
+NormalCalculator = Callable[[Vertex], Vertex]
+
+
+def batched(calculator: BatchNormalCalculator) -> BatchNormalCalculator:
+    """
+    Mark a function as a BatchNormalCalculator.
+
+    thicken_mesh passes marked functions the whole vertex buffer instead of
+    adapting them as per-vertex callables.
+    """
+    calculator.is_batched = True
+    return calculator
+
+
+class MeshNormalCalculator(Protocol):
+    """Protocol for calculating vertex normals from the mesh surface."""
+
+    def __call__(self, vertices: VertexArray, faces: FaceArray) -> VertexArray:
+        """Return an (N, 3) array of normals for a mesh's vertices and faces."""
+        ...
+
+
+def topological(calculator: MeshNormalCalculator) -> MeshNormalCalculator:
+    """
+    Mark a function as a MeshNormalCalculator.
+
+    thicken_mesh passes marked functions the face buffer as well as the
+    vertex buffer, so normals can follow the actual surface of the mesh.
+    """
+    calculator.uses_faces = True
+    return calculator
+
+
+@batched
+def calculate_spherical_normals(vertices: VertexArray) -> VertexArray:
+    """
+    Calculate spherical normals for an (N, 3) array of vertices.
+
+    Args:
+        vertices (VertexArray): The vertex coordinates.
+
+    Returns:
+        VertexArray: The normalized vectors, (0, 0, 0) at the origin.
+    """
+    return unit_vectors(np.asarray(vertices, dtype=np.float64))
+
+
+@batched
+def calculate_cylindrical_normals(vertices: VertexArray) -> VertexArray:
+    """
+    Calculate cylindrical normals for an (N, 3) array of vertices.
+
+    Args:
+        vertices (VertexArray): The vertex coordinates.
+
+    Returns:
+        VertexArray: The normal vectors (nx, ny, 0), (0, 0, 0) on the z-axis.
+    """
+    radial = np.array(vertices, dtype=np.float64)
+    radial[:, 2] = 0.0
+    return unit_vectors(radial)
+
+
+# Batched equivalents of the per-vertex calculators
+_BATCHED_CALCULATORS = {
+    calculate_spherical_normal: calculate_spherical_normals,
+    calculate_cylindrical_normal: calculate_cylindrical_normals,
+}
+
+
+def as_batch_normal_calculator(
+    normal_calculator: Union[NormalCalculator, BatchNormalCalculator],
+) -> BatchNormalCalculator:
+    """
+    Adapt a normal calculator to the BatchNormalCalculator protocol.
+
+    Batched calculators are returned unchanged, the built-in per-vertex
+    calculators are swapped for their vectorized equivalents, and any other
+    per-vertex callable is called once per vertex.
+
+    Args:
+        normal_calculator (Callable): A per-vertex or batched calculator.
+
+    Returns:
+        BatchNormalCalculator: A calculator for (N, 3) vertex arrays.
+    """
+    if getattr(normal_calculator, "is_batched", False) is True:
+        return normal_calculator
+    # Compare by identity, as calculators need not be hashable
+    for calculator, batch_calculator in _BATCHED_CALCULATORS.items():
+        if normal_calculator is calculator:
+            return batch_calculator
+
+    def calculate_normals(vertices: VertexArray) -> VertexArray:
+        normals = [normal_calculator(tuple(vertex)) for vertex in vertices.tolist()]
+        return np.array(normals, dtype=np.float64).reshape(-1, 3)
+
+    return calculate_normals
+
+
 def thicken_mesh(
     mesh: Mesh,
-    offset: float,
-    normal_calculator: Callable[
-        [Tuple[float, float, float]], Tuple[float, float, float]
+    offset: Offset,
+    normal_calculator: Union[
+        NormalCalculator, BatchNormalCalculator, MeshNormalCalculator
     ],
 ) -> Mesh:
     """
@@ -58,25 +168,24 @@ def thicken_mesh(
 
     Args:
         mesh (Mesh): The original mesh to be thickened.
-        offset (float): The amount to thicken each vertex.
-        normal_calculator (Callable): A function to calculate the normal vector.
+        offset (Offset): The amount to thicken each vertex: one distance,
+            an (N,) array, or an OffsetField of the vertex array.
+        normal_calculator (Callable): A function to calculate the normal
+            vector, either per vertex, batched over the vertex array, or
+            from the vertex and face arrays of the mesh.
 
     Returns:
         Mesh: A new Mesh instance with thickened vertices.
     """
-    # Apply the offset along the normal vector for each vertex
-    new_vertices = []
-    for vertex in mesh.vertices:
-        normal = normal_calculator(vertex)
-        thickened_vertex = (
-            vertex[0] + normal[0] * offset,
-            vertex[1] + normal[1] * offset,
-            vertex[2] + normal[2] * offset,
-        )
-        new_vertices.append(thickened_vertex)
+    vertices = np.asarray(mesh.vertex_array, dtype=np.float64)
+    if getattr(normal_calculator, "uses_faces", False) is True:
+        normals = normal_calculator(vertices, mesh.face_array)
+    else:
+        normals = as_batch_normal_calculator(normal_calculator)(vertices)
 
-    # Return a new Mesh instance with updated vertices
-    return Mesh(vertices=new_vertices, faces=mesh.faces)
+    # Apply the offset along the normal vector for every vertex at once
+    offsets = offset_column(offset, vertices)
+    return Mesh(vertices=vertices + normals * offsets, faces=mesh.face_array)
 
 
 class HemisphericalCylinderTransformation:
@@ -95,41 +204,42 @@ class HemisphericalCylinderTransformation:
         self.cylinder_height = cylinder_height
         self.radius = radius
 
-    def transform(self, mesh: Mesh, offset: float) -> Mesh:
+    def transform(self, mesh: Mesh, offset: Offset) -> Mesh:
         """
         Transform the vertices of a mesh.
 
         Args:
             mesh (Mesh): The mesh to transform.
-            offset (float): distance to move each vertex in the
-                transformation direction.
+            offset (Offset): distance to move each vertex in the
+                transformation direction: one distance, an (N,) array, or
+                an OffsetField of the vertex array.
 
         Returns:
             Mesh: A new mesh with transformed vertices and unchanged faces.
         """
-        transformed_vertices = [
-            self._transform_vertex(v, offset) for v in mesh.vertices
-        ]
-        return Mesh(vertices=transformed_vertices, faces=mesh.faces)
-
-    def _transform_vertex(
-        self, vertex: Tuple[float, float, float], offset: float
-    ) -> Tuple[float, float, float]:
+        transformed_vertices = self.transform_vertices(mesh.vertex_array, offset)
+        return Mesh(vertices=transformed_vertices, faces=mesh.face_array)
+
+    def transform_vertices(self, vertices: VertexArray, offset: Offset) -> VertexArray:
         """
-        Transform a single vertex based on the hemisphere-topped cylinder logic.
+        Transform a block of vertices, independently of any mesh.
+
+        Each vertex moves along its own normal, so a mesh can be transformed
+        in chunks with the same result as transforming it whole, given an
+        offset array per chunk or an OffsetField.
 
         Args:
-            vertex (Tuple[float, float, float]): The vertex to transform.
+            vertices (VertexArray): The (N, 3) vertex coordinates.
+            offset (Offset): distance to move each vertex in the
+                transformation direction: one distance, an (N,) array, or
+                an OffsetField of the vertex array.
 
         Returns:
-            Tuple[float, float, float]: Transformed vertex coordinates.
+            VertexArray: The (N, 3) transformed vertices, in double precision.
         """
-        normal = self.calculate_normal(vertex)
-        return (
-            vertex[0] + offset * normal[0],
-            vertex[1] + offset * normal[1],
-            vertex[2] + offset * normal[2],
-        )
+        vertices = np.asarray(vertices, dtype=np.float64)
+        offsets = offset_column(offset, vertices)
+        return vertices + offsets * self.calculate_normals(vertices)
 
     def calculate_normal(self, vertex: tuple) -> tuple:
         """
@@ -191,3 +301,30 @@ class HemisphericalCylinderTransformation:
                 if norm != 0
                 else (0, 0, 0)
             )
+
+    def calculate_normals(self, vertices: VertexArray) -> VertexArray:
+        """
+        Calculate the normal vectors for an (N, 3) array of vertices.
+
+        This is the vectorized form of calculate_normal: the cylindrical and
+        hemispherical regions are selected with a mask instead of a branch,
+        and vertices with a zero-length vector get a (0, 0, 0) normal. The
+        lengths are not computed the way np.linalg.norm computes them for
+        one vertex, so the normals may differ from calculate_normal by a
+        unit or two in the last place.
+
+        Args:
+            vertices (VertexArray): The vertex coordinates.
+
+        Returns:
+            VertexArray: The (N, 3) array of normal vectors.
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        vectors = vertices.copy()
+        in_hemisphere = vertices[:, 2] > self.cylinder_height
+        vectors[:, 2] = np.where(
+            in_hemisphere, vertices[:, 2] - self.cylinder_height, 0
+        )
+        x, y, z = vectors[:, 0], vectors[:, 1], vectors[:, 2]
+        norms = np.sqrt(x * x + y * y + z * z)[:, np.newaxis]
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
@@ -0,0 +1,17 @@
+"""Vector helpers shared by the normal calculators."""
+
+import numpy as np
+
+
+def unit_vectors(vectors: np.ndarray) -> np.ndarray:
+    """
+    Normalize the rows of an array of vectors.
+
+    Args:
+        vectors (np.ndarray): The (N, 3) vectors.
+
+    Returns:
+        np.ndarray: The (N, 3) unit vectors, with zero rows left at zero.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
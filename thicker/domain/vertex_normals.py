@@ -0,0 +1,137 @@
+"""Vertex normals from the faces of a mesh.
+
+The analytic normal calculators assume a sphere, a cylinder or a dome. These
+follow the actual surface instead: each vertex normal is the sum of the
+normals of the faces around it, weighted by face area, then normalized.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from thicker.domain.mesh import (
+    FaceArray,
+    FaceData,
+    VertexArray,
+    VertexData,
+    as_face_array,
+    as_vertex_array,
+)
+from thicker.domain.transformations import topological
+from thicker.domain.vectors import unit_vectors
+from thicker.domain.welding import weld_map
+
+
+def calculate_face_normals(vertices: VertexData, faces: FaceData) -> VertexArray:
+    """
+    Calculate area-weighted face normals with one batched cross product.
+
+    Args:
+        vertices (VertexData): The (N, 3) vertex coordinates.
+        faces (FaceData): The (M, 3) vertex indices.
+
+    Returns:
+        VertexArray: An (M, 3) array of face normals, following the
+            right-hand rule, with lengths of twice the face areas.
+    """
+    vertices = np.asarray(as_vertex_array(vertices), dtype=np.float64)
+    corners = vertices[as_face_array(faces)]
+    return np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+
+
+def calculate_corner_angles(vertices: VertexData, faces: FaceData) -> np.ndarray:
+    """
+    Calculate the interior angle at every corner of every face.
+
+    Args:
+        vertices (VertexData): The (N, 3) vertex coordinates.
+        faces (FaceData): The (M, 3) vertex indices.
+
+    Returns:
+        np.ndarray: An (M, 3) array of angles in radians, 0 at the corners
+            of degenerate faces.
+    """
+    vertices = np.asarray(as_vertex_array(vertices), dtype=np.float64)
+    corners = vertices[as_face_array(faces)]
+    to_next = unit_vectors((np.roll(corners, -1, axis=1) - corners).reshape(-1, 3))
+    to_previous = unit_vectors((np.roll(corners, 1, axis=1) - corners).reshape(-1, 3))
+    cosines = np.einsum("ij,ij->i", to_next, to_previous)
+    angles = np.arccos(np.clip(cosines, -1.0, 1.0))
+    degenerate = ~(to_next.any(axis=1) & to_previous.any(axis=1))
+    return np.where(degenerate, 0.0, angles).reshape(-1, 3)
+
+
+def calculate_vertex_normals(
+    vertices: VertexData,
+    faces: FaceData,
+    weld_tolerance: Optional[float] = 0.0,
+    angle_weighted: bool = False,
+) -> VertexArray:
+    """
+    Calculate unit vertex normals as area-weighted sums of face normals.
+
+    With angle_weighted, each face's unit normal is weighted by its interior
+    angle at the vertex instead, so a few large faces, such as a fan-shaped
+    cap, do not drag the normals along its rim off the bisector of the edge.
+
+    STL corners are stored once per triangle, so by default coincident
+    vertices are welded first and share one normal; otherwise every corner of
+    an unwelded mesh would get only its own triangle's normal. The face
+    normals are accumulated per vertex with np.bincount, in time linear in
+    the number of faces.
+
+    Args:
+        vertices (VertexData): The (N, 3) vertex coordinates.
+        faces (FaceData): The (M, 3) vertex indices.
+        weld_tolerance (Optional[float]): The grid cell size for sharing
+            normals between nearby vertices, or None to use the faces as
+            they are.
+        angle_weighted (bool): Weight the faces by their corner angles
+            rather than their areas.
+
+    Returns:
+        VertexArray: An (N, 3) array of unit normals, (0, 0, 0) for vertices
+            without faces or whose faces cancel out.
+    """
+    vertices = np.asarray(as_vertex_array(vertices), dtype=np.float64)
+    faces = as_face_array(faces)
+    face_normals = calculate_face_normals(vertices, faces)
+
+    if weld_tolerance is None:
+        welded_index = np.arange(len(vertices))
+        num_welded = len(vertices)
+    else:
+        first_copies, welded_index = weld_map(vertices, weld_tolerance)
+        num_welded = len(first_copies)
+
+    # Add each face normal to its three corners, one axis at a time
+    corners = welded_index[faces].ravel()
+    if angle_weighted:
+        angles = calculate_corner_angles(vertices, faces)
+        corner_normals = unit_vectors(face_normals)[:, None, :] * angles[:, :, None]
+    else:
+        corner_normals = np.repeat(face_normals[:, None, :], 3, axis=1)
+    corner_normals = corner_normals.reshape(-1, 3)
+    vertex_normals = np.empty((num_welded, 3))
+    for axis in range(3):
+        vertex_normals[:, axis] = np.bincount(
+            corners, weights=corner_normals[:, axis], minlength=num_welded
+        )
+    return unit_vectors(vertex_normals)[welded_index]
+
+
+@topological
+def calculate_area_weighted_normals(
+    vertices: VertexArray, faces: FaceArray
+) -> VertexArray:
+    """
+    Calculate surface normals for thicken_mesh, welding exact duplicates.
+
+    Args:
+        vertices (VertexArray): The (N, 3) vertex coordinates.
+        faces (FaceArray): The (M, 3) vertex indices.
+
+    Returns:
+        VertexArray: An (N, 3) array of unit normals.
+    """
+    return calculate_vertex_normals(vertices, faces)
@@ -0,0 +1,188 @@
+"""Wall thickness of a closed mesh, measured by casting rays.
+
+The thickness at a vertex is the distance along the inward vertex normal,
+weighted by corner angles so that it bisects sharp edges, to
+where the ray leaves the solid through the opposite wall. Only the back of a
+triangle counts as an exit, so the faces around the vertex itself are never
+hit, whichever way they lean.
+
+Rays are cast in batches. Each batch searches within a radius that grows
+fourfold until every ray has hit a wall, so a ray through a thin wall only
+visits the boxes near its vertex, however large the mesh.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
+
+from thicker.domain.mesh import Mesh
+from thicker.domain.ray_casting import BoundingVolumeHierarchy
+from thicker.domain.vertex_normals import calculate_vertex_normals
+from thicker.domain.welding import weld_map
+
+DEFAULT_BATCH_SIZE = 8192
+# Hits nearer than this fraction of the mesh size are taken as the ray
+# grazing the faces at its own vertex
+_SELF_HIT_TOLERANCE = 1e-6
+# The first search radius, in mean edge lengths, and the factor it grows by
+# between rounds
+_START_RADIUS_EDGES = 8.0
+_RADIUS_GROWTH = 4.0
+
+
+def cast_inward_rays(
+    hierarchy: BoundingVolumeHierarchy,
+    origins: np.ndarray,
+    directions: np.ndarray,
+    start_radius: float,
+    max_distance: float,
+    min_distance: float,
+) -> np.ndarray:
+    """
+    Find how far each ray travels before leaving the solid.
+
+    Args:
+        hierarchy (BoundingVolumeHierarchy): The mesh's triangles.
+        origins (np.ndarray): The (R, 3) ray origins.
+        directions (np.ndarray): The (R, 3) unit ray directions.
+        start_radius (float): The radius of the first search.
+        max_distance (float): The longest distance searched.
+        min_distance (float): Hits nearer than this are ignored.
+
+    Returns:
+        np.ndarray: The R distances, inf where no exit is within reach.
+    """
+    distances = np.full(len(origins), np.inf)
+    pending = np.arange(len(origins))
+    near, radius = min_distance, start_radius
+    while len(pending):
+        far = min(radius, max_distance)
+        found, _ = hierarchy.intersect(
+            origins[pending], directions[pending], near, far, exits_only=True
+        )
+        distances[pending] = found
+        if far >= max_distance:
+            break
+        pending = pending[np.isinf(found)]
+        near, radius = far, radius * _RADIUS_GROWTH
+    return distances
+
+
+def measure_wall_thickness(
+    mesh: Mesh,
+    max_thickness: float = np.inf,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+) -> np.ndarray:
+    """
+    Measure the wall thickness at every vertex of a closed mesh.
+
+    Coincident vertices are welded first, so each position casts one ray.
+    The batches are independent and, with several workers, are cast on a
+    thread pool; NumPy releases the GIL inside the array operations.
+
+    Args:
+        mesh (Mesh): A closed mesh with outward-facing triangles.
+        max_thickness (float): Walls thicker than this are not measured.
+        batch_size (int): The number of rays cast together.
+        workers (int): The number of threads casting batches.
+
+    Returns:
+        np.ndarray: The thickness at every vertex, inf where the wall is
+            thicker than max_thickness or the ray escapes through a hole,
+            and NaN where the vertex has no normal.
+
+    Raises:
+        ValueError: If batch_size or workers is less than one.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least one.")
+    if workers < 1:
+        raise ValueError("Number of workers must be at least one.")
+    vertices = np.asarray(mesh.vertex_array, dtype=np.float64)
+    faces = mesh.face_array
+    first_copies, welded_index = weld_map(vertices, 0.0)
+    origins = vertices[first_copies]
+    normals = calculate_vertex_normals(vertices, faces, angle_weighted=True)
+    directions = -normals[first_copies]
+
+    hierarchy = BoundingVolumeHierarchy(vertices, faces)
+    lower, upper = hierarchy.bounds
+    size = float(np.linalg.norm(upper - lower))
+    corners = vertices[faces]
+    edge_lengths = np.linalg.norm(corners[:, 1] - corners[:, 0], axis=1)
+    start_radius = _START_RADIUS_EDGES * float(edge_lengths.mean())
+    # Every exit lies within the mesh's bounding box
+    max_distance = min(max_thickness, size)
+
+    def cast(start: int) -> np.ndarray:
+        batch = slice(start, start + batch_size)
+        return cast_inward_rays(
+            hierarchy,
+            origins[batch],
+            directions[batch],
+            start_radius,
+            max_distance,
+            _SELF_HIT_TOLERANCE * size,
+        )
+
+    starts = range(0, len(origins), batch_size)
+    if workers == 1:
+        batches = list(map(cast, starts))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batches = list(executor.map(cast, starts))
+    thickness = np.concatenate(batches)
+    thickness[~directions.any(axis=1)] = np.nan
+    return thickness[welded_index]
+
+
+def thin_regions(mesh: Mesh, thickness: np.ndarray, minimum: float) -> List[np.ndarray]:
+    """
+    Group the vertices thinner than a minimum into connected regions.
+
+    Two thin vertices are connected when they share a triangle edge, either
+    directly or through coincident copies. Regions are labelled by repeated
+    min-label propagation over the edges with pointer jumping, which takes
+    a number of rounds logarithmic in the region size for typical meshes.
+
+    Args:
+        mesh (Mesh): The measured mesh.
+        thickness (np.ndarray): The thickness at every vertex.
+        minimum (float): The thinnest printable wall.
+
+    Returns:
+        List[np.ndarray]: The vertex indices of every region, in order of
+            each region's first vertex.
+    """
+    thin = np.asarray(thickness) < minimum
+    if not thin.any():
+        return []
+    _, welded_index = weld_map(np.asarray(mesh.vertex_array, dtype=np.float64), 0.0)
+
+    # The edges between thin vertices, in welded numbering
+    faces = mesh.face_array
+    starts = faces.ravel()
+    ends = faces[:, [1, 2, 0]].ravel()
+    both_thin = thin[starts] & thin[ends]
+    a = welded_index[starts[both_thin]]
+    b = welded_index[ends[both_thin]]
+
+    labels = np.arange(welded_index.max() + 1)
+    while True:
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[a], labels[b])
+        np.minimum.at(hooked, labels[b], labels[a])
+        while not np.array_equal(hooked, hooked[hooked]):
+            hooked = hooked[hooked]
+        if np.array_equal(hooked, labels):
+            break
+        labels = hooked
+
+    members = np.flatnonzero(thin)
+    region = labels[welded_index[members]]
+    order = np.argsort(region, kind="stable")
+    boundaries = np.flatnonzero(np.diff(region[order])) + 1
+    regions = np.split(members[order], boundaries)
+    return sorted(regions, key=lambda vertices: int(vertices[0]))
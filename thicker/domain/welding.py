@@ -0,0 +1,92 @@
+"""Weld coincident vertices into an indexed mesh."""
+
+from typing import Tuple
+
+import numpy as np
+
+from thicker.domain.mesh import (
+    FaceArray,
+    FaceData,
+    VertexArray,
+    VertexData,
+    as_face_array,
+    as_vertex_array,
+)
+
+
+def weld_map(
+    vertices: VertexArray, tolerance: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find which vertices coincide, without building the welded mesh.
+
+    Vertices are snapped to a grid of cell size `tolerance` and merged when
+    they land in the same cell; with a tolerance of 0 only exact duplicates
+    are merged. Two vertices closer than the tolerance may still sit either
+    side of a cell boundary and stay separate.
+
+    Args:
+        vertices (VertexArray): The (N, 3) vertex coordinates.
+        tolerance (float): The grid cell size for merging vertices.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The index of the first copy of each
+            welded vertex, in order of first use, and the welded index of
+            every original vertex.
+
+    Raises:
+        ValueError: If the tolerance is negative.
+    """
+    if tolerance < 0:
+        raise ValueError("Weld tolerance must be non-negative.")
+    if len(vertices) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    keys = vertices if tolerance == 0 else np.floor(vertices / tolerance + 0.5)
+    # Sort the rows by key with a stable lexsort, which is much faster than
+    # np.unique(axis=0), and start a group wherever the key changes
+    order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0]))
+    sorted_keys = keys[order]
+    group_starts = np.empty(len(order), dtype=bool)
+    group_starts[0] = True
+    np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=group_starts[1:])
+    first_index = order[group_starts]
+    group = np.empty_like(order)
+    group[order] = np.cumsum(group_starts) - 1
+
+    # Renumber the groups in order of first appearance
+    by_appearance = np.argsort(first_index)
+    rank = np.empty_like(by_appearance)
+    rank[by_appearance] = np.arange(len(by_appearance))
+    return first_index[by_appearance], rank[group]
+
+
+def weld_vertices(
+    vertices: VertexData, faces: FaceData, tolerance: float = 0.0
+) -> Tuple[VertexArray, FaceArray]:
+    """
+    Merge duplicate vertices and remap the faces onto the merged buffer.
+
+    STL files store every triangle corner separately, so a vertex shared by
+    six triangles appears six times. Welding keeps one copy of each, which
+    lets transformations move every shared corner by the same amount.
+    Vertices are merged as described in weld_map.
+
+    Args:
+        vertices (VertexData): The (N, 3) vertex coordinates.
+        faces (FaceData): The (M, 3) vertex indices.
+        tolerance (float): The grid cell size for merging vertices.
+
+    Returns:
+        Tuple[VertexArray, FaceArray]: The welded vertices, in order of first
+            use and keeping their original coordinates, and the remapped faces.
+
+    Raises:
+        ValueError: If the tolerance is negative.
+    """
+    vertices = as_vertex_array(vertices)
+    faces = as_face_array(faces)
+    first_copies, welded_index = weld_map(vertices, tolerance)
+    if len(vertices) == 0:
+        return vertices, faces
+    return vertices[first_copies], welded_index[faces]
@@ -1,13 +1,21 @@
 """Interface for concrete MeshReaders."""
 
-from typing import List, Protocol, Tuple
+from typing import Iterator, Protocol, Tuple
+
+from thicker.domain.mesh import FaceArray, VertexArray
 
 
 class MeshReader(Protocol):
     """Protocol for reading mesh data."""
 
-    def read(
-        self, filepath: str
-    ) -> Tuple[List[Tuple[float, float, float]], List[Tuple[int, int, int]]]:
-        """Reads a mesh file and returns vertices and faces."""
+    def read(self, filepath: str) -> Tuple[VertexArray, FaceArray]:
+        """Reads a mesh file and returns (N, 3) vertices and (M, 3) faces."""
+        ...
+
+
+class MeshChunkReader(Protocol):
+    """Protocol for streaming mesh data in bounded chunks."""
+
+    def read_chunks(self, filepath: str, chunk_size: int) -> Iterator[VertexArray]:
+        """Yields (3 * K, 3) triangle soups of up to chunk_size triangles."""
         ...
@@ -1,6 +1,8 @@
 """Interface for concrete MeshWriters."""
 
-from typing import List, Protocol, Tuple
+from typing import Iterable, Protocol
+
+from thicker.domain.mesh import FaceData, VertexArray, VertexData
 
 
 class MeshWriter(Protocol):
@@ -9,8 +11,16 @@ class MeshWriter(Protocol):
     def write(
         self,
         filepath: str,
-        vertices: List[Tuple[float, float, float]],
-        faces: List[Tuple[int, int, int]],
+        vertices: VertexData,
+        faces: FaceData,
     ) -> None:
-        """Writes vertices and faces to a file."""
+        """Writes vertices and faces, as arrays or lists of tuples, to a file."""
+        ...
+
+
+class MeshChunkWriter(Protocol):
+    """Protocol for writing mesh data as it is produced, chunk by chunk."""
+
+    def write_chunks(self, filepath: str, chunks: Iterable[VertexArray]) -> None:
+        """Writes (3 * K, 3) triangle soups to a file in the order given."""
         ...
@@ -0,0 +1,19 @@
+"""Interface for concrete ResultCaches."""
+
+from typing import Any, Dict, Protocol
+
+
+class ResultCache(Protocol):
+    """Protocol for caching output files by the inputs that produced them."""
+
+    def key(self, filepath: str, parameters: Dict[str, Any]) -> str:
+        """Returns a key for the contents of a file and the parameters."""
+        ...
+
+    def fetch(self, key: str, filepath: str) -> bool:
+        """Places the cached output at filepath; returns False on a miss."""
+        ...
+
+    def store(self, key: str, filepath: str) -> None:
+        """Adds the output file at filepath to the cache under the key."""
+        ...
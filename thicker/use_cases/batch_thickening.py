@@ -0,0 +1,149 @@
+"""Batch thickening use case.
+- It should take a list of input and output paths and an offset.
+- It should thicken every mesh, in parallel, and report each outcome.
+"""
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from thicker.interfaces.mesh_reader import MeshReader
+from thicker.interfaces.mesh_writer import MeshWriter
+from thicker.interfaces.result_cache import ResultCache
+from thicker.use_cases.cached_thickening import (
+    process_with_cache,
+    thickening_parameters,
+)
+from thicker.use_cases.thicken_mesh import process_thickening
+
+
+@dataclass(frozen=True)
+class ThickeningJob:
+    """One mesh to thicken."""
+
+    input_path: str
+    output_path: str
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """The outcome of one ThickeningJob."""
+
+    job: ThickeningJob
+    # None when the job succeeded
+    error: Optional[str] = None
+    # True when the output was taken from a ResultCache
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_job(
+    reader: MeshReader,
+    writer: MeshWriter,
+    job: ThickeningJob,
+    offset: float,
+    cache: Optional[ResultCache] = None,
+    cache_parameters: Optional[Dict[str, Any]] = None,
+) -> JobResult:
+    """
+    Thicken one mesh, turning any failure into a failed JobResult.
+
+    The job's progress messages are discarded, since jobs running side by
+    side would interleave them; the caller reports the JobResult instead.
+
+    Args:
+        reader (MeshReader): The reader for the input mesh.
+        writer (MeshWriter): The writer for the output mesh.
+        job (ThickeningJob): The input and output paths.
+        offset (float): The amount to thicken the mesh.
+        cache (Optional[ResultCache]): A cache of earlier outputs, if any.
+        cache_parameters (Optional[Dict[str, Any]]): The parameters in the
+            cache key; by default those of thickening_parameters(offset).
+
+    Returns:
+        JobResult: The outcome of the job.
+    """
+    thicken = partial(
+        process_thickening,
+        reader,
+        writer,
+        input_path=job.input_path,
+        output_path=job.output_path,
+        offset=offset,
+    )
+    try:
+        with redirect_stdout(io.StringIO()):
+            if cache is None:
+                thicken()
+                return JobResult(job)
+            if cache_parameters is None:
+                cache_parameters = thickening_parameters(offset)
+            cached = process_with_cache(
+                cache, job.input_path, job.output_path, cache_parameters, thicken
+            )
+            return JobResult(job, cached=cached)
+    except Exception as e:
+        return JobResult(job, error=str(e) or type(e).__name__)
+
+
+def process_thickening_batch(
+    reader: MeshReader,
+    writer: MeshWriter,
+    jobs: List[ThickeningJob],
+    offset: float,
+    max_workers: int = 1,
+    cache: Optional[ResultCache] = None,
+    cache_parameters: Optional[Dict[str, Any]] = None,
+) -> List[JobResult]:
+    """
+    Use case: Thicken many meshes, fanning the jobs out over processes.
+
+    A failing mesh is reported in its JobResult and does not stop the
+    other jobs. With one worker the jobs run in this process. The reader
+    and writer must be picklable to run in worker processes.
+
+    Args:
+        reader (MeshReader): The reader for the input meshes.
+        writer (MeshWriter): The writer for the output meshes.
+        jobs (List[ThickeningJob]): The meshes to thicken.
+        offset (float): The amount to thicken each mesh.
+        max_workers (int): The number of worker processes.
+        cache (Optional[ResultCache]): A cache of earlier outputs, shared by
+            the workers, if any.
+        cache_parameters (Optional[Dict[str, Any]]): The parameters in the
+            cache key, as for run_job.
+
+    Returns:
+        List[JobResult]: The outcome of every job, in the order given.
+
+    Raises:
+        ValueError: If max_workers is less than one.
+    """
+    if max_workers < 1:
+        raise ValueError("Number of jobs must be at least one.")
+    if max_workers == 1:
+        return [
+            run_job(reader, writer, job, offset, cache, cache_parameters)
+            for job in jobs
+        ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_job, reader, writer, job, offset, cache, cache_parameters
+            )
+            for job in jobs
+        ]
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:  # e.g. a worker process died
+                results.append(JobResult(job, error=str(e) or type(e).__name__))
+    return results
@@ -0,0 +1,82 @@
+"""Cached thickening use case.
+- It should take a cache, input and output paths and the job's parameters.
+- It should reuse the output of an identical earlier job instead of thickening.
+"""
+
+from functools import lru_cache
+from importlib import metadata
+from pathlib import PurePath
+from typing import Any, Callable, Dict, Optional
+
+from thicker.interfaces.result_cache import ResultCache
+from thicker.use_cases.constants import BASE_HEIGHT_PERCENTAGE
+
+PACKAGE_NAME = "thicker-stl"
+# The transformation applied by process_thickening
+TRANSFORMATION = "HemisphericalCylinderTransformation"
+
+
+@lru_cache(maxsize=1)
+def tool_version() -> str:
+    """Return the installed version of thicker-stl, part of every cache key."""
+    try:
+        return metadata.version(PACKAGE_NAME)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def thickening_parameters(
+    offset: float, weld_tolerance: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Collect everything besides the input bytes that decides the output.
+
+    Args:
+        offset (float): The amount to thicken the mesh.
+        weld_tolerance (Optional[float]): The reader's weld tolerance.
+
+    Returns:
+        Dict[str, Any]: The parameters to hash into the cache key.
+    """
+    return {
+        "offset": offset,
+        "weld_tolerance": weld_tolerance,
+        "transformation": TRANSFORMATION,
+        "base_height_fraction": BASE_HEIGHT_PERCENTAGE,
+        "version": tool_version(),
+    }
+
+
+def process_with_cache(
+    cache: ResultCache,
+    input_path: str,
+    output_path: str,
+    parameters: Dict[str, Any],
+    thicken: Callable[[], None],
+) -> bool:
+    """
+    Use case: Reuse a cached output, or thicken and cache the result.
+
+    The output's file extensions are part of the key, since they pick the
+    output format and compression.
+
+    Args:
+        cache (ResultCache): The cache of earlier outputs.
+        input_path (str): Path to the input mesh.
+        output_path (str): Path to the output mesh.
+        parameters (Dict[str, Any]): The parameters of the job, as from
+            thickening_parameters.
+        thicken (Callable[[], None]): Thickens input_path into output_path
+            on a miss.
+
+    Returns:
+        bool: True if the output came from the cache.
+    """
+    output_format = "".join(PurePath(output_path).suffixes).lower()
+    key = cache.key(input_path, {**parameters, "output_format": output_format})
+    if cache.fetch(key, output_path):
+        print(f"Using cached result for: {input_path}")
+        return True
+    thicken()
+    cache.store(key, output_path)
+    return False
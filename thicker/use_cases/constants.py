@@ -2,3 +2,6 @@
 
 # Heuristic value for base height as a fraction of mesh height
 BASE_HEIGHT_PERCENTAGE = 0.19
+
+# Triangles per chunk when streaming a mesh, about 3 MB of binary STL
+DEFAULT_CHUNK_SIZE = 65536
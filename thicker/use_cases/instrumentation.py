@@ -0,0 +1,115 @@
+"""Per-stage timing and memory instrumentation for the use cases.
+
+A StageRecorder wraps each stage of a use case, such as read, stats,
+transform and write, and records how long it took, how much memory it
+needed and how large the mesh was.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+
+@dataclass(frozen=True)
+class StageMetrics:
+    """What one stage of a use case cost."""
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    # Peak traced Python and NumPy allocations during the stage, or None
+    # when memory is not traced
+    peak_memory_bytes: Optional[int]
+    vertices: Optional[int]
+    faces: Optional[int]
+
+
+class StageCounts:
+    """The mesh size a stage reports while it runs."""
+
+    def __init__(self):
+        self.vertices: Optional[int] = None
+        self.faces: Optional[int] = None
+
+    def set(self, vertices: int, faces: int) -> None:
+        """
+        Record the number of vertices and faces the stage handled.
+
+        Args:
+            vertices (int): The number of vertices.
+            faces (int): The number of faces.
+        """
+        self.vertices = vertices
+        self.faces = faces
+
+
+class StageRecorder:
+    """Record StageMetrics for every stage run inside `stage`.
+
+    Memory is traced with tracemalloc, which slows allocation-heavy code
+    down, so it can be turned off. Tracing starts with the first stage and
+    stops when the recorder is closed, unless it was already running."""
+
+    def __init__(
+        self,
+        trace_memory: bool = True,
+        on_stage: Optional[Callable[[StageMetrics], None]] = None,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            trace_memory (bool): Whether to record peak memory.
+            on_stage (Optional[Callable[[StageMetrics], None]]): Called with
+                the metrics of each stage as it finishes.
+        """
+        self.trace_memory = trace_memory
+        self.on_stage = on_stage
+        self.records: List[StageMetrics] = []
+        self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageCounts]:
+        """
+        Measure the stage run inside the with block.
+
+        Args:
+            name (str): The name of the stage.
+
+        Yields:
+            StageCounts: Set the mesh size handled by the stage on it.
+        """
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        counts = StageCounts()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        yield counts
+
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        peak_memory = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        metrics = StageMetrics(
+            name, wall_seconds, cpu_seconds, peak_memory, counts.vertices, counts.faces
+        )
+        self.records.append(metrics)
+        if self.on_stage is not None:
+            self.on_stage(metrics)
+
+    def close(self) -> None:
+        """Stop tracing memory if this recorder started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "StageRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,103 @@
+"""Streaming shape thickening use case.
+- It should take in input and output paths, an offset and a chunk size.
+- It should thicken the mesh chunk by chunk, in memory bounded by the chunk size.
+"""
+
+from typing import Iterator, Optional
+
+from thicker.domain.mesh import MeshStats, VertexArray, calculate_chunked_stats
+from thicker.domain.parallel_transform import ParallelTransformer
+from thicker.domain.transformations import HemisphericalCylinderTransformation
+from thicker.interfaces.mesh_reader import MeshChunkReader
+from thicker.interfaces.mesh_writer import MeshChunkWriter
+from thicker.use_cases.constants import BASE_HEIGHT_PERCENTAGE, DEFAULT_CHUNK_SIZE
+from thicker.use_cases.instrumentation import StageRecorder
+
+
+def calculate_streamed_mesh_stats(
+    reader: MeshChunkReader, input_path: str, chunk_size: int
+) -> MeshStats:
+    """
+    Calculate the dimensions of a mesh by streaming it, without transforming.
+
+    Args:
+        reader (MeshChunkReader): The reader for the input mesh.
+        input_path (str): Path to the input mesh.
+        chunk_size (int): The number of triangles per chunk.
+
+    Returns:
+        MeshStats: The bounding box, height, base height (using
+            BASE_HEIGHT_PERCENTAGE) and radius above the base.
+
+    Raises:
+        ValueError: If the mesh has no vertices.
+    """
+    return calculate_chunked_stats(
+        lambda: reader.read_chunks(input_path, chunk_size), BASE_HEIGHT_PERCENTAGE
+    )
+
+
+def process_thickening_streaming(
+    reader: MeshChunkReader,
+    writer: MeshChunkWriter,
+    input_path: str,
+    output_path: str,
+    offset: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    metrics: Optional[StageRecorder] = None,
+    workers: int = 1,
+) -> None:
+    """
+    Use case: Thicken a mesh too large to load, chunk by chunk.
+
+    A first read-only pass gathers the height and radius that the
+    transformation needs. A second pass transforms each chunk and appends it
+    to the output, so memory use is bounded by the chunk size. The result is
+    the same as process_thickening without welding. With several workers
+    each chunk is split again over that many processes.
+
+    Args:
+        reader (MeshChunkReader): The reader for the input mesh.
+        writer (MeshChunkWriter): The writer for the output mesh.
+        input_path (str): Path to the input mesh.
+        output_path (str): Path to the output mesh.
+        offset (float): The amount to thicken the mesh.
+        chunk_size (int): The number of triangles per chunk.
+        metrics (Optional[StageRecorder]): Records the stats stage and the
+            fused read, transform and write "thicken" stage, if given.
+        workers (int): The number of processes transforming the vertices.
+
+    Raises:
+        ValueError: If the mesh has no vertices above the base height, or
+            workers is less than one.
+    """
+    parallel = ParallelTransformer(workers)
+    if metrics is None:
+        metrics = StageRecorder(trace_memory=False)
+    # Use case: calculate mesh dimensions in a read-only pass
+    with metrics.stage("stats"):
+        stats = calculate_streamed_mesh_stats(reader, input_path, chunk_size)
+    print(f"Mesh height: {stats.height}")
+    if stats.radius is None:
+        raise ValueError("No vertices found above the base height.")
+    print(f"Mesh radius: {stats.radius}")
+    cylinder_height = stats.height - stats.radius
+    print(f"Cylinder height: {cylinder_height}")
+    # Domain: setup transformation
+    transformation = HemisphericalCylinderTransformation(cylinder_height, stats.radius)
+
+    # Domain logic: Perform thickening as the chunks are written
+    num_vertices = 0
+
+    def thickened_chunks() -> Iterator[VertexArray]:
+        nonlocal num_vertices
+        for chunk in reader.read_chunks(input_path, chunk_size):
+            num_vertices += len(chunk)
+            yield parallel.transform_vertices(
+                transformation.transform_vertices, chunk, offset
+            )
+
+    # One pool of workers serves every chunk
+    with metrics.stage("thicken") as counts, parallel:
+        writer.write_chunks(output_path, thickened_chunks())
+        counts.set(num_vertices, num_vertices // 3)
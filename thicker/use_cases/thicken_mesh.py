@@ -3,7 +3,11 @@
 - It should return a new, thickened Mesh instance.
 """
 
-from thicker.domain.mesh import Mesh
+from typing import Optional
+
+from thicker.domain.mesh import Mesh, MeshStats
+from thicker.domain.parallel_transform import ParallelTransformer
+from thicker.domain.pipeline import HemisphericalCylinderStage, Pipeline
 from thicker.domain.transformations import (
     HemisphericalCylinderTransformation,
     calculate_cylindrical_normal,
@@ -13,6 +17,7 @@ from thicker.domain.transformations import (
 from thicker.interfaces.mesh_reader import MeshReader
 from thicker.interfaces.mesh_writer import MeshWriter
 from thicker.use_cases.constants import BASE_HEIGHT_PERCENTAGE
+from thicker.use_cases.instrumentation import StageRecorder
 
 
 def thicken_a_mesh(original_mesh: Mesh, offset: float) -> Mesh:
@@ -47,7 +52,27 @@ def process_thickening_ori(
     thickened_mesh = thicken_mesh(mesh, offset, calculate_cylindrical_normal)
 
     # Write the thickened mesh
-    writer.write(output_path, thickened_mesh.vertices, thickened_mesh.faces)
+    writer.write(output_path, thickened_mesh.vertex_array, thickened_mesh.face_array)
+
+
+def calculate_mesh_stats(mesh: Mesh) -> MeshStats:
+    """
+    Calculate the dimensions of a mesh in one vectorized pass.
+
+    The result is cached on the mesh, so the height and radius helpers and
+    process_thickening share a single computation.
+
+    Args:
+        mesh: A Mesh object containing vertices and faces.
+
+    Returns:
+        MeshStats: The bounding box, height, base height (using
+            BASE_HEIGHT_PERCENTAGE) and radius above the base.
+
+    Raises:
+        ValueError: If the mesh has no vertices.
+    """
+    return mesh.stats(BASE_HEIGHT_PERCENTAGE)
 
 
 def calculate_mesh_height(mesh: Mesh) -> float:
@@ -61,13 +86,7 @@ def calculate_mesh_height(mesh: Mesh) -> float:
         float: The height of the mesh, defined as the difference between the
                maximum and minimum z-coordinate values.
     """
-    if not mesh.vertices:
-        raise ValueError("Mesh contains no vertices.")
-
-    # Extract the z-coordinates from the vertices
-    z_coordinates = [vertex[2] for vertex in mesh.vertices]
-
-    return max(z_coordinates) - min(z_coordinates)
+    return calculate_mesh_stats(mesh).height
 
 
 def calculate_mesh_radius(mesh: Mesh) -> float:
@@ -84,22 +103,10 @@ def calculate_mesh_radius(mesh: Mesh) -> float:
     Raises:
         ValueError: If the mesh has no vertices above the base height.
     """
-    if not mesh.vertices:
-        raise ValueError("Mesh contains no vertices.")
-
-    base_height = BASE_HEIGHT_PERCENTAGE * calculate_mesh_height(mesh)
-
-    # Filter vertices above the base height
-    vertices_above_base = [(x, y) for x, y, z in mesh.vertices if z > base_height]
-
-    if not vertices_above_base:
+    radius = calculate_mesh_stats(mesh).radius
+    if radius is None:
         raise ValueError("No vertices found above the base height.")
-
-    # Compute squared distances from the z-axis for each vertex
-    squared_distances = [x**2 + y**2 for x, y in vertices_above_base]
-
-    # Return the square root of the maximum squared distance as the radius
-    return max(squared_distances) ** 0.5
+    return radius
 
 
 def process_thickening(
@@ -108,27 +115,52 @@ def process_thickening(
     input_path: str,
     output_path: str,
     offset: float,
+    metrics: Optional[StageRecorder] = None,
+    workers: int = 1,
 ) -> None:
     """
     Use case: Read a mesh, apply thickening, and save it.
     As called by the CLI connector.
+
+    The read, stats, transform and write stages are recorded in `metrics`,
+    if given. With several workers the vertices are transformed in chunks
+    over that many processes, with the same result.
+
+    Raises:
+        ValueError: If workers is less than one.
     """
+    parallel = ParallelTransformer(workers)
+    if metrics is None:
+        metrics = StageRecorder(trace_memory=False)
     # Read the input mesh
-    vertices, faces = reader.read(input_path)
-    # Domain: create the mesh
-    mesh = Mesh(vertices=vertices, faces=faces)
+    with metrics.stage("read") as counts:
+        vertices, faces = reader.read(input_path)
+        # Domain: create the mesh
+        mesh = Mesh(vertices=vertices, faces=faces)
+        counts.set(len(mesh.vertex_array), len(mesh.face_array))
     # Use case: calculate mesh dimensions
-    mesh_height = calculate_mesh_height(mesh)
-    print(f"Mesh height: {mesh_height}")
-    mesh_radius = calculate_mesh_radius(mesh)
-    print(f"Mesh radius: {mesh_radius}")
-    cylinder_height = mesh_height - mesh_radius
-    print(f"Cylinder height: {cylinder_height}")
+    with metrics.stage("stats") as counts:
+        mesh_height = calculate_mesh_stats(mesh).height
+        print(f"Mesh height: {mesh_height}")
+        mesh_radius = calculate_mesh_radius(mesh)
+        print(f"Mesh radius: {mesh_radius}")
+        cylinder_height = mesh_height - mesh_radius
+        print(f"Cylinder height: {cylinder_height}")
+        counts.set(len(mesh.vertex_array), len(mesh.face_array))
     # Domain: setup transformation
     transformation = HemisphericalCylinderTransformation(cylinder_height, mesh_radius)
-    # Domain logic: Perform thickening
-
-    thickened_mesh = transformation.transform(mesh, offset)
+    # Domain logic: Perform thickening, copying the mesh read only once
+    with metrics.stage("transform") as counts:
+        if workers == 1:
+            pipeline = Pipeline([HemisphericalCylinderStage(transformation, offset)])
+            thickened_mesh = pipeline.run(mesh)
+        else:
+            thickened_mesh = parallel.transform(transformation, mesh, offset)
+        counts.set(len(thickened_mesh.vertex_array), len(thickened_mesh.face_array))
 
     # Write the thickened mesh
-    writer.write(output_path, thickened_mesh.vertices, thickened_mesh.faces)
+    with metrics.stage("write") as counts:
+        writer.write(
+            output_path, thickened_mesh.vertex_array, thickened_mesh.face_array
+        )
+        counts.set(len(thickened_mesh.vertex_array), len(thickened_mesh.face_array))